@@ -0,0 +1 @@
+"""מדידת ביצועי הממיר על מצגות סינתטיות"""
@@ -0,0 +1,9 @@
+import logging
+import sys
+
+from .run import main
+
+# שגיאות המרה של צורות בודדות אינן רלוונטיות למדידה
+logging.disable(logging.ERROR)
+
+sys.exit(main())
@@ -0,0 +1,92 @@
+"""יצירת מצגות סינתטיות לפי פרמטרים, לצורך מדידת ביצועים"""
+import random
+from io import BytesIO
+from pathlib import Path
+
+from PIL import Image
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.util import Emu, Inches, Pt
+
+FONTS = ['Arial', 'Calibri', 'David', 'Segoe UI']
+SIZES = [12, 14, 18, 24, 32]
+COLORS = [RGBColor(0x33, 0x33, 0x33), RGBColor(0xC0, 0x00, 0x00), RGBColor(0x1F, 0x4E, 0x79)]
+
+
+def deck_name(slides, runs, table, images, image_size):
+    """שם קובץ ייחודי לכל שילוב פרמטרים"""
+    rows, cols = table or (0, 0)
+    width, height = image_size
+    return f"deck_s{slides}_r{runs}_t{rows}x{cols}_i{images}_{width}x{height}.pptx"
+
+
+def make_image(width, height, seed):
+    """תמונת JPEG בגודל נתון - מעבר צבעים עם רעש, כמו צילום"""
+    rng = random.Random(seed)
+    base = Image.linear_gradient('L').resize((width, height)).convert('RGB')
+    noise = Image.effect_noise((width, height), 40).convert('RGB')
+    tint = Image.new('RGB', (width, height), tuple(rng.randrange(256) for _ in range(3)))
+    image = Image.blend(Image.blend(base, noise, 0.3), tint, 0.4)
+    out = BytesIO()
+    image.save(out, 'JPEG', quality=90)
+    out.seek(0)
+    return out
+
+
+def generate_deck(path, slides=10, runs=10, table=None, images=0, image_size=(640, 480), seed=0):
+    """
+    יוצר מצגת סינתטית
+
+    Args:
+        path (str): נתיב לשמירת המצגת
+        slides (int): מספר השקופיות
+        runs (int): מספר קטעי טקסט (runs) בכל שקופית, בסגנונות מתחלפים
+        table (tuple, optional): (שורות, עמודות) - טבלה אחת בכל שקופית
+        images (int): מספר התמונות בכל שקופית
+        image_size (tuple): (רוחב, גובה) של כל תמונה בפיקסלים
+        seed (int): זרע אקראיות, לקבלת מצגת זהה בכל הרצה
+    """
+    rng = random.Random(seed)
+    presentation = Presentation()
+    layout = presentation.slide_layouts[6]  # שקופית ריקה
+
+    # תמונה אחת משותפת (כמו לוגו) ושאר התמונות ייחודיות לכל שקופית
+    shared_image = make_image(*image_size, seed=seed).getvalue() if images else None
+
+    for slide_index in range(slides):
+        slide = presentation.slides.add_slide(layout)
+
+        if runs:
+            box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(2))
+            frame = box.text_frame
+            frame.word_wrap = True
+            paragraph = frame.paragraphs[0]
+            for run_index in range(runs):
+                if run_index and run_index % 5 == 0:
+                    paragraph = frame.add_paragraph()
+                run = paragraph.add_run()
+                run.text = f"טקסט {slide_index}.{run_index} "
+                run.font.name = rng.choice(FONTS)
+                run.font.size = Pt(rng.choice(SIZES))
+                run.font.color.rgb = rng.choice(COLORS)
+                run.font.bold = run_index % 3 == 0
+
+        if table:
+            rows, cols = table
+            shape = slide.shapes.add_table(rows, cols, Inches(0.5), Inches(2.5), Inches(9), Inches(4))
+            for r in range(rows):
+                for c in range(cols):
+                    shape.table.cell(r, c).text = f"{r}:{c}"
+
+        for image_index in range(images):
+            if image_index == 0:
+                stream = BytesIO(shared_image)
+            else:
+                stream = make_image(*image_size, seed=seed + slide_index * 1000 + image_index)
+            left = Inches(0.5 + (image_index % 4) * 2.3)
+            top = Inches(5 + (image_index // 4) * 0.5)
+            slide.shapes.add_picture(stream, left, top, width=Inches(2), height=Emu(Inches(2) * image_size[1] // image_size[0]))
+
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    presentation.save(str(path))
+    return str(path)
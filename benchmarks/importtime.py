@@ -0,0 +1,93 @@
+"""
+בדיקת תקציב זמן הייבוא של מודולי החבילה, בעזרת python -X importtime.
+
+    python -m benchmarks.importtime
+    python -m benchmarks.importtime --repeat 10 --scale 2
+
+כל מודול מיובא בתהליך פייתון חדש (כמו תהליך עבודה קצר), כמה פעמים, והזמן
+המצטבר המינימלי מושווה לתקציב. בנוסף נבדק שהייבוא אינו טוען את הספריות
+הכבדות - אלה נטענות רק בשימוש הראשון. קוד היציאה הוא 1 אם אחת הבדיקות נכשלה.
+"""
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# תקציב בשניות לזמן הייבוא המצטבר של כל מודול
+BUDGETS = {
+    'core': 0.02,
+    'core.converter': 0.1,
+    'core.cli': 0.15,
+    'main': 0.15,
+}
+
+# ספריות שאסור שייטענו בזמן הייבוא
+HEAVY_MODULES = ['pptx', 'jinja2', 'PIL', 'lxml', 'flet', 'PyQt6', 'multiprocessing']
+
+
+def import_time(module):
+    """
+    מייבא מודול בתהליך חדש
+
+    Returns:
+        tuple: (זמן ייבוא מצטבר בשניות, רשימת הספריות הכבדות שנטענו)
+    """
+    code = (
+        f"import sys, {module}\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+
+    # שורות בפורמט: "import time: self [us] | cumulative | imported package"
+    cumulative = None
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = [field.strip() for field in line[len('import time:'):].split('|')]
+        if fields[2] == module:
+            cumulative = int(fields[1]) / 1e6
+    loaded = [m for m in result.stdout.strip().split(',') if m]
+    return cumulative, loaded
+
+
+def check(module, budget, repeat):
+    """בודק מודול אחד; מחזיר True אם עמד בתקציב ולא טען ספריות כבדות"""
+    # הייבוא הראשון מהדר קבצי pyc - לא נמדד
+    import_time(module)
+    runs = [import_time(module) for _ in range(repeat)]
+    seconds = min(cumulative for cumulative, _ in runs)
+    loaded = runs[0][1]
+
+    ok = seconds <= budget and not loaded
+    status = 'OK' if ok else 'FAIL'
+    print(f"{status:4}  {module:16} {seconds * 1000:7.1f}ms  (תקציב {budget * 1000:.0f}ms)"
+          + (f"  נטענו: {', '.join(loaded)}" if loaded else ''))
+    return ok
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.importtime',
+        description='בדיקת תקציב זמן הייבוא של החבילה',
+    )
+    parser.add_argument('modules', nargs='*', help='מודולים לבדיקה (ברירת מחדל: כולם)')
+    parser.add_argument('--repeat', type=int, default=5, help='מספר המדידות לכל מודול')
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='מכפיל לתקציב - למכונות איטיות')
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    modules = args.modules or list(BUDGETS)
+    results = [check(module, BUDGETS.get(module, 0.1) * args.scale, args.repeat) for module in modules]
+    return 0 if all(results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
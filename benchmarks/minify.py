@@ -0,0 +1,170 @@
+"""
+בדיקה שהקטנת הפלט (minify=True) אינה משנה את ה-DOM המוצג.
+
+    python -m benchmarks.minify
+    python -m benchmarks.minify talk.pptx decks/other.pptx
+
+כל מצגת מומרת עם ובלי הקטנה, ושני המסמכים מפורקים לרצף של תגיות, מאפיינים
+וטקסט בצורה מנורמלת: רצף רווחים בטקסט הוא רווח אחד, מאפייני style מפורקים
+להצהרות, ובלוקי CSS ו-JS מפורקים לאסימונים (ב-JS גם מעברי השורה נספרים). קוד
+היציאה הוא 1 אם נמצא הבדל כלשהו.
+"""
+import argparse
+import re
+import sys
+import tempfile
+from html.parser import HTMLParser
+from pathlib import Path
+
+from core.converter import PowerPointConverter
+
+from .decks import generate_deck
+from .parity import generate_text_deck
+
+_CSS_TOKENS = re.compile(r'''("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|(/\*.*?\*/)|(\s+)|([\w#.%-]+)|(.)''', re.S)
+_JS_TOKENS = re.compile(
+    r'''("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*'|`(?:\\.|[^`\\])*`)|(/\*.*?\*/|//[^\n]*)|(\s+)|([\w$.]+)|(.)''', re.S)
+
+
+def _tokens(pattern, code, newlines):
+    """
+    אסימוני הקוד ללא הערות ורווחים. כש-newlines=True רצף רווחים שכולל מעבר
+    שורה הוא אסימון בפני עצמו (אחד לכל רצף, גם אם יש בו הערות)
+    """
+    tokens = []
+    for string, comment, space, word, other in pattern.findall(code):
+        if comment:
+            continue
+        if space:
+            if newlines and '\n' in space and tokens and tokens[-1] != '\n':
+                tokens.append('\n')
+            continue
+        tokens.append(string or word or other)
+    if tokens and tokens[-1] == '\n':
+        tokens.pop()
+    return tokens
+
+
+def css_tokens(code):
+    """אסימוני CSS - נקודה-פסיק לפני סוגר מסולסל אינה משמעותית"""
+    tokens = _tokens(_CSS_TOKENS, code, newlines=False)
+    return [token for i, token in enumerate(tokens)
+            if not (token == ';' and i + 1 < len(tokens) and tokens[i + 1] == '}')]
+
+
+def js_tokens(code):
+    return _tokens(_JS_TOKENS, code, newlines=True)
+
+
+def style_declarations(value):
+    """מאפיין style כרשימת זוגות (מאפיין, ערך) עם רווחים מנורמלים"""
+    declarations = []
+    for declaration in value.split(';'):
+        name, _, value = declaration.partition(':')
+        name, value = ' '.join(name.split()), ' '.join(value.split())
+        if name or value:
+            declarations.append((name, value))
+    return declarations
+
+
+class DomNormalizer(HTMLParser):
+    """מפרק מסמך לרצף מנורמל של תגיות, מאפיינים וטקסט"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.items = []
+        self._text = []
+        self._raw = None
+
+    def _flush_text(self):
+        if not self._text:
+            return
+        text = ''.join(self._text)
+        self._text = []
+        if self._raw:
+            # בלוק ריק (או רווחים בלבד) שקול לבלוק בלי תוכן
+            tokens = css_tokens(text) if self._raw == 'style' else js_tokens(text)
+            if tokens:
+                self.items.append((self._raw, tokens))
+        else:
+            # רצף רווחים מוצג כרווח אחד - ההבדל בין '\n   ' ל-'\n' אינו משמעותי
+            self.items.append(('text', re.sub(r'\s+', ' ', text)))
+
+    def handle_starttag(self, tag, attrs):
+        self._flush_text()
+        attrs = [(name, style_declarations(value) if name == 'style' else value)
+                 for name, value in attrs]
+        self.items.append(('start', tag, attrs))
+        if tag in ('style', 'script'):
+            self._raw = tag
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        self._raw = None
+
+    def handle_endtag(self, tag):
+        self._flush_text()
+        self._raw = None
+        self.items.append(('end', tag))
+
+    def handle_data(self, data):
+        self._text.append(data)
+
+    def handle_decl(self, decl):
+        self._flush_text()
+        self.items.append(('decl', decl))
+
+    def close(self):
+        super().close()
+        self._flush_text()
+
+
+def normalize(html):
+    parser = DomNormalizer()
+    parser.feed(html)
+    parser.close()
+    return parser.items
+
+
+def check(pptx_path):
+    """ממיר מצגת עם ובלי הקטנה ומשווה את ה-DOM; מחזיר True אם זהים"""
+    original = PowerPointConverter().convert_to_bytes(pptx_path).decode('utf-8')
+    minified = PowerPointConverter(minify=True).convert_to_bytes(pptx_path).decode('utf-8')
+
+    a, b = normalize(original), normalize(minified)
+    same = a == b
+    saved = 1 - len(minified.encode('utf-8')) / len(original.encode('utf-8'))
+    print(f"{pptx_path}: {'OK' if same else 'DOM שונה'} "
+          f"({len(original):,} -> {len(minified):,} תווים, חיסכון {saved:.1%})")
+    if not same:
+        for index, (x, y) in enumerate(zip(a, b)):
+            if x != y:
+                print(f"  פריט {index}:\n    מקור:  {str(x)[:300]}\n    מוקטן: {str(y)[:300]}")
+                break
+        else:
+            print(f"  מספר פריטים שונה: {len(a)} / {len(b)}")
+    return same
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.minify',
+        description='בדיקה שהקטנת הפלט אינה משנה את ה-DOM',
+    )
+    parser.add_argument('inputs', nargs='*', help='מצגות לבדיקה (ברירת מחדל: מצגות סינתטיות)')
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    with tempfile.TemporaryDirectory(prefix='pptx2html-minify-') as tmp:
+        inputs = args.inputs or [
+            generate_text_deck(Path(tmp) / 'text.pptx'),
+            generate_deck(Path(tmp) / 'deck.pptx', slides=20, runs=60, images=2, image_size=(64, 48)),
+        ]
+        results = [check(path) for path in inputs]
+    return 0 if all(results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
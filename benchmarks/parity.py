@@ -0,0 +1,150 @@
+"""
+בדיקת שקילות בין מסלול הטקסט המהיר (XML ישיר) למסלול python-pptx.
+
+    python -m benchmarks.parity
+    python -m benchmarks.parity talk.pptx decks/other.pptx
+
+ללא ארגומנטים נבדקת מצגת סינתטית שמכסה את מאפייני הטקסט הנתמכים. כל שקופית
+מומרת בשני המסלולים (כל אחד על עותק נפרד של המצגת) וה-HTML מושווה. קוד היציאה
+הוא 1 אם נמצא הבדל כלשהו.
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from lxml import etree
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.enum.dml import MSO_THEME_COLOR
+from pptx.enum.text import MSO_UNDERLINE, PP_ALIGN
+from pptx.oxml.ns import qn
+from pptx.util import Inches, Pt
+
+from core.converter import PowerPointConverter
+
+from .decks import generate_deck
+
+ALIGNMENTS = [None, PP_ALIGN.LEFT, PP_ALIGN.CENTER, PP_ALIGN.RIGHT, PP_ALIGN.JUSTIFY, PP_ALIGN.DISTRIBUTE]
+LINE_SPACINGS = [None, 1.0, 1.5, Pt(18)]
+UNDERLINES = [None, True, False, MSO_UNDERLINE.DOUBLE_LINE, MSO_UNDERLINE.WAVY_LINE]
+
+
+def _add_field(paragraph, text):
+    """מוסיף שדה (a:fld) לפסקה, כמו מספר שקופית"""
+    fld = etree.SubElement(paragraph._p, qn('a:fld'), id='{B6F15528-21DE-4FAA-801E-634DDDAF4B2B}', type='slidenum')
+    etree.SubElement(fld, qn('a:t')).text = text
+
+
+def generate_text_deck(path):
+    """מצגת שמכסה שילובים של מאפייני פסקה וקטעי טקסט"""
+    presentation = Presentation()
+    layout = presentation.slide_layouts[1]  # כותרת ותוכן - כולל placeholders
+
+    for slide_index in range(len(ALIGNMENTS) * 2):
+        slide = presentation.slides.add_slide(layout)
+        slide.shapes.title.text = f"כותרת {slide_index}"
+        slide.placeholders[1].text_frame.text = "פסקה ראשונה\nפסקה שנייה"
+
+        box = slide.shapes.add_textbox(Inches(1), Inches(2), Inches(6), Inches(3))
+        frame = box.text_frame
+        for p_index in range(6):
+            paragraph = frame.paragraphs[0] if p_index == 0 else frame.add_paragraph()
+            paragraph.alignment = ALIGNMENTS[(slide_index + p_index) % len(ALIGNMENTS)]
+            paragraph.line_spacing = LINE_SPACINGS[p_index % len(LINE_SPACINGS)]
+            if p_index % 2:
+                paragraph.space_before = Pt(6 * p_index)
+            if p_index % 3:
+                paragraph.space_after = Pt(4.5)
+
+            for r_index in range(5):
+                run = paragraph.add_run()
+                # קטעים ריקים או רווחים בלבד מדולגים בשני המסלולים
+                run.text = '   ' if r_index == 4 else f"קטע {p_index}.{r_index} "
+                font = run.font
+                key = slide_index + p_index + r_index
+                if key % 2:
+                    font.name = 'Calibri'
+                if key % 3:
+                    font.size = Pt(10 + key % 7 * 2.5)
+                if key % 4 == 1:
+                    font.color.rgb = RGBColor(0x12, 0xAB, 0x00)
+                elif key % 4 == 2:
+                    font.color.theme_color = MSO_THEME_COLOR.ACCENT_1
+                font.bold = [None, True, False][key % 3]
+                font.italic = [None, True, False][(key + 1) % 3]
+                font.underline = UNDERLINES[key % len(UNDERLINES)]
+                if r_index == 2:
+                    paragraph.add_line_break()
+
+            if p_index == 5:
+                _add_field(paragraph, str(slide_index + 1))
+
+        # פסקה שכולה רווחים - מדולגת
+        frame.add_paragraph().text = ' \v '
+
+        # תיבה ללא טקסט כלל
+        slide.shapes.add_textbox(Inches(7), Inches(6), Inches(1), Inches(1))
+
+        # מרווח שורות באחוזים מפורשים
+        spaced = slide.shapes.add_textbox(Inches(1), Inches(6), Inches(5), Inches(1)).text_frame
+        spaced.text = "מרווח 120%"
+        p_pr = spaced.paragraphs[0]._p.get_or_add_pPr()
+        ln_spc = etree.SubElement(p_pr, qn('a:lnSpc'))
+        etree.SubElement(ln_spc, qn('a:spcPct'), val='120%')
+
+    presentation.save(str(path))
+    return str(path)
+
+
+def _slides_html(pptx_path, fast_text):
+    """ממיר כל שקופית במצגת ומחזיר את ה-HTML שלה ואת זמן ההמרה הכולל"""
+    converter = PowerPointConverter(fast_text=fast_text)
+    presentation = Presentation(pptx_path)
+    start = time.perf_counter()
+    slides = [converter._convert_slide(slide, index) for index, slide in enumerate(presentation.slides)]
+    return slides, time.perf_counter() - start
+
+
+def check(pptx_path):
+    """משווה את שני המסלולים על מצגת; מחזיר את מספר השקופיות השונות"""
+    fast, fast_seconds = _slides_html(pptx_path, fast_text=True)
+    reference, reference_seconds = _slides_html(pptx_path, fast_text=False)
+
+    mismatches = 0
+    for index, (a, b) in enumerate(zip(fast, reference)):
+        if a != b:
+            mismatches += 1
+            print(f"  שקופית {index + 1}: הפלט שונה")
+            print(f"    מהיר:    {a['content'][:300]!r}")
+            print(f"    python-pptx: {b['content'][:300]!r}")
+
+    status = 'OK' if not mismatches else f'{mismatches} שקופיות שונות'
+    print(f"{pptx_path}: {len(fast)} שקופיות, {status} "
+          f"(XML {fast_seconds:.3f}s, python-pptx {reference_seconds:.3f}s)")
+    return mismatches
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.parity',
+        description='השוואת מסלול הטקסט המהיר למסלול python-pptx',
+    )
+    parser.add_argument('inputs', nargs='*', help='מצגות לבדיקה (ברירת מחדל: מצגות סינתטיות)')
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    with tempfile.TemporaryDirectory(prefix='pptx2html-parity-') as tmp:
+        inputs = args.inputs or [
+            generate_text_deck(Path(tmp) / 'text.pptx'),
+            generate_deck(Path(tmp) / 'deck.pptx', slides=20, runs=60),
+        ]
+        mismatches = sum(check(path) for path in inputs)
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
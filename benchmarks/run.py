@@ -0,0 +1,160 @@
+"""
+הרצת מדידות ביצועים על רשת פרמטרים של מצגות סינתטיות.
+
+    python -m benchmarks --quick
+    python -m benchmarks --slides 50 200 --tables 0x0 40x60 --images 0 8 -o results.json
+
+לכל שילוב פרמטרים נמדדים: זמן PowerPointConverter.convert (מינימום וחציון של כמה
+חזרות), זמן מצטבר לכל שלב פנימי, שיא זיכרון (tracemalloc) וגודל הפלט.
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import pptx
+
+from core.converter import PowerPointConverter
+
+from .decks import deck_name, generate_deck
+
+DEFAULT_GRID = {
+    'slides': [10, 100],
+    'runs': [10, 60],
+    'tables': [None, (10, 10), (40, 60)],
+    'images': [0, 4],
+    'image_sizes': [(640, 480), (3000, 2000)],
+}
+
+QUICK_GRID = {
+    'slides': [10],
+    'runs': [20],
+    'tables': [None, (20, 10)],
+    'images': [0, 2],
+    'image_sizes': [(1600, 1200)],
+}
+
+
+def run_case(deck_path, output_path, repeat, converter_options):
+    """מריץ המרה אחת של מצגת מספר פעמים ומחזיר את המדידות"""
+    timings = []
+    report = None
+    for _ in range(repeat):
+        converter = PowerPointConverter(instrument=True, **converter_options)
+        start = time.perf_counter()
+        converter.convert(deck_path, output_path)
+        elapsed = time.perf_counter() - start
+        timings.append(elapsed)
+        # דוח השלבים של ההרצה המהירה ביותר
+        if report is None or elapsed == min(timings):
+            report = converter.report
+
+    # הרצה נפרדת למדידת זיכרון - tracemalloc מאט את ההמרה ולכן אינו חלק מהתזמון
+    tracemalloc.start()
+    try:
+        PowerPointConverter(**converter_options).convert(deck_path, output_path)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'seconds': {
+            'min': round(min(timings), 6),
+            'median': round(statistics.median(timings), 6),
+            'runs': len(timings),
+        },
+        'stages': report.stages,
+        'shape_types': report.shape_types,
+        'peak_memory_bytes': peak,
+        'output_bytes': os.path.getsize(output_path),
+    }
+
+
+def iter_cases(grid):
+    return itertools.product(
+        grid['slides'], grid['runs'], grid['tables'], grid['images'], grid['image_sizes']
+    )
+
+
+def parse_table(value):
+    """'40x60' -> (40, 60); '0x0' או 'none' -> ללא טבלה"""
+    if value.lower() == 'none':
+        return None
+    rows, cols = (int(part) for part in value.lower().split('x'))
+    return (rows, cols) if rows and cols else None
+
+
+def parse_size(value):
+    width, height = (int(part) for part in value.lower().split('x'))
+    return (width, height)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='מדידת ביצועי הממיר')
+    parser.add_argument('-o', '--output', default='benchmark_results.json', help='קובץ תוצאות JSON')
+    parser.add_argument('--decks-dir', default=None, help='תיקייה לשמירת המצגות הסינתטיות (נשמרות בין הרצות)')
+    parser.add_argument('--repeat', type=int, default=3, help='מספר חזרות לכל מדידה')
+    parser.add_argument('--quick', action='store_true', help='רשת פרמטרים מצומצמת')
+    parser.add_argument('--slides', type=int, nargs='+')
+    parser.add_argument('--runs', type=int, nargs='+', help='מספר קטעי טקסט בשקופית')
+    parser.add_argument('--tables', type=parse_table, nargs='+', help='גודל טבלה, למשל 40x60 או none')
+    parser.add_argument('--images', type=int, nargs='+', help='מספר תמונות בשקופית')
+    parser.add_argument('--image-sizes', type=parse_size, nargs='+', help='גודל תמונה, למשל 3000x2000')
+    parser.add_argument('--extract-assets', action='store_true')
+    parser.add_argument('--workers', type=int, default=1)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    grid = dict(QUICK_GRID if args.quick else DEFAULT_GRID)
+    for key in grid:
+        value = getattr(args, key)
+        if value:
+            grid[key] = value
+
+    decks_dir = Path(args.decks_dir or Path(tempfile.gettempdir()) / 'pptx2html-bench-decks')
+    converter_options = {'workers': args.workers, 'extract_assets': args.extract_assets}
+
+    results = []
+    with tempfile.TemporaryDirectory() as out_dir:
+        for slides, runs, table, images, image_size in iter_cases(grid):
+            deck_path = decks_dir / deck_name(slides, runs, table, images, image_size)
+            if not deck_path.exists():
+                generate_deck(deck_path, slides, runs, table, images, image_size)
+
+            params = {
+                'slides': slides,
+                'runs': runs,
+                'table': list(table) if table else None,
+                'images': images,
+                'image_size': list(image_size),
+            }
+            print(f"{deck_path.name} ...", file=sys.stderr, flush=True)
+            measurement = run_case(str(deck_path), os.path.join(out_dir, 'out.html'),
+                                   args.repeat, converter_options)
+            results.append({'params': params, **measurement})
+            print(f"  {measurement['seconds']['min']:.3f}s, "
+                  f"{measurement['peak_memory_bytes'] / 2**20:.1f} MiB, "
+                  f"{measurement['output_bytes'] / 2**10:.0f} KiB", file=sys.stderr)
+
+    report = {
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'python_pptx': pptx.__version__,
+        },
+        'converter_options': converter_options,
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"התוצאות נשמרו ב-{args.output}", file=sys.stderr)
+    return 0
@@ -0,0 +1,160 @@
+"""
+בדיקת ספרייט הצורות: כל <use> מפנה לסמל שמוגדר בדף, וכל סמל מוגדר פעם אחת.
+
+    python -m benchmarks.shapes
+    python -m benchmarks.shapes --slides 20 --repeat 12
+
+נוצרת מצגת שבכל שקופית שלה חוזרות אותן צורות (חצים, בלונים, אליפסות ומלבנים
+מעוגלים עם טקסט) בשני צבעים, לצד צורה מסובבת, קו וצורה שהגיאומטריה שלה אינה
+נתמכת (ענן). המצגת מומרת לדף אחד ובמצב split, ונבדק ש:
+- כל <use> מפנה ל-<symbol> שמוגדר באותו דף, ואין סמלים שאינם בשימוש
+- מספר הסמלים הוא מספר הצירופים השונים של גיאומטריה, מילוי וקו
+- כל דף שקופית במצב split כולל רק את הסמלים של השקופית שלו, בלי <base> (שהיה
+  מפנה את ה-<use> אל מחוץ לדף), וכל כתובת יחסית בו מפנה לקובץ קיים
+מודפסים גם הגודל הממוצע של מופע והגודל של הספרייט. קוד היציאה הוא 1 אם אחת
+הבדיקות נכשלה.
+"""
+import argparse
+import re
+import sys
+import tempfile
+from io import BytesIO
+from pathlib import Path
+from urllib.parse import unquote
+
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.enum.shapes import MSO_CONNECTOR, MSO_SHAPE
+from pptx.util import Inches
+from PIL import Image
+
+from core.converter import PowerPointConverter
+
+_USE = re.compile(r'<use href="#(\w+)"')
+_SYMBOL = re.compile(r'<symbol id="(\w+)"')
+_SHAPE = re.compile(r'<svg class="shape".*?</svg>', re.S)
+_SPRITE = re.compile(r'<svg class="shape-sprite".*?</svg>', re.S)
+_FALLBACK = re.compile(r'<div class="shape"')
+_BASE = re.compile(r'<base\b')
+_LINK = re.compile(r'(?:href|src)="([^"#:]+?)"')
+
+# הצורות שחוזרות בכל שקופית
+SHAPES = [MSO_SHAPE.RIGHT_ARROW, MSO_SHAPE.CHEVRON, MSO_SHAPE.RECTANGULAR_CALLOUT,
+          MSO_SHAPE.OVAL, MSO_SHAPE.ROUNDED_RECTANGLE]
+COLORS = [RGBColor(0x1F, 0x4E, 0x79), RGBColor(0xC0, 0x50, 0x4D)]
+
+
+def generate_shape_deck(path, slides, repeat):
+    """מצגת עם צורות שחוזרות בכל שקופית; מחזירה את מספר הסמלים הצפוי"""
+    presentation = Presentation()
+    image = BytesIO()
+    Image.new('RGB', (64, 48), (31, 78, 121)).save(image, 'PNG')
+    for _ in range(slides):
+        slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+        for i in range(repeat):
+            autoshape = SHAPES[i % len(SHAPES)]
+            shape = slide.shapes.add_shape(autoshape, Inches(0.2 + (i % 6) * 1.6), Inches(0.2 + (i // 6) * 1.2),
+                                           Inches(1.4), Inches(0.8))
+            shape.fill.solid()
+            shape.fill.fore_color.rgb = COLORS[i // len(SHAPES) % len(COLORS)]
+            if autoshape == MSO_SHAPE.ROUNDED_RECTANGLE:
+                shape.text = f"שלב {i + 1}"
+
+        # אותו חץ, מסובב - הסמל זהה, רק ה-transform שונה
+        arrow = slide.shapes.add_shape(MSO_SHAPE.RIGHT_ARROW, Inches(1), Inches(6), Inches(1.4), Inches(0.8))
+        arrow.fill.solid()
+        arrow.fill.fore_color.rgb = COLORS[0]
+        arrow.rotation = 45
+        slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Inches(3), Inches(6.5), Inches(8), Inches(6.5))
+        slide.shapes.add_shape(MSO_SHAPE.CLOUD, Inches(8), Inches(5.5), Inches(1.5), Inches(1))
+        # תמונה - כדי לבדוק שכתובת הנכס בדפי split נכונה
+        image.seek(0)
+        slide.shapes.add_picture(image, Inches(9), Inches(0.2), Inches(0.8))
+
+    presentation.save(str(path))
+    # צורה וצבע לכל צירוף שמופיע, ועוד הקו
+    combinations = {(i % len(SHAPES), i // len(SHAPES) % len(COLORS)) for i in range(repeat)}
+    return str(path), len(combinations | {(0, 0)}) + 1
+
+
+def check_page(html, label):
+    """
+    בודק שכל <use> בדף מפנה לסמל שמוגדר בו, ושכל סמל מוגדר פעם אחת ונמצא בשימוש
+
+    Returns:
+        tuple: (הודעות שגיאה, מזהי הסמלים שבדף)
+    """
+    errors = []
+    used, defined = set(_USE.findall(html)), _SYMBOL.findall(html)
+    if len(defined) != len(set(defined)):
+        errors.append(f"{label}: סמל מוגדר יותר מפעם אחת")
+    if used - set(defined):
+        errors.append(f"{label}: {len(used - set(defined))} הפניות לסמלים שאינם בדף")
+    if set(defined) - used:
+        errors.append(f"{label}: {len(set(defined) - used)} סמלים שאינם בשימוש")
+    return errors, set(defined)
+
+
+def check_links(page, html):
+    """בודק שבדף split אין <base> ושכל כתובת יחסית בו מפנה לקובץ קיים"""
+    errors = []
+    if _BASE.search(html):
+        errors.append(f"{page.name}: <base> משנה את הכתובת של <use href=\"#...\">")
+    missing = sorted({url for url in _LINK.findall(html) if not (page.parent / unquote(url)).exists()})
+    if missing:
+        errors.append(f"{page.name}: {len(missing)} כתובות יחסיות לקבצים שאינם קיימים ({missing[0]})")
+    return errors
+
+
+def run(slides, repeat, directory):
+    """ממיר את המצגת לדף אחד ולמצב split; מחזיר True אם כל הבדיקות עברו"""
+    path, expected = generate_shape_deck(Path(directory) / 'shapes.pptx', slides, repeat)
+
+    html = PowerPointConverter().convert_to_bytes(path).decode('utf-8')
+    errors, symbols = check_page(html, 'דף אחד')
+    if len(symbols) != expected:
+        errors.append(f"{len(symbols)} סמלים במקום {expected}")
+    if len(_FALLBACK.findall(html)) != slides:
+        errors.append(f"{len(_FALLBACK.findall(html))} צורות חלופיות (div) במקום {slides}")
+
+    output = Path(directory) / 'split' / 'shapes.html'
+    output.parent.mkdir()
+    PowerPointConverter(output_mode='split', extract_assets=True).convert(path, str(output))
+    pages = sorted(output.parent.glob('*/slide-*.html'))
+    if len(pages) != slides:
+        errors.append(f"{len(pages)} דפי שקופיות במצב split במקום {slides}")
+    for page in pages:
+        page_html = page.read_text(encoding='utf-8')
+        errors.extend(check_page(page_html, page.name)[0])
+        errors.extend(check_links(page, page_html))
+
+    shapes = _SHAPE.findall(html)
+    sprite = _SPRITE.search(html)
+    status = 'OK' if not errors else 'FAIL'
+    print(f"{status:4}  {len(shapes)} צורות, {len(symbols)} סמלים, "
+          f"{sum(map(len, shapes)) / max(len(shapes), 1):.0f} תווים למופע, "
+          f"ספרייט {len(sprite.group()) if sprite else 0:,} תווים")
+    for error in errors[:10]:
+        print(f"      {error}")
+    return not errors
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.shapes',
+        description='בדיקת ספרייט ה-SVG של הצורות',
+    )
+    parser.add_argument('--slides', type=int, default=10, help='מספר השקופיות')
+    parser.add_argument('--repeat', type=int, default=12, help='מספר הצורות החוזרות בכל שקופית')
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    with tempfile.TemporaryDirectory(prefix='pptx2html-shapes-') as tmp:
+        result = run(args.slides, args.repeat, tmp)
+    return 0 if result else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
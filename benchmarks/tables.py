@@ -0,0 +1,206 @@
+"""
+מדידת ההמרה של טבלאות גדולות ובדיקת תקינות הפלט.
+
+    python -m benchmarks.tables
+    python -m benchmarks.tables --sizes 60x40 200x20 --repeat 5
+
+לכל גודל נוצרת מצגת עם טבלה שכוללת תאים ממוזגים (אופקית ואנכית), צבעי רקע,
+גבולות ושוליים. נמדד זמן convert_table לטבלה, ונבדק ש:
+- עץ ה-XML של המצגת לא השתנה בהמרה
+- כל שורה ב-HTML מכסה בדיוק את מספר העמודות (colspan / rowspan)
+- הפלט הווירטואלי (virtualize_cells) מכיל את אותן שורות בנתוני ה-JSON, וגיבוי
+  ה-noscript מכיל את השורות הראשונות שלהן
+- בטבלה של 1000 תאים ומעלה (ברירת המחדל של virtual_table_cells) הפלט הווירטואלי
+  קטן מהטבלה המלאה
+קוד היציאה הוא 1 אם אחת הבדיקות נכשלה.
+"""
+import argparse
+import json
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from lxml import etree
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.oxml.ns import qn
+from pptx.util import Inches
+
+from core.tables import _PARAGRAPH_STYLE, _PARAGRAPH_STYLES, TableHandler
+
+from .run import parse_table
+
+_ROW = re.compile(r'<tr[^>]*>(.*?)</tr>', re.S)
+_CELL = re.compile(r'<td([^>]*)>')
+_SPAN = re.compile(r'(colspan|rowspan)="(\d+)"')
+_TABLE_DATA = re.compile(r'<script type="application/json" class="table-data">(.*?)</script>', re.S)
+_NOSCRIPT = re.compile(r'<noscript>(.*?)</noscript>', re.S)
+
+
+def _add_border(cell, tag, width, color):
+    """מוסיף קו גבול (a:lnL וכו') לתא"""
+    tc_pr = cell._tc.get_or_add_tcPr()
+    line = etree.SubElement(tc_pr, qn(tag), w=str(width))
+    fill = etree.SubElement(line, qn('a:solidFill'))
+    etree.SubElement(fill, qn('a:srgbClr'), val=color)
+
+
+def generate_table_deck(path, rows, cols):
+    """מצגת עם טבלה אחת בגודל הנתון, עם מיזוגים ועיצוב תאים"""
+    presentation = Presentation()
+    slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+    table = slide.shapes.add_table(rows, cols, Inches(0.2), Inches(0.2), Inches(9.6), Inches(7)).table
+
+    for r in range(rows):
+        for c in range(cols):
+            cell = table.cell(r, c)
+            cell.text = f"{r * cols + c:,}"
+            if (r + c) % 3 == 0:
+                cell.fill.solid()
+                cell.fill.fore_color.rgb = RGBColor(0xE8, 0xF0, 0xFE)
+            if c % 4 == 0:
+                _add_border(cell, 'a:lnL', 19050, '1F4E79')
+            if r % 5 == 0:
+                cell.margin_left = Inches(0.05)
+
+    # מיזוג אופקי בשורות הכותרת, ומיזוג אנכי בעמודה הראשונה
+    for c in range(0, cols - 1, 3):
+        table.cell(0, c).merge(table.cell(0, c + 1))
+    for r in range(1, rows - 2, 4):
+        table.cell(r, 0).merge(table.cell(r + 2, 0))
+    # מיזוג של בלוק שלם
+    if rows > 6 and cols > 6:
+        table.cell(4, 4).merge(table.cell(5, 6))
+
+    presentation.save(str(path))
+    return str(path)
+
+
+def check_grid(html, cols):
+    """
+    בודק שכל שורה מכסה בדיוק cols עמודות, כולל תאים שנמשכים משורות קודמות
+
+    Returns:
+        list: הודעות שגיאה (ריקה אם תקין)
+    """
+    errors = []
+    pending = {}  # עמודה -> מספר השורות הבאות שהיא עדיין תפוסה בהן
+    for index, row in enumerate(_ROW.findall(html)):
+        occupied = [c for c, left in pending.items() if left > 0]
+        width = len(occupied)
+        pending = {c: left - 1 for c, left in pending.items() if left > 1}
+        column = 0
+        for attributes in _CELL.findall(row):
+            spans = dict(_SPAN.findall(attributes))
+            colspan, rowspan = int(spans.get('colspan', 1)), int(spans.get('rowspan', 1))
+            while column in occupied:
+                column += 1
+            for c in range(column, column + colspan):
+                if rowspan > 1:
+                    pending[c] = rowspan - 1
+            column += colspan
+            width += colspan
+        if width != cols:
+            errors.append(f"שורה {index}: {width} עמודות במקום {cols}")
+    return errors
+
+
+# קודי היישור בנתוני ה-JSON -> ערכי algn, כמו VIRTUAL_ALIGN בסקריפט
+_ALIGN = {'l': 'l', 'c': 'ctr', 'r': 'r', 'j': 'just', 'd': 'dist'}
+
+
+def rows_from_data(data):
+    """בונה מחדש את שורות ה-HTML מנתוני ה-JSON, כמו הסקריפט בדף"""
+    data = json.loads(data)
+    styles = data['styles']
+    parts = []
+    for height, cells in data['rows']:
+        parts.append(f'<tr style="height: {height}px">' if height else '<tr>')
+        for cell in cells:
+            fields = cell if isinstance(cell, list) else [cell]
+            text, align, style, colspan, rowspan = fields + ['', 0, 1, 1][len(fields) - 1:]
+            attributes = (f' colspan="{colspan}"' if colspan > 1 else '') + \
+                         (f' rowspan="{rowspan}"' if rowspan > 1 else '') + \
+                         (f' style="{styles[style]}"' if styles[style] else '')
+            paragraphs = [] if text is None else text if isinstance(text, list) else [text]
+            content = ''.join(f'<p style="{_PARAGRAPH_STYLES.get(_ALIGN.get(align[i:i + 1]), _PARAGRAPH_STYLE)}">'
+                              f'{paragraph}</p>' for i, paragraph in enumerate(paragraphs))
+            parts.append(f'<td{attributes}>{content}</td>')
+        parts.append('</tr>')
+    return ''.join(parts)
+
+
+def check_virtual(virtual, html, cols):
+    """
+    בודק שהטבלה הווירטואלית מכילה את אותן שורות כמו הטבלה המלאה
+
+    Returns:
+        list: הודעות שגיאה (ריקה אם תקין)
+    """
+    data, noscript = _TABLE_DATA.search(virtual), _NOSCRIPT.search(virtual)
+    if not data or not noscript:
+        return ["חסרים נתוני JSON או גיבוי noscript בטבלה הווירטואלית"]
+
+    errors = []
+    expected = _ROW.findall(html)
+    if _ROW.findall(rows_from_data(data.group(1).replace('<\\/', '</'))) != expected:
+        errors.append("השורות בנתוני ה-JSON שונות מהטבלה המלאה")
+    fallback = _ROW.findall(noscript.group(1))
+    if not fallback or fallback != expected[:len(fallback)]:
+        errors.append("השורות בגיבוי ה-noscript אינן השורות הראשונות של הטבלה המלאה")
+    if len(expected) * cols >= 1000 and len(virtual) >= len(html):
+        errors.append(f"הפלט הווירטואלי ({len(virtual):,} תווים) אינו קטן מהטבלה המלאה")
+    return errors + check_grid(noscript.group(1), cols)
+
+
+def run_case(rows, cols, repeat, directory):
+    """ממיר טבלה בגודל נתון; מחזיר True אם כל הבדיקות עברו"""
+    path = generate_table_deck(Path(directory) / f"table_{rows}x{cols}.pptx", rows, cols)
+    shape = next(shape for shape in Presentation(path).slides[0].shapes if shape.has_table)
+    handler = TableHandler()
+
+    before = etree.tostring(shape.element)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        html = handler.convert_table(shape, 'table')
+        timings.append(time.perf_counter() - start)
+
+    virtual = TableHandler(virtualize_cells=1).convert_table(shape, 'table')
+
+    errors = check_grid(html, cols) + check_virtual(virtual, html, cols)
+    if etree.tostring(shape.element) != before:
+        errors.append("ההמרה שינתה את עץ ה-XML של המצגת")
+
+    seconds = min(timings)
+    status = 'OK' if not errors else 'FAIL'
+    print(f"{status:4}  {rows}x{cols:<4} {seconds * 1000:8.2f}ms  "
+          f"{rows * cols / seconds:12,.0f} תאים/שנייה  {len(html):>10,} תווים  "
+          f"(וירטואלית: {len(virtual):,})")
+    for error in errors[:10]:
+        print(f"      {error}")
+    return not errors
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.tables',
+        description='מדידת ההמרה של טבלאות גדולות ובדיקת תקינות הפלט',
+    )
+    parser.add_argument('--sizes', type=parse_table, nargs='+', default=[(10, 10), (60, 40), (200, 20)],
+                        help='גדלי טבלה, למשל 60x40')
+    parser.add_argument('--repeat', type=int, default=5, help='מספר המדידות לכל טבלה')
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    with tempfile.TemporaryDirectory(prefix='pptx2html-tables-') as tmp:
+        results = [run_case(rows, cols, args.repeat, tmp) for rows, cols in filter(None, args.sizes)]
+    return 0 if all(results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1 +1,7 @@
+"""
+המרת מצגות PowerPoint ל-HTML.
 
+הייבוא של החבילה ושל core.converter קל: python-pptx, Jinja ו-Pillow נטענים רק
+בשימוש הראשון, כך שתהליכי עבודה קצרים ובדיקות גרסה אינם משלמים עליהם.
+"""
+__version__ = '1.0.0'
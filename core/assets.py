@@ -0,0 +1,58 @@
+"""שמירת תמונות כקבצים חיצוניים לפי גיבוב התוכן"""
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+# שם תיקיית הנכסים ביחס לקובץ ה-HTML
+ASSETS_DIRNAME = 'assets'
+
+
+class AssetStore:
+    """
+    כותב כל תמונה ייחודית פעם אחת בלבד לתיקיית assets, בשם שנגזר מגיבוב התוכן.
+    מיפוי גיבוב->כתובת נשמר בזיכרון, כך שתמונה שחוזרת (למשל לוגו בכל שקופית)
+    אינה מקודדת או נכתבת שוב.
+    """
+
+    def __init__(self, output_dir, dirname=ASSETS_DIRNAME):
+        self.directory = Path(output_dir) / dirname
+        self.dirname = dirname
+        self._urls = {}
+
+    def add(self, blob, ext):
+        """
+        מוסיף תמונה למאגר ומחזיר את הכתובת היחסית שלה
+
+        Args:
+            blob (bytes): תוכן התמונה
+            ext (str): סיומת הקובץ (ללא נקודה), למשל 'png'
+
+        Returns:
+            str: כתובת יחסית לקובץ ה-HTML, למשל 'assets/3f2a...c1.png'
+        """
+        digest = hashlib.sha256(blob).hexdigest()[:20]
+        url = self._urls.get(digest)
+        if url is None:
+            filename = f"{digest}.{ext.lower()}"
+            self._write(filename, blob)
+            url = f"{self.dirname}/{filename}"
+            self._urls[digest] = url
+        return url
+
+    def _write(self, filename, blob):
+        """כותב את הקובץ אם אינו קיים - כתיבה אטומית, בטוחה גם בין תהליכים"""
+        path = self.directory / filename
+        if path.exists():
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(blob)
+            # mkstemp יוצר קובץ פרטי (0600) - הנכסים צריכים להיות קריאים לשרת הסטטי
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except Exception:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
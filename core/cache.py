@@ -0,0 +1,105 @@
+"""מטמון שקופיות מומרות לפי טביעת אצבע - להמרה מחדש של שקופיות שהשתנו בלבד"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# יש להעלות את הגרסה בכל שינוי בפלט של _convert_slide
+CACHE_VERSION = 8
+
+# שם תיקיית המטמון, ליד קובץ ה-HTML
+CACHE_DIRNAME = '.slide-cache'
+
+
+class SlideCache:
+    """
+    שומר את תוצאת _convert_slide של כל שקופית בקובץ JSON נפרד, בשם טביעת האצבע שלה.
+    טביעת האצבע מחושבת מה-XML של השקופית, מהחלקים הקשורים אליה (תמונות, מדיה,
+    פריסה ותבנית-האב) ומהגדרות הממיר - כך ששקופית שלא השתנתה נטענת מהמטמון.
+    """
+
+    def __init__(self, output_dir, pptx_path, options):
+        """
+        Args:
+            output_dir (str): תיקיית הפלט - המטמון נשמר בתת-תיקייה שלה
+            pptx_path (str): נתיב המצגת (לכל מצגת תיקיית מטמון משלה)
+            options (dict): הגדרות הממיר שמשפיעות על הפלט
+        """
+        self.output_dir = Path(output_dir)
+        self.directory = self.output_dir / CACHE_DIRNAME / Path(pptx_path).stem
+        self._options = json.dumps(options, sort_keys=True)
+        self._part_digests = {}
+        self._used = set()
+
+    def _part_digest(self, part):
+        """גיבוב תוכן של חלק בחבילה - מחושב פעם אחת לכל חלק"""
+        key = str(part.partname)
+        digest = self._part_digests.get(key)
+        if digest is None:
+            digest = hashlib.sha256(part.blob).hexdigest()
+            self._part_digests[key] = digest
+        return digest
+
+    def _related_parts(self, part):
+        """החלקים הפנימיים שהחלק מפנה אליהם, לפי סדר מזהה הקשר"""
+        for r_id, rel in sorted(part.rels.items()):
+            if not rel.is_external:
+                yield r_id, rel.target_part
+
+    def fingerprint(self, slide, index):
+        """מחשב את טביעת האצבע של שקופית"""
+        h = hashlib.sha256()
+        h.update(f"{CACHE_VERSION}|{self._options}|{index}".encode())
+        h.update(self._part_digest(slide.part).encode())
+        for r_id, part in self._related_parts(slide.part):
+            h.update(f"|{r_id}:{self._part_digest(part)}".encode())
+            # מיקום של placeholder יכול לעבור בירושה מהפריסה ומתבנית-האב, וצבעי
+            # הצורות מערכת הנושא של תבנית-האב
+            if 'slideLayout' in str(part.partname):
+                for _, master in self._related_parts(part):
+                    if 'slideMaster' in str(master.partname):
+                        h.update(f"|master:{self._part_digest(master)}".encode())
+                        for _, theme in self._related_parts(master):
+                            if 'theme' in str(theme.partname):
+                                h.update(f"|theme:{self._part_digest(theme)}".encode())
+        return h.hexdigest()[:32]
+
+    def get(self, key):
+        """מחזיר את השקופית השמורה, או None אם אינה במטמון או שנכסיה חסרים"""
+        path = self.directory / f"{key}.json"
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                slide = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        # שקופית שמפנה לתמונה חיצונית שנמחקה - ממירים מחדש
+        if any(not (self.output_dir / asset).exists() for asset in slide.get('assets', ())):
+            return None
+
+        self._used.add(key)
+        return slide
+
+    def put(self, key, slide):
+        """שומר שקופית מומרת במטמון (כתיבה אטומית)"""
+        self._used.add(key)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(slide, f, ensure_ascii=False)
+            os.replace(tmp_path, self.directory / f"{key}.json")
+        except OSError as e:
+            logger.warning(f"לא ניתן לשמור שקופית במטמון: {str(e)}")
+
+    def prune(self):
+        """מוחק רשומות שלא שימשו בהמרה האחרונה, כדי שהמטמון לא יגדל ללא הגבלה"""
+        if not self.directory.is_dir():
+            return
+        for path in self.directory.glob('*.json'):
+            if path.stem not in self._used:
+                path.unlink(missing_ok=True)
@@ -0,0 +1,260 @@
+"""
+ממשק שורת פקודה להמרת מצגות רבות במקביל, ללא ממשק גרפי.
+
+    python -m core decks/ talk.pptx "archive/**/*.pptx" -o out/ -j 8 --summary summary.json
+
+מודול זה אינו מייבא flet או PyQt, כך שניתן להריץ אותו על שרתים ללא תצוגה.
+"""
+import argparse
+import glob
+import json
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def expand_inputs(inputs):
+    """הופך רשימת קבצים, תיקיות ותבניות glob לרשימת קבצי pptx ייחודיים, לפי הסדר"""
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            matches = sorted(str(p) for p in Path(item).rglob('*.pptx'))
+        elif os.path.isfile(item):
+            matches = [item]
+        else:
+            matches = sorted(glob.glob(item, recursive=True))
+            if not matches:
+                logger.warning(f"לא נמצאו קבצים עבור: {item}")
+        paths.extend(matches)
+
+    seen = set()
+    result = []
+    for path in paths:
+        # קבצי נעילה זמניים של PowerPoint
+        if Path(path).name.startswith('~$'):
+            continue
+        key = os.path.abspath(path)
+        if key not in seen:
+            seen.add(key)
+            result.append(path)
+    return result
+
+
+def output_path_for(pptx_path, output_dir=None, root=None):
+    """
+    נתיב קובץ ה-HTML עבור מצגת - ליד המקור, או בתיקיית הפלט. בתיקיית הפלט
+    נשמרת התיקייה של המצגת ביחס ל-root (התיקייה המשותפת לכל המצגות)
+    """
+    if output_dir is None:
+        return str(Path(pptx_path).with_suffix('.html'))
+    directory = Path(output_dir)
+    if root is not None:
+        directory /= os.path.relpath(os.path.dirname(os.path.abspath(pptx_path)), root)
+    return os.path.normpath(directory / f"{Path(pptx_path).stem}.html")
+
+
+def output_paths(pptx_paths, output_dir=None):
+    """
+    נתיבי קובצי ה-HTML לכל המצגות. בתיקיית פלט נשמר המבנה היחסי של התיקיות,
+    כך ש-a/talk.pptx ו-b/talk.pptx נכתבות ל-out/a/talk.html ול-out/b/talk.html
+    (ולכל אחת מטמון ונכסים משלה) ולא לאותו קובץ.
+
+    Raises:
+        ValueError: כששתי מצגות עדיין ממופות לאותו קובץ (למשל talk.pptx ו-Talk.pptx
+            במערכת קבצים שאינה מבחינה בין אותיות גדולות לקטנות)
+    """
+    root = None
+    if output_dir is not None and pptx_paths:
+        root = os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in pptx_paths])
+
+    outputs = [output_path_for(path, output_dir, root) for path in pptx_paths]
+    seen = {}
+    for path, output in zip(pptx_paths, outputs):
+        key = os.path.normcase(os.path.abspath(output))
+        if key in seen:
+            raise ValueError(f"{seen[key]} ו-{path} ממופות לאותו קובץ פלט: {output}")
+        seen[key] = path
+    return outputs
+
+
+def convert_one(pptx_path, output_path, options):
+    """רץ בתהליך עבודה: ממיר מצגת אחת ומחזיר רשומת סיכום"""
+    from .converter import PowerPointConverter
+
+    start = time.perf_counter()
+    record = {'input': pptx_path, 'output': output_path}
+    try:
+        converter = PowerPointConverter(**options)
+        converter.convert(pptx_path, output_path)
+        record['status'] = 'ok'
+        record['output_bytes'] = os.path.getsize(output_path)
+        if converter.report is not None:
+            record['stages'] = converter.report.stages
+    except Exception as e:
+        record['status'] = 'error'
+        record['error'] = str(e)
+    record['seconds'] = round(time.perf_counter() - start, 4)
+    return record
+
+
+def convert_many(jobs, options, workers=None, max_in_flight=None):
+    """
+    ממיר מצגות במאגר תהליכים, עם הגבלה על מספר ההמרות הממתינות בכל רגע
+
+    Args:
+        jobs (list): זוגות (נתיב מצגת, נתיב פלט)
+        options (dict): פרמטרים ל-PowerPointConverter
+        workers (int, optional): מספר תהליכים (ברירת מחדל: מספר המעבדים)
+        max_in_flight (int, optional): מקסימום המרות שנשלחו למאגר ולא הסתיימו
+
+    Yields:
+        dict: רשומת סיכום לכל מצגת, לפי סדר הסיום
+
+    תהליך עבודה שקרס (למשל מחוסר זיכרון) שובר את המאגר: ההמרות שהיו בו נרשמות
+    כשגיאה, והשאר ממשיכות במאגר חדש.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 2
+    pending = iter(jobs)
+    in_flight = {}  # future -> (נתיב מצגת, נתיב פלט, זמן השליחה)
+
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        while True:
+            for pptx_path, output_path in pending:
+                try:
+                    future = pool.submit(convert_one, pptx_path, output_path, options)
+                except BrokenProcessPool:
+                    pool.shutdown(wait=False)
+                    pool = ProcessPoolExecutor(max_workers=workers)
+                    future = pool.submit(convert_one, pptx_path, output_path, options)
+                in_flight[future] = (pptx_path, output_path, time.perf_counter())
+                if len(in_flight) >= max_in_flight:
+                    break
+            if not in_flight:
+                break
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            broken = False
+            for future in done:
+                pptx_path, output_path, submitted = in_flight.pop(future)
+                try:
+                    record = future.result()
+                except Exception as e:
+                    broken = broken or isinstance(e, BrokenProcessPool)
+                    record = {
+                        'input': pptx_path,
+                        'output': output_path,
+                        'status': 'error',
+                        'error': str(e) or type(e).__name__,
+                        'seconds': round(time.perf_counter() - submitted, 4),
+                    }
+                yield record
+            if broken:
+                pool.shutdown(wait=False)
+                pool = ProcessPoolExecutor(max_workers=workers)
+    finally:
+        pool.shutdown()
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m core',
+        description='המרת מצגות PowerPoint ל-HTML במקביל, ללא ממשק גרפי',
+    )
+    parser.add_argument('inputs', nargs='+', help='קבצי pptx, תיקיות או תבניות glob')
+    parser.add_argument('-o', '--output-dir', help='תיקיית פלט (ברירת מחדל: ליד כל מצגת)')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='מספר תהליכי המרה (ברירת מחדל: מספר המעבדים)')
+    parser.add_argument('--max-in-flight', type=int, default=None,
+                        help='מקסימום המרות ממתינות בו-זמנית (ברירת מחדל: פי 2 ממספר התהליכים)')
+    parser.add_argument('--summary', default='-',
+                        help='קובץ לסיכום JSON ("-" לפלט הסטנדרטי)')
+    parser.add_argument('--extract-assets', action='store_true',
+                        help='שמירת תמונות כקבצים בתיקיית assets במקום base64')
+    parser.add_argument('--slide-cache', action='store_true',
+                        help='שימוש במטמון שקופיות להמרה חוזרת מהירה')
+    parser.add_argument('--output-mode', choices=['single', 'lazy', 'split'], default='single',
+                        help='single - קובץ אחד; lazy - שקופיות נטענות לפי דרישה מקבצים נפרדים; '
+                             'split - דף אינדקס ודף נפרד לכל שקופית')
+    parser.add_argument('--minify', action='store_true',
+                        help='הקטנת ה-HTML, ה-CSS וה-JS בפלט')
+    parser.add_argument('--precompress', action='store_true',
+                        help='כתיבת קבצי .gz (ו-.br כשהמודול brotli מותקן) לצד הפלט, לאירוח סטטי')
+    parser.add_argument('--embed', action='store_true',
+                        help='כתיבת גרסת הטמעה (<שם>_embed.html) באותו מעבר (לא במצב split)')
+    parser.add_argument('--virtual-table-cells', type=int, default=1000,
+                        help='טבלאות עם לפחות מספר תאים זה מוצגות באופן וירטואלי (0 - אף פעם)')
+    parser.add_argument('--timings', action='store_true',
+                        help='הוספת זמנים לכל שלב בהמרה לסיכום')
+    parser.add_argument('-v', '--verbose', action='store_true', help='הדפסת לוג מפורט')
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.embed and args.output_mode == 'split':
+        parser.error("--embed אינו נתמך עם --output-mode split")
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+    )
+
+    files = expand_inputs(args.inputs)
+    if not files:
+        logger.error("לא נמצאו מצגות להמרה")
+        return 2
+
+    try:
+        outputs = output_paths(files, args.output_dir)
+    except ValueError as e:
+        logger.error(str(e))
+        return 2
+    for output in outputs:
+        os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    jobs = list(zip(files, outputs))
+    options = {
+        'extract_assets': args.extract_assets,
+        'slide_cache': args.slide_cache,
+        'output_mode': args.output_mode,
+        'minify': args.minify,
+        'precompress': args.precompress,
+        'embed': args.embed,
+        'virtual_table_cells': args.virtual_table_cells,
+        'instrument': args.timings,
+    }
+
+    start = time.perf_counter()
+    records = []
+    for record in convert_many(jobs, options, args.jobs, args.max_in_flight):
+        logger.info(f"{record['status']}: {record['input']} ({record['seconds']}s)")
+        records.append(record)
+
+    # הסיכום לפי סדר הקלט, לא לפי סדר הסיום
+    order = {path: i for i, (path, _) in enumerate(jobs)}
+    records.sort(key=lambda r: order[r['input']])
+    failed = sum(1 for r in records if r['status'] != 'ok')
+    summary = {
+        'total': len(records),
+        'succeeded': len(records) - failed,
+        'failed': failed,
+        'seconds': round(time.perf_counter() - start, 4),
+        'files': records,
+    }
+
+    text = json.dumps(summary, ensure_ascii=False, indent=2)
+    if args.summary == '-':
+        print(text)
+    else:
+        with open(args.summary, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    return 1 if failed else 0
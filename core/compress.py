@@ -0,0 +1,74 @@
+"""
+קבצי דחיסה מוכנים מראש (.gz ו-.br) לצד קבצי הפלט, לאירוח סטטי:
+השרת (למשל nginx עם gzip_static / brotli_static) מגיש אותם ישירות במקום
+לדחוס את אותו קובץ בכל בקשה. הדחיסה נעשית פעם אחת, ברמה המקסימלית.
+"""
+import gzip
+import os
+from pathlib import Path
+
+# קבצי טקסט בלבד - תמונות כבר דחוסות
+TEXT_SUFFIXES = {'.html', '.css', '.js', '.svg', '.json', '.txt', '.xml'}
+
+# כל הסיומות שקובץ דחיסה יכול לקבל - גם כאלה שהקידוד שלהן אינו זמין כרגע
+SIDECAR_SUFFIXES = ('.gz', '.br')
+
+
+def _gzip(data):
+    # mtime=0 - אותו קלט נותן תמיד אותו קובץ, בלי שינויים מיותרים בפריסה
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def _brotli(data):
+    import brotli
+    return brotli.compress(data, quality=11, mode=brotli.MODE_TEXT)
+
+
+def encoders():
+    """
+    הקידודים הזמינים: gzip תמיד, brotli רק כשהמודול brotli מותקן
+
+    Returns:
+        dict: סיומת קובץ הדחיסה -> פונקציית דחיסה
+    """
+    available = {'.gz': _gzip}
+    try:
+        import brotli  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        available['.br'] = _brotli
+    return available
+
+
+def write_sidecars(path, encoders):
+    """
+    כותב קבצי דחיסה לצד קובץ טקסט. קובץ דחיסה שאינו קטן מהמקור אינו נכתב,
+    וקובץ ישן שנשאר מהמרה קודמת נמחק - כדי שהשרת לא יגיש תוכן מיושן.
+
+    Args:
+        path (Path): הקובץ המקורי
+        encoders (dict): הקידודים לכתיבה (ראו encoders()). מילון ריק רק מוחק
+            קבצי דחיסה ישנים
+
+    Returns:
+        list: נתיבי קבצי הדחיסה שנכתבו
+    """
+    path = Path(path)
+    if path.suffix.lower() not in TEXT_SUFFIXES:
+        return []
+
+    data = path.read_bytes() if encoders else b''
+    written = []
+    for suffix in SIDECAR_SUFFIXES:
+        sidecar = path.with_name(path.name + suffix)
+        compressed = encoders[suffix](data) if suffix in encoders else None
+        if compressed is None or len(compressed) >= len(data):
+            sidecar.unlink(missing_ok=True)
+            continue
+        # כתיבה לקובץ זמני והחלפה - השרת לא יגיש קובץ דחיסה חלקי
+        tmp_path = sidecar.with_name(sidecar.name + '.tmp')
+        tmp_path.write_bytes(compressed)
+        os.replace(tmp_path, sidecar)
+        written.append(sidecar)
+    return written
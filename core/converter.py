@@ -1,26 +1,162 @@
 from pathlib import Path
-from pptx import Presentation
-from .styles import StyleGenerator
+from .styles import StyleGenerator, StyleTable, SymbolTable
 from .animations import AnimationHandler
 from .tables import TableHandler
+from .shapes import ShapeHandler
+from .assets import AssetStore
+from .cache import SlideCache
+from .instrumentation import NULL_MEASURE, Instrumentation
+from . import parallel
+from .rendering import get_template
+from . import compress, events, minify, text
 import base64
-from io import BytesIO
-from pptx.enum.shapes import MSO_SHAPE_TYPE
-from pptx.enum.dml import MSO_THEME_COLOR_INDEX
+import json
+from urllib.parse import quote
+from contextlib import ExitStack
+from io import BytesIO, TextIOWrapper
 import math
 import logging
-from jinja2 import Template
 import os
+import tempfile
+import time
 
 logger = logging.getLogger(__name__)
 
+
+def embed_path(html_path):
+    """נתיב גרסת ההטמעה של קובץ HTML: talk.html -> talk_embed.html"""
+    html_path = Path(html_path)
+    return html_path.with_name(f"{html_path.stem}_embed.html")
+
+
+class ConversionCancelled(Exception):
+    """ההמרה בוטלה לבקשת המשתמש (בין שקופיות)"""
+
+
 class PowerPointConverter:
-    def __init__(self):
-        """אתחול הממיר"""
+    def __init__(self, workers=1, extract_assets=False, slide_cache=False,
+                 output_mode='single', eager_slides=3, optimize_images=False,
+                 image_format='webp', image_quality=80, image_dpr=2.0, instrument=False,
+                 fast_text=True, minify=False, precompress=False,
+                 embed=False, virtual_table_cells=1000):
+        """
+        אתחול הממיר
+
+        Args:
+            workers (int, optional): מספר תהליכים להמרת שקופיות במקביל.
+                1 = המרה טורית (ברירת מחדל), None או 0 = לפי מספר המעבדים
+            extract_assets (bool, optional): שמירת תמונות כקבצים בתיקיית assets
+                (לפי גיבוב התוכן) במקום הטמעתן כ-base64 בתוך ה-HTML
+            slide_cache (bool, optional): שמירת השקופיות המומרות במטמון ליד הפלט,
+                כך שבהמרה חוזרת רק שקופיות שהשתנו מומרות מחדש
+            output_mode (str, optional): 'single' - כל השקופיות בקובץ אחד;
+                'lazy' - רק השקופיות הראשונות בדף, והשאר כקבצים נפרדים שנטענים לפי דרישה;
+                'split' - דף אינדקס ודף HTML נפרד לכל שקופית, עם CSS ו-JS משותפים
+            eager_slides (int, optional): מספר השקופיות שנכללות בדף עצמו במצב 'lazy'
+            optimize_images (bool, optional): הקטנת תמונות לגודל התצוגה והמרתן לפורמט מודרני
+            image_format (str, optional): פורמט היעד לתמונות - 'webp' או 'avif'
+            image_quality (int, optional): איכות קידוד התמונות (1-100)
+            image_dpr (float, optional): יחס פיקסלים של המסך שאליו מקטינים את התמונות
+            instrument (bool, optional): מדידת זמנים לכל שלב, שקופית וסוג צורה.
+                הדוח של ההמרה האחרונה נשמר ב-self.report
+            fast_text (bool, optional): קריאת מסגרות טקסט ישירות מה-XML במקום דרך
+                אובייקטי python-pptx (אותו פלט, מהיר יותר בשקופיות עתירות טקסט)
+            minify (bool, optional): הקטנת ה-HTML, ה-CSS וה-JS בזמן הכתיבה
+                (כיווץ רווחים בלבד - ה-DOM המוצג זהה)
+            precompress (bool, optional): כתיבת קבצי .gz (ו-.br כשהמודול brotli מותקן)
+                לצד קובצי הטקסט של הפלט, לאירוח סטטי
+            embed (bool, optional): convert() כותב באותו מעבר גם את גרסת ההטמעה
+                (<שם>_embed.html) - עם סקריפט התאמת הגובה ותגי meta להטמעה ב-Wix.
+                מפעיל גם את extract_assets: שני הדפים משתמשים באותם קובצי CSS, JS
+                ותמונות בתיקיית assets, ושקופיות שמעבר ל-eager_slides נטענות בשניהם
+                מאותם קבצים (כמו במצב 'lazy'), כך שגרסת ההטמעה אינה משכפלת אותם.
+                אינו נתמך עם output_mode='split'
+            virtual_table_cells (int, optional): טבלה עם לפחות מספר תאים זה נכתבת
+                כנתוני JSON, והדף מציג רק את השורות הנראות בה. None או 0 - ללא
+
+        Raises:
+            ValueError: כש-embed מופעל במצב 'split'
+        """
+        if embed and output_mode == 'split':
+            raise ValueError("גרסת הטמעה אינה נתמכת במצב split")
+
         self.style_generator = StyleGenerator()
         self.animation_handler = AnimationHandler()
-        self.table_handler = TableHandler()
+        self.table_handler = TableHandler(virtual_table_cells)
+        self.shape_handler = ShapeHandler()
         self.animation_step = 0
+        self.workers = workers
+        self.extract_assets = extract_assets or embed
+        self.slide_cache = slide_cache
+        self.output_mode = output_mode
+        self.eager_slides = eager_slides
+        self.optimize_images = optimize_images
+        self.image_format = image_format
+        self.image_quality = image_quality
+        self.image_dpr = image_dpr
+        self._image_optimizer = None
+        if optimize_images:
+            from .images import ImageOptimizer
+            self._image_optimizer = ImageOptimizer(image_format, image_quality, image_dpr)
+        self.instrument = instrument
+        self.fast_text = fast_text
+        self.minify = minify
+        self.precompress = precompress
+        self.embed = embed
+        self.virtual_table_cells = virtual_table_cells
+        self.report = None
+        self._instrumentation = None
+        self._observer = None
+        self._cancel = None
+        self._started = None
+        # הקבצים שנכתבו בהמרה הנוכחית - עבור קבצי הדחיסה
+        self._output_files = []
+        # מאגר נכסים לכל תיקיית פלט - נשמר בין המרות באותו תהליך
+        self._asset_stores = {}
+        self._asset_store = None
+        self._slide_assets = []
+        self._slide_styles = StyleTable()
+        self._slide_symbols = SymbolTable()
+
+    def _worker_options(self):
+        """הפרמטרים לבניית ממיר זהה בתהליכי העבודה"""
+        return {
+            'workers': 1,
+            'extract_assets': self.extract_assets,
+            'optimize_images': self.optimize_images,
+            'image_format': self.image_format,
+            'image_quality': self.image_quality,
+            'image_dpr': self.image_dpr,
+            'fast_text': self.fast_text,
+            'virtual_table_cells': self.virtual_table_cells,
+        }
+
+    def _use_output_dir(self, output_dir):
+        """מכין את מאגר הנכסים עבור תיקיית הפלט של ההמרה הנוכחית"""
+        if not self.extract_assets or output_dir is None:
+            self._asset_store = None
+            return
+        key = str(Path(output_dir).resolve())
+        if key not in self._asset_stores:
+            self._asset_stores[key] = AssetStore(output_dir)
+        self._asset_store = self._asset_stores[key]
+
+    def _measure(self, stage, slide=None, shape_type=None):
+        """מודד בלוק קוד כשהמדידה מופעלת; אחרת מחזיר context manager ריק"""
+        if self._instrumentation is None:
+            return NULL_MEASURE
+        return self._instrumentation.measure(stage, slide, shape_type)
+
+    def _emit(self, event, **data):
+        """שולח אירוע ל-observer של ההמרה הנוכחית, אם יש"""
+        if self._observer is None:
+            return
+        data = {'event': event, 'elapsed': round(time.perf_counter() - self._started, 6), **data}
+        try:
+            self._observer(data)
+        except Exception as e:
+            # תקלה בתצוגת ההתקדמות אינה סיבה להפיל את ההמרה
+            logger.warning(f"שגיאה בטיפול באירוע {event}: {str(e)}")
 
     def _add_animation_to_element(self, element_id, shape_index, slide_index):
         """הוספת אנימציה לאלמנט"""
@@ -32,443 +168,433 @@ class PowerPointConverter:
         )
         return animation
 
-    def convert(self, pptx_path, output_path=None):
+    def convert(self, pptx_path, output_path=None, observer=None, cancel=None):
         """
         ממיר מצגת PowerPoint לקובץ HTML
         
         Args:
-            pptx_path (str): נתיב לקובץ PowerPoint
-            output_path (str, optional): נתיב לשמירת קובץ ה-HTML. אם לא צוין, ישמר באותה תיקייה
+            pptx_path: נתיב לקובץ PowerPoint, תוכן הקובץ (bytes) או זרם בינארי
+            output_path (str, optional): נתיב לשמירת קובץ ה-HTML. אם לא צוין, ישמר באותה
+                תיקייה (חובה כשהמצגת אינה נתיב)
+            observer (callable, optional): מקבל כל אירוע בהמרה כמילון - פתיחת המצגת,
+                תחילת וסיום כל שקופית, כתיבת נכסים וקבצים (ראו core.events)
+            cancel (optional): אובייקט עם is_set() (למשל threading.Event) - נבדק לפני
+                כל שקופית, וכשהוא מסומן ההמרה נעצרת ב-ConversionCancelled
         
         Returns:
             str: נתיב לקובץ ה-HTML שנוצר
         """
         try:
-            presentation = Presentation(pptx_path)
-            html_content = self._convert_presentation(presentation)
-            
             if output_path is None:
+                if not isinstance(pptx_path, (str, os.PathLike)):
+                    raise ValueError("יש לציין output_path כשהמצגת אינה נתיב לקובץ")
                 # שמירה באותה תיקייה כמו קובץ המקור
                 output_path = str(Path(pptx_path).with_suffix('.html'))
-                
-            # שמירת הקובץ
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-                
-            return output_path
-            
-        except Exception as e:
-            raise Exception(f"שגיאה בהמרת המצגת: {str(e)}")
-        
-    def _convert_presentation(self, presentation):
-        """ממיר את המצגת כולה ל-HTML"""
-        slides_html = []
-        for i, slide in enumerate(presentation.slides):
-            slide_html = self._convert_slide(slide, i)
-            slides_html.append(slide_html)
-
-        # יצירת ה-HTML המלא
-        html = self._generate_html_content(slides_html)
-        return html
-    
-    def _generate_html_content(self, slides_data):
-        """יוצר את תוכן ה-HTML עם כל התכונות המתקדמות"""
-        html_template = """
-<!DOCTYPE html>
-<html dir="rtl" lang="he">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>מצגת מומרת</title>
-    <style>
-        :root {
-            --primary-color: #2196F3;
-            --background-color: #ffffff;
-            --text-color: #333333;
-            --thumbnail-size: 120px;
-        }
-
-        [data-theme="dark"] {
-            --background-color: #1a1a1a;
-            --text-color: #ffffff;
-        }
-
-        body {
-            margin: 0;
-            padding: 0;
-            background-color: var(--background-color);
-            color: var(--text-color);
-            font-family: system-ui, -apple-system, sans-serif;
-            transition: background-color 0.3s, color 0.3s;
-            overflow-x: hidden;
-        }
-
-        #presentation-container {
-            display: flex;
-            height: 100vh;
-            max-width: 100vw;
-        }
-
-        #slides-container {
-            flex: 1;
-            overflow: hidden;
-            position: relative;
-            display: flex;
-            justify-content: center;
-            align-items: center;
-        }
-
-        .slide {
-            position: absolute;
-            width: 100%;
-            height: 100%;
-            opacity: 0;
-            transition: opacity 0.5s;
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            padding: 20px;
-            box-sizing: border-box;
-        }
-
-        .slide.active {
-            opacity: 1;
-            z-index: 1;
-        }
-
-        /* תיקון גודל תמונות */
-        .slide img {
-            max-width: 100%;
-            max-height: 80vh;
-            object-fit: contain;
-            margin: auto;
-        }
-
-        .slide-content {
-            max-width: 90%;
-            max-height: 90vh;
-            margin: auto;
-            overflow: auto;
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-        }
-
-        /* שאר הסגנונות נשארים אותו דבר... */
-        
-        #export-panel {
-            position: fixed;
-            top: 50%;
-            left: 50%;
-            transform: translate(-50%, -50%);
-            background: var(--background-color);
-            padding: 20px;
-            border-radius: 10px;
-            box-shadow: 0 0 20px rgba(0,0,0,0.3);
-            z-index: 1000;
-            display: none;
-        }
-
-        #export-panel textarea {
-            width: 100%;
-            min-height: 150px;
-            margin: 10px 0;
-            padding: 10px;
-            direction: ltr;
-            font-family: monospace;
-        }
-
-        .close-button {
-            position: absolute;
-            top: 10px;
-            right: 10px;
-            background: none;
-            border: none;
-            font-size: 20px;
-            cursor: pointer;
-        }
-
-        /* סגנונות נוספים נשארים כמו שהם... */
-        
-        #thumbnails-panel {
-            width: var(--thumbnail-size);
-            background: rgba(0,0,0,0.1);
-            overflow-y: auto;
-            padding: 10px;
-            display: none;
-        }
 
-        .thumbnail {
-            width: 100px;
-            height: 75px;
-            margin-bottom: 10px;
-            cursor: pointer;
-            border: 2px solid transparent;
-            background-size: cover;
-            background-position: center;
-        }
-
-        .thumbnail.active {
-            border-color: var(--primary-color);
-        }
-
-        #controls {
-            position: fixed;
-            bottom: 20px;
-            left: 50%;
-            transform: translateX(-50%);
-            z-index: 100;
-            display: flex;
-            gap: 10px;
-            background: rgba(0,0,0,0.5);
-            padding: 10px;
-            border-radius: 20px;
-        }
-
-        .control-button {
-            background: transparent;
-            border: none;
-            color: white;
-            cursor: pointer;
-            padding: 5px 10px;
-            font-size: 16px;
-            border-radius: 5px;
-        }
+            # שמירת הקובץ - כל שקופית נכתבת מיד כשהיא מוכנה, ובמצב embed גם לגרסת
+            # ההטמעה, באותו מעבר. הכתיבה לקבצים זמניים לצד היעד, שמחליפים אותו רק
+            # בסיום - המרה שנכשלה או בוטלה משאירה את הפלט הקודם כמו שהוא
+            paths = [Path(output_path)]
+            if self.embed:
+                paths.append(embed_path(output_path))
+            tmp_paths = []
+            try:
+                with ExitStack() as stack:
+                    streams = []
+                    for path in paths:
+                        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+                        tmp_paths.append(tmp_path)
+                        streams.append(stack.enter_context(open(fd, 'w', encoding='utf-8')))
+                    self.write_html(pptx_path, streams[0], output_path=output_path,
+                                    observer=observer, cancel=cancel,
+                                    embed_stream=streams[1] if self.embed else None)
+                for path, tmp_path in zip(paths, tmp_paths):
+                    # mkstemp יוצר קובץ פרטי (0600) - הדף צריך להיות קריא לשרת הסטטי
+                    os.chmod(tmp_path, 0o644)
+                    os.replace(tmp_path, path)
+            except BaseException:
+                for tmp_path in tmp_paths:
+                    Path(tmp_path).unlink(missing_ok=True)
+                raise
+
+            for path in paths:
+                self._emit(events.FILE_WRITTEN, path=str(path), bytes=path.stat().st_size)
+                self._output_files.append(path)
+            self._write_sidecars()
 
-        .control-button:hover {
-            background: rgba(255,255,255,0.1);
-        }
-
-        #settings-panel {
-            position: fixed;
-            top: 20px;
-            right: 20px;
-            background: var(--background-color);
-            padding: 15px;
-            border-radius: 10px;
-            box-shadow: 0 0 10px rgba(0,0,0,0.2);
-            z-index: 100;
-            display: none;
-        }
-    </style>
-</head>
-<body>
-    <div id="presentation-container">
-        <div id="thumbnails-panel"></div>
-        <div id="slides-container">
-            {% for slide in slides %}
-            <div class="slide" id="slide-{{ loop.index }}">
-                {{ slide.content | safe }}
-            </div>
-            {% endfor %}
-        </div>
-    </div>
-
-    <div id="controls">
-        <button class="control-button" onclick="previousSlide()">&#10094;</button>
-        <button class="control-button" onclick="toggleThumbnails()">תמונות ממוזערות</button>
-        <button class="control-button" onclick="toggleFullscreen()">מסך מלא</button>
-        <button class="control-button" onclick="toggleSettings()">הגדרות</button>
-        <button class="control-button" onclick="exportToWix()">ייצוא ל-Wix</button>
-        <button class="control-button" onclick="nextSlide()">&#10095;</button>
-    </div>
-
-    <div id="settings-panel">
-        <div class="settings-row">
-            <label>מצב כהה</label>
-            <input type="checkbox" id="dark-mode" onchange="toggleTheme()">
-        </div>
-        <div class="settings-row">
-            <label>גודל טקסט</label>
-            <select id="font-size" onchange="changeFontSize()">
-                <option value="small">קטן</option>
-                <option value="medium" selected>בינוני</option>
-                <option value="large">גדול</option>
-            </select>
-        </div>
-    </div>
-
-    <div id="export-panel">
-        <button class="close-button" onclick="closeExportPanel()">&times;</button>
-        <h3>קוד להטמעה ב-Wix</h3>
-        <p>העתק את הקוד הבא והדבק אותו ברכיב HTML מותאם אישית ב-Wix:</p>
-        <textarea id="embed-code" readonly></textarea>
-        <button class="control-button" onclick="copyEmbedCode()">העתק קוד</button>
-    </div>
-
-    <script>
-        let currentSlide = 1;
-        const totalSlides = {{ slides|length }};
-        
-        // טעינת העדפות משתמש
-        document.addEventListener('DOMContentLoaded', () => {
-            loadUserPreferences();
-            showSlide(currentSlide);
-            createThumbnails();
-        });
-
-        function showSlide(n) {
-            const slides = document.querySelectorAll('.slide');
-            const thumbnails = document.querySelectorAll('.thumbnail');
-            
-            currentSlide = n;
-            if (currentSlide > totalSlides) currentSlide = 1;
-            if (currentSlide < 1) currentSlide = totalSlides;
-            
-            slides.forEach(slide => slide.classList.remove('active'));
-            thumbnails.forEach(thumb => thumb.classList.remove('active'));
-            
-            slides[currentSlide - 1].classList.add('active');
-            if (thumbnails[currentSlide - 1]) {
-                thumbnails[currentSlide - 1].classList.add('active');
-                thumbnails[currentSlide - 1].scrollIntoView({ behavior: 'smooth', block: 'nearest' });
-            }
-        }
+            return output_path
 
-        function nextSlide() {
-            showSlide(currentSlide + 1);
-        }
+        except ConversionCancelled:
+            raise
+        except Exception as e:
+            raise Exception(f"שגיאה בהמרת המצגת: {str(e)}")
 
-        function previousSlide() {
-            showSlide(currentSlide - 1);
-        }
+    def write_html(self, pptx_path, stream, output_path=None, observer=None, cancel=None,
+                   embed_stream=None):
+        """
+        ממיר מצגת PowerPoint וכותב את ה-HTML ישירות לזרם טקסט.
+        ראש המסמך נכתב מיד, כל שקופית נכתבת כשהמרתה מסתיימת ולבסוף הסקריפטים,
+        כך שצריכת הזיכרון אינה תלויה במספר השקופיות.
 
-        function createThumbnails() {
-            const thumbnailsPanel = document.getElementById('thumbnails-panel');
-            const slides = document.querySelectorAll('.slide');
-            
-            slides.forEach((slide, index) => {
-                const thumbnail = document.createElement('div');
-                thumbnail.className = 'thumbnail';
-                thumbnail.onclick = () => showSlide(index + 1);
-                thumbnail.style.backgroundImage = `url('data:image/svg+xml,<svg xmlns="http://www.w3.org/2000/svg" width="100" height="75"><rect width="100%" height="100%" fill="%23f0f0f0"/><text x="50%" y="50%" dominant-baseline="middle" text-anchor="middle" font-family="system-ui" font-size="20" fill="%23666">${index + 1}</text></svg>')`;
-                thumbnailsPanel.appendChild(thumbnail);
-            });
-        }
+        Args:
+            pptx_path: נתיב לקובץ PowerPoint, תוכן הקובץ (bytes) או זרם בינארי.
+                המרה מקבילית ומטמון שקופיות זמינים רק כשזהו נתיב
+            stream: כל אובייקט עם מתודת write(str) - קובץ פתוח, sys.stdout וכו'
+            output_path (str, optional): הנתיב שבו יישמר ה-HTML. נדרש לקבצים שנכתבים
+                לצדו - תמונות חיצוניות, מטמון שקופיות ושקופיות לטעינה לפי דרישה.
+                בלעדיו התמונות מוטמעות וכל השקופיות נכתבות לזרם
+            observer (callable, optional): מקבל כל אירוע בהמרה כמילון (ראו core.events)
+            cancel (optional): אובייקט עם is_set() - עוצר את ההמרה בין שקופיות
+            embed_stream (optional): זרם טקסט נוסף שמקבל באותו מעבר את גרסת ההטמעה.
+                השקופיות מומרות פעם אחת ונכתבות לשני הזרמים; לא נתמך במצב 'split'
+        """
+        from pptx import Presentation
 
-        function toggleThumbnails() {
-            const panel = document.getElementById('thumbnails-panel');
-            panel.style.display = panel.style.display === 'none' ? 'block' : 'none';
-        }
+        if embed_stream is not None and self.output_mode == 'split':
+            raise ValueError("גרסת הטמעה אינה נתמכת במצב split")
 
-        function toggleFullscreen() {
-            if (!document.fullscreenElement) {
-                document.documentElement.requestFullscreen();
-            } else {
-                document.exitFullscreen();
-            }
-        }
+        start = time.perf_counter()
+        self._instrumentation = Instrumentation() if self.instrument else None
+        self._observer = observer
+        self._cancel = cancel
+        self._started = start
+        self._output_files = []
 
-        function toggleSettings() {
-            const panel = document.getElementById('settings-panel');
-            panel.style.display = panel.style.display === 'none' ? 'block' : 'none';
-        }
+        if isinstance(pptx_path, (bytes, bytearray, memoryview)):
+            pptx_path = BytesIO(pptx_path)
+        # רק נתיב ניתן לפתיחה מחדש בתהליכי העבודה ולשמש מפתח למטמון
+        source = pptx_path if isinstance(pptx_path, (str, os.PathLike)) else None
 
-        function toggleTheme() {
-            const isDark = document.getElementById('dark-mode').checked;
-            document.documentElement.setAttribute('data-theme', isDark ? 'dark' : 'light');
-            localStorage.setItem('theme', isDark ? 'dark' : 'light');
-        }
+        with self._measure('load'):
+            presentation = Presentation(pptx_path)
+        self._emit(events.DECK_OPENED, path=None if source is None else str(source),
+                   slide_count=len(presentation.slides))
+        output_dir = Path(output_path).parent if output_path is not None else None
+        self._use_output_dir(output_dir)
+
+        directory = None
+        # גם בגרסת הטמעה - שני הדפים טוענים את אותם קובצי שקופיות במקום לשכפל אותן
+        lazy = self.output_mode in ('lazy', 'split') or embed_stream is not None
+        if lazy and output_path is not None:
+            directory = Path(output_path).with_name(f"{Path(output_path).stem}_slides")
+
+        slides = self._convert_slides(presentation, source, output_dir)
+        if self.output_mode == 'split' and directory is not None:
+            self._write_split(stream, slides, directory, len(presentation.slides))
+        else:
+            self._write_html(stream, slides, directory, embed_stream)
+
+        if directory is not None:
+            # מחיקת שקופיות שנשארו מהמרה קודמת (בכל אחד מהמצבים), כולל קבצי הדחיסה
+            # שלהן - רק אחרי שההמרה הצליחה, כדי לא לשבור את הפלט הקודם
+            written = set(self._output_files)
+            for stale in directory.glob('slide-*'):
+                if stale not in written:
+                    stale.unlink()
+
+        if self._instrumentation is not None:
+            self.report = self._instrumentation.report(time.perf_counter() - start)
+            self._instrumentation = None
+
+    def convert_to_stream(self, pptx, stream, observer=None, cancel=None):
+        """
+        ממיר מצגת בזיכרון וכותב את ה-HTML (UTF-8) לזרם בינארי, ללא קבצים זמניים.
+        התמונות מוטמעות בדף וכל השקופיות נכללות בו, כמו ב-write_html ללא output_path.
 
-        function changeFontSize() {
-            const size = document.getElementById('font-size').value;
-            const sizes = {
-                small: '14px',
-                medium: '16px',
-                large: '18px'
-            };
-            document.body.style.fontSize = sizes[size];
-            localStorage.setItem('fontSize', size);
-        }
+        Args:
+            pptx: תוכן קובץ PowerPoint (bytes), זרם בינארי או נתיב
+            stream: זרם בינארי לכתיבה - תשובת HTTP, BytesIO וכו'. הזרם אינו נסגר
+            observer (callable, optional): מקבל כל אירוע בהמרה כמילון (ראו core.events)
+            cancel (optional): אובייקט עם is_set() - עוצר את ההמרה בין שקופיות
+        """
+        text_stream = TextIOWrapper(stream, encoding='utf-8', newline='\n')
+        try:
+            self.write_html(pptx, text_stream, observer=observer, cancel=cancel)
+            text_stream.flush()
+        finally:
+            # מנתקים את העטיפה כדי שסגירתה לא תסגור את הזרם של הקורא
+            text_stream.detach()
 
-        function loadUserPreferences() {
-            // טעינת ערכת נושא
-            const theme = localStorage.getItem('theme') || 'light';
-            document.getElementById('dark-mode').checked = theme === 'dark';
-            document.documentElement.setAttribute('data-theme', theme);
+    def convert_to_bytes(self, pptx, observer=None, cancel=None):
+        """
+        ממיר מצגת בזיכרון ומחזיר את ה-HTML
 
-            // טעינת גודל טקסט
-            const fontSize = localStorage.getItem('fontSize') || 'medium';
-            document.getElementById('font-size').value = fontSize;
-            changeFontSize();
-        }
+        Args:
+            pptx: תוכן קובץ PowerPoint (bytes), זרם בינארי או נתיב
 
-        // תמיכה בניווט מקלדת
-        document.addEventListener('keydown', (e) => {
-            if (e.key === 'ArrowRight') previousSlide();
-            else if (e.key === 'ArrowLeft') nextSlide();
-            else if (e.key === 'f') toggleFullscreen();
-        });
-
-        // תמיכה במחוות מגע
-        let touchStartX = 0;
-        document.addEventListener('touchstart', e => {
-            touchStartX = e.touches[0].clientX;
-        });
-
-        document.addEventListener('touchend', e => {
-            const touchEndX = e.changedTouches[0].clientX;
-            const diff = touchStartX - touchEndX;
-            
-            if (Math.abs(diff) > 50) {
-                if (diff > 0) nextSlide();
-                else previousSlide();
-            }
-        });
+        Returns:
+            bytes: ה-HTML בקידוד UTF-8
+        """
+        output = BytesIO()
+        self.convert_to_stream(pptx, output, observer=observer, cancel=cancel)
+        return output.getvalue()
+
+    def _convert_slides(self, presentation, source=None, output_dir=None):
+        """ממיר את כל השקופיות לפי הסדר - מהמטמון כשאפשר, ובמקביל כשיש הרבה להמיר"""
+        slides = list(presentation.slides)
+
+        cache = None
+        cached = {}
+        if self.slide_cache and source is not None and output_dir is not None:
+            cache = SlideCache(output_dir, source, self._worker_options())
+            with self._measure('slide_cache'):
+                keys = [cache.fingerprint(slide, i) for i, slide in enumerate(slides)]
+                for i, key in enumerate(keys):
+                    slide_data = cache.get(key)
+                    if slide_data is not None:
+                        cached[i] = slide_data
+            logger.info(f"{len(cached)} מתוך {len(slides)} שקופיות נטענו מהמטמון")
+
+        missing = [i for i in range(len(slides)) if i not in cached]
+        converted = self._convert_slide_indices(slides, missing, source, output_dir)
+
+        assets = set()
+        try:
+            for i in range(len(slides)):
+                if self._cancel is not None and self._cancel.is_set():
+                    raise ConversionCancelled(f"ההמרה בוטלה לפני שקופית {i + 1}")
+
+                self._emit(events.SLIDE_STARTED, index=i, total=len(slides))
+                slide_start = time.perf_counter()
+                if i in cached:
+                    slide_data = cached[i]
+                else:
+                    slide_data = next(converted)
+                    if cache is not None:
+                        with self._measure('slide_cache'):
+                            cache.put(keys[i], slide_data)
+                self._emit(events.SLIDE_FINISHED, index=i, total=len(slides),
+                           seconds=round(time.perf_counter() - slide_start, 6), cached=i in cached)
+
+                # גם נכסים שנכתבו בתהליכי העבודה או בהמרה קודמת (מהמטמון)
+                for url in slide_data.get('assets', ()):
+                    if url not in assets:
+                        assets.add(url)
+                        path = Path(output_dir) / url
+                        self._output_files.append(path)
+                        if self._observer is not None:
+                            self._emit(events.ASSET_WRITTEN, url=url, path=str(path), bytes=path.stat().st_size)
+                yield slide_data
+        finally:
+            # בביטול או בשגיאה - עוצר את תהליכי העבודה בלי להמתין לשקופיות שנותרו
+            converted.close()
+
+        if cache is not None:
+            cache.prune()
+
+    def _convert_slide_indices(self, slides, indices, source=None, output_dir=None):
+        """ממיר את השקופיות שבאינדקסים הנתונים, לפי הסדר - במקביל כשיש מספיק שקופיות"""
+        workers = parallel.resolve_workers(self.workers)
+
+        # מעט שקופיות או ללא נתיב מקור - המרה טורית
+        if source is None or workers < 2 or len(indices) < parallel.MIN_PARALLEL_SLIDES:
+            return (self._convert_slide(slides[i], i) for i in indices)
+
+        logger.info(f"ממיר {len(indices)} שקופיות במקביל ב-{workers} תהליכים")
+        return parallel.convert_slides_parallel(
+            str(source), indices, min(workers, len(indices)),
+            self._worker_options(), output_dir, self._instrumentation
+        )
 
-        function exportToWix() {
-            const panel = document.getElementById('export-panel');
-            const textarea = document.getElementById('embed-code');
-            const currentUrl = window.location.href;
-            
-            const embedCode = `
-<!-- קוד להטמעת המצגת -->
-<div class="presentation-container" style="position: relative; width: 100%;">
-    <iframe 
-        src="${currentUrl}"
-        style="width: 100%; height: 600px; border: none; overflow: hidden;"
-        allowfullscreen="true"
-        loading="lazy"
-    ></iframe>
-</div>
+    def _generate_html_chunks(self, slides, fragments=None, embed=False, page=None):
+        """
+        מייצר את ה-HTML בחלקים: ראש המסמך, כל שקופית בנפרד, ולבסוף סוף המסמך.
+        השקופיות נצרכות אחת-אחת, כך שאין צורך להחזיק את כולן בזיכרון.
+        אם צוינה תיקיית fragments, רק השקופיות הראשונות נכללות בדף והשאר נכתבות
+        לקבצים נפרדים שהדף טוען לפי דרישה. page - משתנים נוספים לראש ולסוף המסמך
+        (למשל css_href / js_href לקבצים משותפים).
+
+        Yields:
+            tuple: (חלק, החלק בגרסת ההטמעה). כשאין גרסת הטמעה, או שהחלק זהה בשתיהן
+                (השקופיות), האיבר השני הוא None
+        """
+        head_template = get_template('head.html')
+        slide_template = get_template('slide.html')
+        foot_template = get_template('foot.html')
+
+        render_start = time.perf_counter()
+        with self._measure('generate_html_content'):
+            page = page or {}
+            chunk = head_template.render(**page)
+            embed_chunk = head_template.render(**page, embed=True) if embed else None
+        yield chunk, embed_chunk
+
+        # סגנונות הטקסט וסמלי הצורות של כל השקופיות - נכתבים פעם אחת בסוף המסמך
+        text_styles = StyleTable()
+        symbols = SymbolTable()
+
+        total_slides = 0
+        for total_slides, slide in enumerate(slides, 1):
+            text_styles.update(slide.get('styles', {}))
+            symbols.update(slide.get('symbols', {}))
+            if fragments is not None and total_slides > self.eager_slides:
+                with self._measure('write'):
+                    src = self._write_slide_fragment(fragments, total_slides, slide['content'])
+                with self._measure('generate_html_content'):
+                    chunk = slide_template.render(index=total_slides, content='', src=src)
+            else:
+                with self._measure('generate_html_content'):
+                    chunk = slide_template.render(index=total_slides, content=slide['content'])
+            yield chunk, None
+
+        with self._measure('generate_html_content'):
+            foot = {'text_styles': text_styles.get_css(), 'symbols': symbols.get_sprite()}
+            chunk = foot_template.render(**page, **foot)
+            embed_chunk = foot_template.render(**page, **foot, embed=True) if embed else None
+        self._emit(events.RENDER_DONE, slides=total_slides,
+                   seconds=round(time.perf_counter() - render_start, 6))
+        yield chunk, embed_chunk
+
+    def _write_html(self, stream, slides, fragments=None, embed_stream=None):
+        """כותב את ה-HTML לזרם בהדרגה, שקופית אחרי שקופית (ובמקביל לזרם גרסת ההטמעה)"""
+        page = None
+        if embed_stream is not None and self._asset_store is not None:
+            # שני הדפים מפנים לאותם קבצים - הדפדפן טוען אותם פעם אחת
+            page = self._write_shared_bundle()
+        chunks = self._generate_html_chunks(slides, fragments, embed_stream is not None, page)
+        for chunk, embed_chunk in chunks:
+            chunk = self._minify(chunk)
+            with self._measure('write'):
+                stream.write(chunk)
+            if embed_stream is not None:
+                embed_chunk = chunk if embed_chunk is None else self._minify(embed_chunk)
+                with self._measure('write'):
+                    embed_stream.write(embed_chunk)
+
+    def _write_shared_bundle(self):
+        """
+        כותב את ה-CSS וה-JS של התבנית למאגר הנכסים, בשם לפי גיבוב התוכן (כמו
+        התמונות), כך שאפשר לשמור אותם במטמון ללא הגבלת זמן
 
-<!-- סקריפט להתאמה אוטומטית של גובה -->
-<script>
-window.addEventListener('message', function(e) {
-    if (e.data && e.data.type === 'resize') {
-        const iframe = document.querySelector('.presentation-container iframe');
-        if (iframe) {
-            iframe.style.height = e.data.height + 'px';
-        }
-    }
-});
-<\/script>`;
-            
-            textarea.value = embedCode;
-            panel.style.display = 'block';
-        }
+        Returns:
+            dict: css_href ו-js_href לתבניות
+        """
+        hrefs = {}
+        for name, key, minifier in (('presentation.css', 'css_href', minify.css),
+                                    ('presentation.js', 'js_href', minify.js)):
+            content = self._minify(get_template(name).render(), minifier)
+            with self._measure('write'):
+                url = self._asset_store.add(content.encode('utf-8'), name.rsplit('.', 1)[1])
+            path = self._asset_store.directory.parent / url
+            self._output_files.append(path)
+            self._emit(events.ASSET_WRITTEN, url=url, path=str(path), bytes=path.stat().st_size)
+            hrefs[key] = url
+        return hrefs
+
+    def _write_split(self, stream, slides, directory, total):
+        """
+        מצב split: דף אינדקס שנכתב לזרם, ודף HTML עצמאי לכל שקופית (slide-017.html)
+        בתיקייה נפרדת. ה-CSS וה-JS נכתבים פעם אחת לקבצים משותפים שהדפדפן שומר במטמון.
+        דפי השקופיות אינם משתמשים ב-<base> - הוא היה מפנה גם את <use href="#..."> של
+        הצורות אל מחוץ לדף - ולכן כתובות הנכסים בהם מקבלות את הקידומת '../'.
+        """
+        head_template = get_template('head.html')
+        slide_template = get_template('slide.html')
+        foot_template = get_template('foot.html')
+
+        base = f"{quote(directory.name)}/"
+        page = {
+            'css_href': f"{base}presentation.css",
+            'js_href': f"{base}presentation.js",
+            'slide_base': base,
+            'total_slides': total,
+        }
+        # דפי השקופיות נמצאים בתיקייה עצמה, לצד הקבצים המשותפים
+        slide_page = {**page, 'css_href': 'presentation.css', 'js_href': 'presentation.js',
+                      'slide_base': './'}
+
+        render_start = time.perf_counter()
+        directory.mkdir(parents=True, exist_ok=True)
+        with self._measure('write'):
+            self._write_file(directory / 'presentation.css',
+                             self._minify(get_template('presentation.css').render(), minify.css))
+            self._write_file(directory / 'presentation.js',
+                             self._minify(get_template('presentation.js').render(), minify.js))
+
+        with self._measure('generate_html_content'):
+            index = (head_template.render(**page)
+                     + get_template('index.html').render(**page)
+                     + foot_template.render(**page, text_styles=''))
+        index = self._minify(index)
+        with self._measure('write'):
+            stream.write(index)
+
+        total_slides = 0
+        for total_slides, slide in enumerate(slides, 1):
+            # כל דף כולל רק את מחלקות הטקסט ואת סמלי הצורות של השקופית שלו
+            text_styles = StyleTable()
+            text_styles.update(slide.get('styles', {}))
+            symbols = SymbolTable()
+            symbols.update(slide.get('symbols', {}))
+            # הנכסים יחסיים לתיקיית האב; שמותיהם לפי גיבוב, כך שהחלפה ישירה בטוחה
+            content = slide['content']
+            for url in slide.get('assets', ()):
+                content = content.replace(url, f"../{url}")
+            with self._measure('generate_html_content'):
+                html = (head_template.render(**slide_page, page_slide=total_slides)
+                        + slide_template.render(index=total_slides, content=content)
+                        + foot_template.render(**slide_page, text_styles=text_styles.get_css(),
+                                               symbols=symbols.get_sprite()))
+            html = self._minify(html)
+            with self._measure('write'):
+                self._write_file(directory / f"slide-{total_slides:03d}.html", html)
+
+        self._emit(events.RENDER_DONE, slides=total_slides,
+                   seconds=round(time.perf_counter() - render_start, 6))
+
+    def _minify(self, content, minifier=minify.html):
+        """מקטין חלק מהפלט כשהאפשרות minify מופעלת; אחרת מחזיר אותו כמו שהוא"""
+        if not self.minify:
+            return content
+        with self._measure('minify'):
+            return minifier(content)
+
+    def _write_file(self, path, content):
+        """כותב קובץ טקסט לצד ה-HTML ומדווח עליו ל-observer"""
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        self._emit(events.FILE_WRITTEN, path=str(path), bytes=path.stat().st_size)
+        self._output_files.append(path)
+
+    def _write_sidecars(self):
+        """
+        כותב קבצי .gz / .br לצד קובצי הטקסט שנכתבו בהמרה (כש-precompress מופעל).
+        אחרת רק מוחק קבצי דחיסה ישנים, שאינם תואמים עוד לתוכן.
+        """
+        encoders = compress.encoders() if self.precompress else {}
+        for path in self._output_files:
+            for sidecar in compress.write_sidecars(path, encoders):
+                self._emit(events.FILE_WRITTEN, path=str(sidecar), bytes=sidecar.stat().st_size)
 
-        function closeExportPanel() {
-            document.getElementById('export-panel').style.display = 'none';
-        }
+    def _write_slide_fragment(self, directory, index, content):
+        """
+        כותב שקופית לקובץ סקריפט נפרד וטוען אותה בדף דרך pptx2htmlSlide().
+        קובץ סקריפט (ולא fetch) עובד גם כשהדף נפתח ישירות מהדיסק (file://).
 
-        function copyEmbedCode() {
-            const textarea = document.getElementById('embed-code');
-            textarea.select();
-            document.execCommand('copy');
-            alert('הקוד הועתק ללוח!');
-        }
-    </script>
-</body>
-</html>
-"""
-        template = Template(html_template)
-        return template.render(slides=slides_data)
+        Returns:
+            str: הכתובת היחסית של הקובץ
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        filename = f"slide-{index:03d}.js"
+        content = self._minify(content)
+        self._write_file(directory / filename,
+                         f"pptx2htmlSlide({index}, {json.dumps(content, ensure_ascii=False)});\n")
+        return f"{quote(directory.name)}/{filename}"
 
     def _convert_slide(self, slide, index):
         """ממיר שקופית בודדת ל-HTML"""
+        with self._measure('convert_slide', index):
+            return self._build_slide(slide, index)
+
+    def _build_slide(self, slide, index):
+        """בונה את תוכן השקופית - רקע וכל הצורות שבה"""
+        from pptx.enum.shapes import MSO_SHAPE_TYPE
+
         try:
             slide_content = []
+            self._slide_assets = []
+            self._slide_styles = StyleTable()
+            self._slide_symbols = SymbolTable()
             
             # הוספת סגנון רקע
             background_style = self._get_background_style(slide)
@@ -483,17 +609,24 @@ window.addEventListener('message', function(e) {
                     animation_style = self._add_animation_to_element(element_id, shape_index, index)
                     
                     if shape.has_text_frame:
-                        # המרת מסגרת טקסט
-                        shape_html = self._convert_text_frame(shape, element_id, animation_style)
+                        # צורה: הגיאומטריה שלה (אם יש לה מילוי או קו) ומעליה הטקסט.
+                        # תיבת טקסט בלי גיאומטריה נמדדת כולה כ-text_frame
+                        geometry_html = self._convert_geometry(shape, element_id, animation_style, index,
+                                                               text_frame=True)
+                        text_id = f"{element_id}_text" if geometry_html else element_id
+                        with self._measure('convert_text_frame', index, 'text_frame'):
+                            shape_html = geometry_html + self._convert_text_frame(shape, text_id, animation_style)
                     elif shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
                         # המרת תמונה
-                        shape_html = self._convert_picture(shape, element_id, animation_style)
+                        with self._measure('convert_picture', index, 'picture'):
+                            shape_html = self._convert_picture(shape, element_id, animation_style)
                     elif shape.shape_type == MSO_SHAPE_TYPE.TABLE:
                         # המרת טבלה
-                        shape_html = self.table_handler.convert_table(shape, element_id, animation_style)
+                        with self._measure('convert_table', index, 'table'):
+                            shape_html = self.table_handler.convert_table(shape, element_id, animation_style)
                     else:
-                        # המרת צורה אחרת
-                        shape_html = self._convert_shape(shape, element_id, animation_style)
+                        # המרת צורה אחרת (קו, קבוצה וכו')
+                        shape_html = self._convert_geometry(shape, element_id, animation_style, index)
                     
                     if shape_html:
                         slide_content.append(shape_html)
@@ -503,9 +636,19 @@ window.addEventListener('message', function(e) {
             
             slide_content.append('</div>')
             
-            return {
+            slide_data = {
                 'content': '\n'.join(slide_content)
             }
+            if self._slide_styles.classes:
+                # מחלקות הסגנון שהשקופית משתמשת בהן
+                slide_data['styles'] = self._slide_styles.classes
+            if self._slide_symbols.classes:
+                # סמלי ה-SVG של הצורות בשקופית
+                slide_data['symbols'] = self._slide_symbols.classes
+            if self._slide_assets:
+                # התמונות החיצוניות שהשקופית מפנה אליהן (לבדיקת תקינות המטמון)
+                slide_data['assets'] = sorted(set(self._slide_assets))
+            return slide_data
         except Exception as e:
             logger.error(f"שגיאה בהמרת שקופית {index}: {str(e)}")
             return {
@@ -545,9 +688,23 @@ window.addEventListener('message', function(e) {
 
     def _convert_text_frame(self, shape, element_id="", animation_style=""):
         """ממיר מסגרת טקסט ל-HTML"""
-        if not shape.text.strip():
+        if self.fast_text:
+            paragraphs_html = self._convert_paragraphs_xml(shape)
+        else:
+            paragraphs_html = self._convert_paragraphs(shape)
+
+        if not paragraphs_html:
             return ""
             
+        return f'<div id="{element_id}" style="position: absolute; {self._get_shape_position(shape)}; {animation_style}">\n' + \
+               '\n'.join(paragraphs_html) + \
+               '</div>'
+
+    def _convert_paragraphs(self, shape):
+        """ממיר את פסקאות מסגרת הטקסט דרך אובייקטי python-pptx"""
+        if not shape.text.strip():
+            return []
+            
         text_frame = shape.text_frame
         paragraphs_html = []
         
@@ -555,82 +712,86 @@ window.addEventListener('message', function(e) {
             if not paragraph.text.strip():
                 continue
                 
-            p_style = self._get_paragraph_style(paragraph)
-            p_html = f'<p style="{p_style}">'
+            p_class = self._get_style_class(self._get_paragraph_style(paragraph))
+            p_html = f'<p class="{p_class}">'
             
             for run in paragraph.runs:
                 if not run.text.strip():
                     continue
                     
-                run_style = self._get_run_style(run)
-                run_html = f'<span style="{run_style}">{run.text}</span>'
+                run_class = self._get_style_class(self._get_run_style(run))
+                if run_class:
+                    run_html = f'<span class="{run_class}">{run.text}</span>'
+                else:
+                    run_html = f'<span>{run.text}</span>'
                 p_html += run_html
                 
             p_html += '</p>'
             paragraphs_html.append(p_html)
-            
-        if not paragraphs_html:
-            return ""
-            
-        return f'<div id="{element_id}" style="position: absolute; {self._get_shape_position(shape)}; {animation_style}">\n' + \
-               '\n'.join(paragraphs_html) + \
-               '</div>'
+
+        return paragraphs_html
+
+    def _convert_paragraphs_xml(self, shape):
+        """ממיר את פסקאות מסגרת הטקסט במעבר אחד על ה-XML - אותו פלט כמו _convert_paragraphs"""
+        tx_body = text.text_body(shape.element)
+        if tx_body is None:
+            return []
+
+        paragraphs_html = []
+        for p in text.paragraphs(tx_body):
+            if not text.paragraph_text(p).strip():
+                continue
+
+            parts = [f'<p class="{self._get_style_class(text.get_paragraph_style(p))}">']
+            for run_text, r_pr in text.runs(p):
+                if not run_text.strip():
+                    continue
+
+                run_class = self._get_style_class(text.get_run_style(r_pr))
+                if run_class:
+                    parts.append(f'<span class="{run_class}">{run_text}</span>')
+                else:
+                    parts.append(f'<span>{run_text}</span>')
+
+            parts.append('</p>')
+            paragraphs_html.append(''.join(parts))
+
+        return paragraphs_html
+
+    def _get_style_class(self, style):
+        """מחזיר את שם המחלקה של סגנון טקסט (או '' לסגנון ריק) ורושם אותו בשקופית"""
+        if not style:
+            return ''
+        return self._slide_styles.intern(style)
 
     def _get_paragraph_style(self, paragraph):
         """מחזיר את הסגנון של פסקה"""
-        styles = []
-        
-        # יישור טקסט
-        alignment = {
-            0: 'right',  # RIGHT
-            1: 'left',   # LEFT
-            2: 'center', # CENTER
-            3: 'justify' # JUSTIFY
-        }
-        styles.append(f"text-align: {alignment.get(paragraph.alignment, 'right')}")
-        
-        # מרווח בין שורות
-        if paragraph.line_spacing:
-            styles.append(f"line-height: {paragraph.line_spacing}")
-            
-        # מרווח לפני ואחרי
-        if paragraph.space_before:
-            styles.append(f"margin-top: {paragraph.space_before.pt}pt")
-        if paragraph.space_after:
-            styles.append(f"margin-bottom: {paragraph.space_after.pt}pt")
-            
-        return '; '.join(styles)
+        space_before = paragraph.space_before
+        space_after = paragraph.space_after
+        return text.paragraph_style(
+            paragraph.alignment,
+            paragraph.line_spacing,
+            space_before.pt if space_before else None,
+            space_after.pt if space_after else None,
+        )
 
     def _get_run_style(self, run):
         """מחזיר את הסגנון של קטע טקסט"""
-        styles = []
-        
-        # גופן
-        if run.font.name:
-            styles.append(f"font-family: '{run.font.name}'")
-            
-        # גודל
-        if run.font.size:
-            styles.append(f"font-size: {run.font.size.pt}pt")
-            
-        # צבע
-        if run.font.color.rgb:
-            rgb = run.font.color.rgb
-            styles.append(f"color: rgb({rgb[0]}, {rgb[1]}, {rgb[2]})")
-            
-        # מודגש
-        if run.font.bold:
-            styles.append("font-weight: bold")
-            
-        # נטוי
-        if run.font.italic:
-            styles.append("font-style: italic")
-            
-        # קו תחתון
-        if run.font.underline:
-            styles.append("text-decoration: underline")
-            
-        return '; '.join(styles)
+        from pptx.enum.dml import MSO_COLOR_TYPE
+
+        font = run.font
+        size = font.size
+        # רק לצבע RGB מפורש יש ערך rgb - צבע ערכת נושא או צבע שלא הוגדר זורקים חריגה
+        color = font.color
+        rgb = color.rgb if color.type == MSO_COLOR_TYPE.RGB else None
+        return text.run_style(
+            font.name,
+            size.pt if size else None,
+            rgb,
+            font.bold,
+            font.italic,
+            font.underline,
+        )
 
     def _get_shape_position(self, shape):
         """מחזיר את מיקום הצורה"""
@@ -650,11 +811,7 @@ window.addEventListener('message', function(e) {
             width = shape.width / 914400 * 96
             height = shape.height / 914400 * 96
             
-            # המרת התמונה ל-base64
-            image = shape.image
-            image_bytes = image.blob
-            image_base64 = base64.b64encode(image_bytes).decode()
-            content_type = image.content_type or 'image/png'
+            image_src = self._get_image_src(shape.image, width, height)
             
             style = f"""
                 position: absolute;
@@ -670,7 +827,7 @@ window.addEventListener('message', function(e) {
                 <img 
                     class="image" 
                     id="{element_id}" 
-                    src="data:{content_type};base64,{image_base64}"
+                    src="{image_src}"
                     style="{style}"
                     alt="תמונה במצגת"
                 />
@@ -679,79 +836,69 @@ window.addEventListener('message', function(e) {
             print(f"שגיאה בהמרת תמונה: {str(e)}")
             return ''
 
-    def _convert_shape(self, shape, element_id="", animation_style=""):
-        """ממיר צורה ל-HTML"""
-        # המרת מיקום וגודל מEMU ל-פיקסלים
-        left = shape.left / 914400 * 96
-        top = shape.top / 914400 * 96
-        width = shape.width / 914400 * 96
-        height = shape.height / 914400 * 96
-        
-        # חילוץ צבע הרקע
-        fill_color = "transparent"
-        if hasattr(shape.fill, 'fore_color') and shape.fill.fore_color:
-            color = shape.fill.fore_color
-            if hasattr(color, 'rgb'):
-                rgb = color.rgb
-                fill_color = f"rgb({rgb[0]}, {rgb[1]}, {rgb[2]})"
-        
-        # חילוץ צבע המסגרת
-        border_color = "none"
-        border_width = "0"
-        if shape.line:
-            if hasattr(shape.line, 'color') and shape.line.color:
-                color = shape.line.color
-                if hasattr(color, 'rgb'):
-                    rgb = color.rgb
-                    border_color = f"rgb({rgb[0]}, {rgb[1]}, {rgb[2]})"
-            if hasattr(shape.line, 'width'):
-                border_width = f"{shape.line.width / 914400 * 96:.2f}px"
-        
-        style = f"""
-            position: absolute;
-            left: {left:.2f}px;
-            top: {top:.2f}px;
-            width: {width:.2f}px;
-            height: {height:.2f}px;
-            background-color: {fill_color};
-            border: {border_width} solid {border_color};
-            border-radius: {self._get_shape_radius(shape)};
-            {animation_style}
+    def _get_image_src(self, image, width, height):
+        """מחזיר את כתובת התמונה - קובץ חיצוני במצב extract_assets, אחרת data URI"""
+        blob, ext, content_type = image.blob, image.ext, image.content_type
+
+        # הקטנה לגודל התצוגה (width/height בפיקסלים) והמרה לפורמט מודרני
+        if self._image_optimizer is not None:
+            optimized = self._image_optimizer.optimize(blob, ext, width, height)
+            if optimized is not None:
+                blob, ext, content_type = optimized
+
+        if self._asset_store is not None:
+            url = self._asset_store.add(blob, ext)
+            self._slide_assets.append(url)
+            return url
+
+        # המרת התמונה ל-base64
+        image_base64 = base64.b64encode(blob).decode()
+        content_type = content_type or 'image/png'
+        return f"data:{content_type};base64,{image_base64}"
+
+    def _convert_geometry(self, shape, element_id, animation_style, index, text_frame=False):
         """
-        
-        return f'<div class="shape" id="{element_id}" style="{style}"></div>'
+        ממיר את הגיאומטריה של צורה ומודד אותה כ-autoshape רק כשנוצר לה HTML.
+        בצורה בלי גיאומטריה הזמן נרשם לשלב convert_shape ללא סוג צורה, ובתיבת
+        טקסט (text_frame=True) - ל-text_frame, בלי קריאה נוספת (הטקסט נמדד בנפרד)
+        """
+        if self._instrumentation is None:
+            return self._convert_shape(shape, element_id, animation_style)
+
+        start = time.perf_counter()
+        html = self._convert_shape(shape, element_id, animation_style)
+        seconds = time.perf_counter() - start
+        if html:
+            self._instrumentation.add('convert_shape', seconds, index, 'autoshape')
+        elif text_frame:
+            self._instrumentation.add('convert_text_frame', seconds, index, 'text_frame', calls=0)
+        else:
+            self._instrumentation.add('convert_shape', seconds, index)
+        return html
 
-    def _get_shape_radius(self, shape):
-        """מחזיר את רדיוס הפינות של הצורה"""
-        try:
-            # אם זה מלבן מעוגל
-            if hasattr(shape, 'adjustment_values') and shape.adjustment_values:
-                return min(shape.width, shape.height) * shape.adjustment_values[0] / 100000
-        except:
-            pass
-        return 0
+    def _convert_shape(self, shape, element_id="", animation_style=""):
+        """ממיר צורה ל-SVG - סמל בספרייט של הדף ו-<use> שממקם אותו"""
+        return self.shape_handler.convert_shape(shape, self._slide_symbols, element_id, animation_style)
 
     def generate_embed_code(self, html_path, width="100%", height="600px", responsive=True):
-        """יוצר קוד להטמעה עבור Wix"""
+        """
+        יוצר קוד להטמעה עבור Wix, לגרסת ההטמעה שנכתבה בהמרה (embed=True)
+
+        Returns:
+            tuple: (נתיב קובץ קוד ההטמעה, נתיב גרסת ההטמעה)
+        """
         try:
-            # קריאת תוכן ה-HTML
-            with open(html_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # יצירת גרסה מותאמת להטמעה
-            embed_content = self._modify_for_embed(content)
-            
-            # שמירת הגרסה להטמעה
-            embed_path = html_path.replace('.html', '_embed.html')
-            with open(embed_path, 'w', encoding='utf-8') as f:
-                f.write(embed_content)
-            
+            embed_file = embed_path(html_path)
+            if not embed_file.exists():
+                raise FileNotFoundError(
+                    f"גרסת ההטמעה {embed_file.name} לא נמצאה - יש להמיר עם embed=True")
+
             # יצירת קוד ההטמעה
             iframe_code = f'''
 <!-- קוד להטמעת המצגת -->
 <div class="presentation-container" style="position: relative; width: {width};">
     <iframe 
-        src="{os.path.basename(embed_path)}"
+        src="{quote(embed_file.name)}"
         style="width: 100%; height: {height}; border: none; overflow: hidden;"
         allowfullscreen="true"
         loading="lazy"
@@ -772,55 +919,12 @@ window.addEventListener('message', function(e) {{
 '''
             
             # שמירת קוד ההטמעה לקובץ
-            embed_code_path = html_path.replace('.html', '_embed_code.txt')
+            embed_code_path = Path(html_path).with_name(f"{Path(html_path).stem}_embed_code.txt")
             with open(embed_code_path, 'w', encoding='utf-8') as f:
                 f.write(iframe_code)
             
-            return embed_code_path, embed_path
+            return str(embed_code_path), str(embed_file)
             
         except Exception as e:
             logger.error(f"שגיאה ביצירת קוד להטמעה: {str(e)}")
             raise
-
-    def _modify_for_embed(self, content):
-        """מתאים את ה-HTML להטמעה"""
-        # הוספת קוד JavaScript להתאמת גובה
-        resize_script = """
-<script>
-function updateParentHeight() {{
-    const height = document.documentElement.scrollHeight;
-    window.parent.postMessage({{
-        type: 'resize',
-        height: height
-    }}, '*');
-}}
-
-// עדכון בטעינה ובשינוי גודל
-window.addEventListener('load', updateParentHeight);
-window.addEventListener('resize', updateParentHeight);
-
-// עדכון בשינוי שקופית
-document.addEventListener('DOMContentLoaded', () => {{
-    const slides = document.querySelectorAll('.slide');
-    const observer = new MutationObserver(updateParentHeight);
-    
-    slides.forEach(slide => {{
-        observer.observe(slide, {{
-            attributes: true,
-            attributeFilter: ['style']
-        }});
-    }});
-}});
-</script>
-"""
-        # הוספת הסקריפט לפני סגירת תג body
-        content = content.replace('</body>', f'{resize_script}</body>')
-        
-        # הוספת מטא תגים להטמעה בטוחה
-        meta_tags = """
-    <meta http-equiv="X-Frame-Options" content="SAMEORIGIN">
-    <meta http-equiv="Content-Security-Policy" content="frame-ancestors 'self' *.wix.com">
-"""
-        content = content.replace('</head>', f'{meta_tags}</head>')
-        
-        return content
@@ -0,0 +1,22 @@
+"""
+אירועי ההמרה שנשלחים ל-observer של PowerPointConverter.convert / write_html.
+
+כל אירוע הוא מילון עם השדות 'event' (סוג האירוע, מהקבועים כאן) ו-'elapsed'
+(שניות מתחילת ההמרה), ובנוסף השדות של סוג האירוע:
+
+    deck_opened     path, slide_count
+    slide_started   index, total
+    slide_finished  index, total, seconds, cached
+    asset_written   url, path, bytes - פעם אחת לכל קובץ חיצוני שהפלט מפנה אליו
+    render_done     slides, seconds
+    file_written    path, bytes - קובץ ה-HTML, קבצי השקופיות במצבי 'lazy' ו-'split'
+                    וקבצי הדחיסה (precompress)
+
+המילונים ניתנים להמרה ל-JSON, כך שכלי אצווה יכולים לכתוב אותם כשורות יומן.
+"""
+DECK_OPENED = 'deck_opened'
+SLIDE_STARTED = 'slide_started'
+SLIDE_FINISHED = 'slide_finished'
+ASSET_WRITTEN = 'asset_written'
+RENDER_DONE = 'render_done'
+FILE_WRITTEN = 'file_written'
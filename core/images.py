@@ -0,0 +1,121 @@
+"""הקטנת תמונות לגודל התצוגה והמרתן לפורמטים מודרניים (WebP / AVIF)"""
+import hashlib
+import logging
+import math
+from collections import OrderedDict
+from io import BytesIO
+
+from PIL import Image, ImageOps, features
+
+logger = logging.getLogger(__name__)
+
+# פורמטים וקטוריים - אין טעם להקטין או להמיר אותם
+VECTOR_EXTENSIONS = {'svg', 'wmf', 'emf', 'wmz', 'emz'}
+
+# סוג התוכן של כל פורמט פלט
+CONTENT_TYPES = {
+    'webp': 'image/webp',
+    'avif': 'image/avif',
+    'png': 'image/png',
+    'jpeg': 'image/jpeg',
+}
+
+
+class ImageOptimizer:
+    """
+    מקטין כל תמונה לגודל שבו היא מוצגת (כפול יחס הפיקסלים של המסך) ומקודד אותה
+    מחדש ב-WebP או AVIF. הפורמט המקורי נשמר כשהוא קטן יותר, ותמונות וקטוריות או
+    מונפשות עוברות ללא שינוי. התוצאות נשמרות במטמון לפי גיבוב המקור ופרמטרי היעד.
+    """
+
+    def __init__(self, image_format='webp', quality=80, dpr=2.0, cache_size=256):
+        """
+        Args:
+            image_format (str): פורמט היעד - 'webp' או 'avif'
+            quality (int): איכות הקידוד (1-100)
+            dpr (float): יחס פיקסלים של המסך - התמונה תוקטן לגודל התצוגה כפול יחס זה
+            cache_size (int): מספר התוצאות המקסימלי שנשמרות במטמון
+        """
+        if image_format == 'avif' and not features.check('avif'):
+            logger.warning("Pillow הותקן ללא תמיכה ב-AVIF - משתמש ב-WebP")
+            image_format = 'webp'
+        self.image_format = image_format
+        self.quality = quality
+        self.dpr = dpr
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+
+    def optimize(self, blob, ext, width, height):
+        """
+        מחזיר גרסה מותאמת של התמונה לתצוגה בגודל הנתון
+
+        Args:
+            blob (bytes): תוכן התמונה המקורי
+            ext (str): סיומת הפורמט המקורי, למשל 'png'
+            width (float): רוחב התצוגה בפיקסלים
+            height (float): גובה התצוגה בפיקסלים
+
+        Returns:
+            tuple: (תוכן, סיומת, סוג תוכן), או None כשיש להשאיר את התמונה המקורית
+        """
+        ext = ext.lower()
+        target = (max(1, math.ceil(width * self.dpr)), max(1, math.ceil(height * self.dpr)))
+        key = (hashlib.sha256(blob).hexdigest(), ext, target, self.image_format, self.quality)
+
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        try:
+            result = self._optimize(blob, ext, target)
+        except Exception as e:
+            logger.debug(f"לא ניתן לעבד את התמונה: {str(e)}")
+            result = None
+
+        self._cache[key] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return result
+
+    def _optimize(self, blob, ext, target):
+        """מבצע את ההקטנה וההמרה; מחזיר None כשיש להשאיר את המקור"""
+        if ext in VECTOR_EXTENSIONS:
+            return None
+
+        image = Image.open(BytesIO(blob))
+        if getattr(image, 'is_animated', False):
+            return None
+
+        source_format = 'jpeg' if image.format == 'JPEG' else 'png'
+        # סיבוב לפי תג ה-Orientation של EXIF לפני חישוב הגודל - הקידוד מחדש אינו
+        # שומר את התג, ותמונה שצולמה לאורך הייתה מוצגת על הצד
+        image = ImageOps.exif_transpose(image)
+        resized = image.width > target[0] or image.height > target[1]
+        if resized:
+            # התמונה מוצגת ב-object-fit: contain, ולכן מתאימים אותה לתוך התיבה
+            image.thumbnail(target, Image.LANCZOS)
+
+        candidates = [(self._encode(image, self.image_format), self.image_format)]
+        if resized:
+            # גם הפורמט המקורי בגודל החדש עשוי להיות הקטן ביותר (למשל גרפיקה שטוחה ב-PNG)
+            candidates.append((self._encode(image, source_format), source_format))
+
+        data, fmt = min(candidates, key=lambda candidate: len(candidate[0]))
+        if len(data) >= len(blob):
+            return None
+        return data, 'jpg' if fmt == 'jpeg' else fmt, CONTENT_TYPES[fmt]
+
+    def _encode(self, image, fmt):
+        """מקודד את התמונה בפורמט הנתון"""
+        if fmt == 'jpeg':
+            image = image.convert('RGB')
+        elif image.mode not in ('RGB', 'RGBA'):
+            has_alpha = image.mode in ('LA', 'PA') or 'transparency' in image.info
+            image = image.convert('RGBA' if has_alpha else 'RGB')
+
+        out = BytesIO()
+        if fmt == 'png':
+            image.save(out, 'PNG', optimize=True)
+        else:
+            image.save(out, fmt.upper(), quality=self.quality)
+        return out.getvalue()
@@ -0,0 +1,109 @@
+"""מדידת זמנים לפי שלב, שקופית וסוג צורה במהלך ההמרה"""
+import json
+from contextlib import nullcontext
+from time import perf_counter
+
+# מוחזר כשהמדידה כבויה - אותו אובייקט בכל קריאה, ללא עלות מעבר לקריאה עצמה
+NULL_MEASURE = nullcontext()
+
+
+class _Measure:
+    """מודד בלוק קוד אחד ומוסיף את הזמן לרושם"""
+    __slots__ = ('recorder', 'stage', 'slide', 'shape_type', 'start')
+
+    def __init__(self, recorder, stage, slide, shape_type):
+        self.recorder = recorder
+        self.stage = stage
+        self.slide = slide
+        self.shape_type = shape_type
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.recorder.add(self.stage, perf_counter() - self.start, self.slide, self.shape_type)
+        return False
+
+
+def _add(table, key, seconds, calls=1):
+    entry = table.get(key)
+    if entry is None:
+        table[key] = [seconds, calls]
+    else:
+        entry[0] += seconds
+        entry[1] += calls
+
+
+def _as_dict(table):
+    return {key: {'seconds': round(seconds, 6), 'calls': calls} for key, (seconds, calls) in table.items()}
+
+
+class Instrumentation:
+    """
+    רושם זמן מצטבר ומספר קריאות לכל שלב בהמרה: בסך הכל, לכל שקופית (לפי אינדקס)
+    ולכל סוג צורה. הממיר יוצר רושם כזה רק כשהמדידה מופעלת.
+    """
+
+    def __init__(self):
+        self.stages = {}
+        self.slides = {}
+        self.shape_types = {}
+
+    def measure(self, stage, slide=None, shape_type=None):
+        """מחזיר context manager שמודד את הבלוק שבתוכו"""
+        return _Measure(self, stage, slide, shape_type)
+
+    def add(self, stage, seconds, slide=None, shape_type=None, calls=1):
+        """מוסיף מדידה לשלב, ולשקופית ולסוג הצורה אם צוינו"""
+        _add(self.stages, stage, seconds, calls)
+        if slide is not None:
+            _add(self.slides.setdefault(slide, {}), stage, seconds, calls)
+        if shape_type is not None:
+            _add(self.shape_types, shape_type, seconds, calls)
+
+    def to_state(self):
+        """מצב גולמי שניתן להעביר בין תהליכים"""
+        return {'stages': self.stages, 'slides': self.slides, 'shape_types': self.shape_types}
+
+    def merge(self, state):
+        """ממזג מדידות שנרשמו בתהליך אחר"""
+        for stage, (seconds, calls) in state['stages'].items():
+            _add(self.stages, stage, seconds, calls)
+        for slide, stages in state['slides'].items():
+            for stage, (seconds, calls) in stages.items():
+                _add(self.slides.setdefault(slide, {}), stage, seconds, calls)
+        for shape_type, (seconds, calls) in state['shape_types'].items():
+            _add(self.shape_types, shape_type, seconds, calls)
+
+    def report(self, total_seconds=None):
+        """מחזיר דוח מובנה של כל המדידות"""
+        return InstrumentationReport(
+            stages=_as_dict(self.stages),
+            slides={index: _as_dict(stages) for index, stages in sorted(self.slides.items())},
+            shape_types=_as_dict(self.shape_types),
+            total_seconds=total_seconds,
+        )
+
+
+class InstrumentationReport:
+    """דוח זמנים של המרה אחת"""
+
+    def __init__(self, stages, slides, shape_types, total_seconds=None):
+        self.stages = stages
+        self.slides = slides
+        self.shape_types = shape_types
+        self.total_seconds = total_seconds
+
+    def to_dict(self):
+        return {
+            'total_seconds': None if self.total_seconds is None else round(self.total_seconds, 6),
+            'stages': self.stages,
+            'shape_types': self.shape_types,
+            'slides': {str(index): stages for index, stages in self.slides.items()},
+        }
+
+    def save_json(self, path):
+        """שומר את הדוח כקובץ JSON"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
@@ -0,0 +1,216 @@
+"""
+הקטנת הפלט (minification) בזמן הכתיבה: כיווץ רווחים ב-HTML ובמאפייני style,
+והקטנת בלוקי ה-CSS וה-JS.
+
+כל השינויים שומרים על ה-DOM המוצג: רצף רווחים בין תגיות מוצג כרווח אחד ולכן
+מכווץ לתו אחד, ורווחים בתוך מחרוזות (CSS, JS ו-template literals) נשמרים כמו
+שהם. ב-JS נשמרים גם מעברי השורה, כך שאין תלות בהכנסת נקודה-פסיק אוטומטית.
+השקילות נבדקת ב-python -m benchmarks.minify.
+"""
+import re
+from functools import lru_cache
+
+# בלוקי style/script - התוכן שלהם מוקטן בנפרד ולא מטופל ככיווץ HTML
+_BLOCK = re.compile(r'(<(style|script)\b[^>]*>)(.*?)(</\2>)', re.S | re.I)
+# בלוקי script של נתונים (JSON) - לא קוד, נשארים כמו שהם
+_DATA_SCRIPT = re.compile(r'type="application/(ld\+)?json"', re.I)
+_TAG = re.compile(r'<[a-zA-Z][^>]*>')
+_TAG_TOKEN = re.compile(r'''"[^"]*"|'[^']*'|\s+''')
+_STYLE_ATTR = re.compile(r'style="([^"]*)"')
+_BETWEEN_TAGS = re.compile(r'>(\s+)<')
+_WHITESPACE = re.compile(r'\s+')
+
+_CSS_TOKEN = re.compile(r'''("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|/\*.*?\*/''', re.S)
+_CSS_PUNCTUATION = re.compile(r'\s*([{};,>])\s*')
+_CSS_COLON = re.compile(r':\s+')
+
+# תווים שאחריהם '/' פותח ביטוי רגולרי ולא חילוק
+_REGEX_PREFIX = set('(,=:[!&|?{};+-*%<>~^')
+
+
+def _collapse(whitespace):
+    """רצף רווחים -> מעבר שורה אחד (אם היה בו מעבר שורה) או רווח אחד"""
+    return '\n' if '\n' in whitespace else ' '
+
+
+def style(value):
+    """
+    מכווץ ערך של מאפיין style
+
+    Args:
+        value (str): הסגנון, לרוב f-string רב-שורות
+    """
+    declarations = []
+    for declaration in _WHITESPACE.sub(' ', value).split(';'):
+        name, colon, value = declaration.partition(':')
+        # רק הרווחים סביב הנקודתיים שאחרי שם המאפיין - הערך עצמו נשמר
+        declaration = f"{name.strip()}{colon}{value.strip()}"
+        if declaration:
+            declarations.append(declaration)
+    return ';'.join(declarations)
+
+
+def _tag(match):
+    """מכווץ את הרווחים בין המאפיינים של תגית, בלי לגעת בערכים"""
+    tag = _TAG_TOKEN.sub(lambda token: ' ' if token.group().isspace() else token.group(), match.group())
+    tag = _STYLE_ATTR.sub(lambda attr: f'style="{style(attr.group(1))}"', tag)
+    return tag.replace(' >', '>').replace(' />', '/>')
+
+
+def _markup(text):
+    """כיווץ HTML ללא בלוקי style/script"""
+    text = _TAG.sub(_tag, text)
+    text = _BETWEEN_TAGS.sub(lambda match: f'>{_collapse(match.group(1))}<', text)
+    # רווחים בקצוות החלק (הגבול בין שקופיות) - גם הם בין תגיות
+    stripped = text.strip()
+    if not stripped:
+        return _collapse(text) if text else text
+    head = text[:len(text) - len(text.lstrip())]
+    tail = text[len(text.rstrip()):]
+    return (_collapse(head) if head else '') + stripped + (_collapse(tail) if tail else '')
+
+
+def html(text):
+    """
+    מקטין חלק של מסמך HTML: כיווץ רווחים בין תגיות ובתוך תגיות, כיווץ מאפייני
+    style, והקטנת התוכן של בלוקי <style> ו-<script>.
+    החלק צריך להתחיל ולהסתיים בגבול בין תגיות - כמו החלקים שהממיר כותב.
+    """
+    parts = []
+    position = 0
+    for match in _BLOCK.finditer(text):
+        parts.append(_markup(text[position:match.start()]))
+        open_tag, name, body, close_tag = match.groups()
+        if open_tag.lower().startswith('<style'):
+            body = css(body)
+        elif body.strip() and not _DATA_SCRIPT.search(open_tag):
+            body = js(body)
+        parts.append(f"{_markup(open_tag)}{body}{close_tag}")
+        position = match.end()
+    parts.append(_markup(text[position:]))
+    return ''.join(parts)
+
+
+@lru_cache(maxsize=32)
+def css(text):
+    """
+    מקטין CSS: הסרת הערות ורווחים מיותרים. מחרוזות נשמרות כמו שהן.
+    התוצאה נשמרת במטמון - ה-CSS של התבנית זהה בכל המרה.
+    """
+    parts = []
+    position = 0
+    for match in _CSS_TOKEN.finditer(text):
+        parts.append(_css_code(text[position:match.start()]))
+        if match.group(1):
+            parts.append(match.group(1))
+        position = match.end()
+    parts.append(_css_code(text[position:]))
+    return ''.join(parts).strip().replace(';}', '}')
+
+
+def _css_code(code):
+    """כיווץ קטע CSS ללא מחרוזות והערות"""
+    code = _WHITESPACE.sub(' ', code)
+    code = _CSS_PUNCTUATION.sub(r'\1', code)
+    return _CSS_COLON.sub(':', code)
+
+
+@lru_cache(maxsize=32)
+def js(text):
+    """
+    מקטין JavaScript בזהירות: הסרת הערות, הזחה ושורות ריקות, וכיווץ רווחים.
+    מחרוזות, template literals וביטויים רגולריים נשמרים כמו שהם, ומעברי השורה
+    נשארים במקומם.
+    """
+    out = []
+    i = 0
+    length = len(text)
+    previous = ''  # התו המשמעותי האחרון שנכתב - לזיהוי ביטוי רגולרי
+
+    while i < length:
+        char = text[i]
+        following = text[i + 1] if i + 1 < length else ''
+
+        if char in '\'"`':
+            end = _string_end(text, i, char)
+            out.append(text[i:end])
+            previous = char
+            i = end
+        elif char == '/' and following == '/':
+            while i < length and text[i] != '\n':
+                i += 1
+        elif char == '/' and following == '*':
+            end = text.find('*/', i + 2)
+            i = length if end == -1 else end + 2
+            # הערה בין שתי מילים שקולה לרווח
+            _js_space(out, ' ')
+        elif char == '/' and (not previous or previous in _REGEX_PREFIX):
+            end = _regex_end(text, i)
+            out.append(text[i:end])
+            previous = '/'
+            i = end
+        elif char.isspace():
+            end = i
+            while end < length and text[end].isspace():
+                end += 1
+            _js_space(out, _collapse(text[i:end]))
+            i = end
+        else:
+            out.append(char)
+            previous = char
+            i += 1
+
+    while out and out[-1] in (' ', '\n'):
+        out.pop()
+    return ''.join(out)
+
+
+def _js_space(out, space):
+    """
+    מוסיף רווח או מעבר שורה לפלט ה-JS: בלי רווחים בקצוות השורות, בלי שורות
+    ריקות ובלי רווחים כפולים
+    """
+    if not out or out[-1] == '\n':
+        return
+    if out[-1] == ' ':
+        if space == ' ':
+            return
+        out.pop()
+        if not out or out[-1] == '\n':
+            return
+    out.append(space)
+
+
+def _string_end(text, start, quote):
+    """המיקום שאחרי סוף המחרוזת שמתחילה ב-start"""
+    i = start + 1
+    while i < len(text):
+        if text[i] == '\\':
+            i += 2
+            continue
+        if text[i] == quote:
+            return i + 1
+        i += 1
+    return len(text)
+
+
+def _regex_end(text, start):
+    """המיקום שאחרי סוף הביטוי הרגולרי (כולל הדגלים) שמתחיל ב-start"""
+    i = start + 1
+    in_class = False
+    while i < len(text) and text[i] != '\n':
+        char = text[i]
+        if char == '\\':
+            i += 2
+            continue
+        if char == '[':
+            in_class = True
+        elif char == ']':
+            in_class = False
+        elif char == '/' and not in_class:
+            i += 1
+            while i < len(text) and text[i].isalpha():
+                i += 1
+            return i
+        i += 1
+    return i
@@ -0,0 +1,92 @@
+"""המרה מקבילית של שקופיות במאגר תהליכים"""
+import math
+import os
+
+# במצגות קטנות מזה עלות הפעלת התהליכים גבוהה מהחיסכון
+MIN_PARALLEL_SLIDES = 16
+
+# מספר הקבוצות לכל תהליך: קבוצות קטנות מאפשרות לעצור מהר בביטול, והמצגת
+# נפתחת רק פעם אחת בכל תהליך
+GROUPS_PER_WORKER = 4
+
+# המצגת והממיר של תהליך העבודה - נשמרים בין הקבוצות של אותה המרה
+_worker_state = {}
+
+
+def resolve_workers(workers):
+    """מחזיר את מספר התהליכים בפועל (None או 0 = לפי מספר המעבדים)"""
+    if not workers or workers < 0:
+        return os.cpu_count() or 1
+    return workers
+
+
+def split_indices(indices, workers, groups_per_worker=1):
+    """מחלק את אינדקסי השקופיות לקבוצות רציפות וזרות, groups_per_worker לכל תהליך"""
+    size = max(1, math.ceil(len(indices) / (workers * groups_per_worker)))
+    return [indices[start:start + size] for start in range(0, len(indices), size)]
+
+
+def _convert_slide_group(source, indices, options, output_dir, instrument):
+    """
+    רץ בתהליך נפרד: ממיר את השקופיות שבאינדקסים הנתונים. החבילה נפתחת בקבוצה
+    הראשונה של התהליך ונשמרת לקבוצות הבאות שלו.
+    מחזיר את השקופיות ואת מצב המדידות (או None כשהמדידה כבויה).
+    """
+    from pptx import Presentation
+    from .converter import PowerPointConverter
+    from .instrumentation import Instrumentation
+
+    stat = os.stat(source)
+    key = (source, stat.st_mtime_ns, stat.st_size, repr(sorted(options.items())), output_dir)
+    instrumentation = Instrumentation() if instrument else None
+    if _worker_state.get('key') != key:
+        converter = PowerPointConverter(**options)
+        converter._use_output_dir(output_dir)
+        converter._instrumentation = instrumentation
+        with converter._measure('load'):
+            slides = list(Presentation(source).slides)
+        _worker_state.update(key=key, converter=converter, slides=slides)
+    converter, slides = _worker_state['converter'], _worker_state['slides']
+    converter._instrumentation = instrumentation
+
+    converted = [converter._convert_slide(slides[index], index) for index in indices]
+
+    state = converter._instrumentation.to_state() if instrument else None
+    return converted, state
+
+
+def convert_slides_parallel(source, indices, workers, options, output_dir=None, instrumentation=None):
+    """
+    ממיר שקופיות במקביל ומחזיר אותן לפי הסדר המקורי
+
+    Args:
+        source (str): נתיב לקובץ PowerPoint (כל תהליך פותח אותו בעצמו)
+        indices (list): אינדקסי השקופיות להמרה, בסדר עולה
+        workers (int): מספר התהליכים
+        options (dict): פרמטרים לבניית PowerPointConverter בכל תהליך
+        output_dir (str, optional): תיקיית הפלט (עבור נכסים חיצוניים)
+        instrumentation (Instrumentation, optional): רושם שאליו ממוזגות מדידות התהליכים
+
+    Yields:
+        dict: תוצאת _convert_slide לכל שקופית, לפי הסדר
+
+    כשהמחולל נסגר לפני הסוף (למשל בביטול) הקבוצות שטרם התחילו מבוטלות, ואין
+    המתנה לקבוצות שכבר רצות.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    groups = split_indices(list(indices), workers, GROUPS_PER_WORKER)
+    pool = ProcessPoolExecutor(max_workers=min(workers, len(groups)))
+    try:
+        futures = [
+            pool.submit(_convert_slide_group, source, group, options, output_dir,
+                        instrumentation is not None)
+            for group in groups
+        ]
+        for future in futures:
+            converted, state = future.result()
+            if instrumentation is not None:
+                instrumentation.merge(state)
+            yield from converted
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,53 @@
+"""טעינת תבניות ה-HTML דרך סביבת Jinja משותפת לכל ההמרות בתהליך"""
+import os
+from pathlib import Path
+
+TEMPLATES_DIR = Path(__file__).parent / 'templates'
+
+# משתנה סביבה להפעלת מטמון בייטקוד על הדיסק (שמירת התבניות המהודרות בין הרצות)
+BYTECODE_CACHE_ENV = 'PPTX2HTML_TEMPLATE_CACHE'
+
+_environment = None
+
+
+def _create_environment(bytecode_cache_dir=None):
+    """יוצר סביבת Jinja עם מטמון תבניות מהודרות ומטמון בייטקוד אופציונלי"""
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+    bytecode_cache = None
+    if bytecode_cache_dir:
+        Path(bytecode_cache_dir).mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(str(bytecode_cache_dir))
+
+    return Environment(
+        loader=FileSystemLoader(str(TEMPLATES_DIR)),
+        bytecode_cache=bytecode_cache,
+        # התבניות מגיעות עם החבילה ואינן משתנות בזמן ריצה - אין צורך לבדוק אותן מחדש
+        auto_reload=False,
+        trim_blocks=True,
+        keep_trailing_newline=True,
+    )
+
+
+def get_environment():
+    """מחזיר את סביבת ה-Jinja המשותפת (נוצרת בשימוש הראשון)"""
+    global _environment
+    if _environment is None:
+        _environment = _create_environment(os.environ.get(BYTECODE_CACHE_ENV))
+    return _environment
+
+
+def enable_bytecode_cache(directory):
+    """
+    מפעיל מטמון בייטקוד על הדיסק, כך שגם תהליך חדש מדלג על הידור התבניות
+
+    Args:
+        directory (str): תיקייה לשמירת התבניות המהודרות
+    """
+    global _environment
+    _environment = _create_environment(directory)
+
+
+def get_template(name):
+    """מחזיר תבנית מהודרת - ההידור מתבצע פעם אחת בלבד לכל תהליך"""
+    return get_environment().get_template(name)
@@ -0,0 +1,360 @@
+"""
+שרת HTTP להמרת מצגות, מבוסס ספריית התקן בלבד.
+
+    python -m core.server --port 8000 --workers 4 --queue-size 16 --timeout 60
+
+    curl --data-binary @talk.pptx http://localhost:8000/convert > talk.html
+    curl --data-binary @talk.pptx "http://localhost:8000/convert?format=zip&name=talk" > talk.zip
+    curl http://localhost:8000/health
+
+ההמרות רצות במאגר תהליכים שמחומם מראש (python-pptx ו-Jinja כבר טעונים בכל
+תהליך). מספר הבקשות שבעבודה או ממתינות מוגבל - כשהתור מלא מוחזר 429, עוד
+לפני קריאת גוף הבקשה. בקשה שחורגת מהזמן מקבלת 504, ותהליך העבודה עוצר את
+ההמרה שלה לפני השקופית הבאה. תהליך עבודה שקרס שובר את המאגר - הבקשות שהיו בו
+מקבלות 503 והמאגר נבנה מחדש.
+"""
+import argparse
+import json
+import logging
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from . import __version__
+from .converter import ConversionCancelled
+
+logger = logging.getLogger(__name__)
+
+# ממיר אחד לכל תהליך עבודה - נוצר באתחול התהליך
+_converter = None
+_options = None
+
+
+class _Deadline:
+    """אובייקט ביטול לפי שעון: is_set() מחזיר True אחרי המועד (בשניות epoch)"""
+
+    def __init__(self, deadline):
+        self.deadline = deadline
+
+    def is_set(self):
+        return time.time() >= self.deadline
+
+
+def _init_worker(options):
+    """מאתחל תהליך עבודה: טוען את python-pptx ומהדר את התבניות מראש"""
+    global _converter, _options
+    import pptx  # noqa: F401
+    from .converter import PowerPointConverter
+    from .rendering import get_template
+
+    for name in ('head.html', 'slide.html', 'foot.html'):
+        get_template(name)
+    _options = options
+    _converter = PowerPointConverter(**options)
+
+
+def _warm():
+    """משימת חימום - מחזיקה את התהליך לרגע, כך שכל משימה כזו נשלחת לתהליך אחר"""
+    time.sleep(0.2)
+    return os.getpid()
+
+
+def _convert(data, bundle, name, deadline):
+    """
+    רץ בתהליך עבודה: ממיר מצגת מהזיכרון
+
+    Returns:
+        bytes: ה-HTML, או קובץ zip עם ה-HTML ותיקיית הנכסים כש-bundle=True
+    """
+    cancel = _Deadline(deadline)
+    if not bundle:
+        return _converter.convert_to_bytes(data, cancel=cancel)
+
+    from .converter import PowerPointConverter
+
+    # ממיר חדש לכל חבילה - מאגר הנכסים שלו קשור לתיקייה הזמנית של הבקשה
+    converter = PowerPointConverter(**{**_options, 'extract_assets': True})
+    output = BytesIO()
+    with tempfile.TemporaryDirectory(prefix='pptx2html-') as tmp:
+        converter.convert(data, str(Path(tmp) / f"{name}.html"), cancel=cancel)
+        with zipfile.ZipFile(output, 'w') as archive:
+            for path in sorted(Path(tmp).rglob('*')):
+                if path.is_file():
+                    arcname = path.relative_to(tmp).as_posix()
+                    # תמונות כבר דחוסות - דחיסה נוספת רק מאטה
+                    compression = zipfile.ZIP_DEFLATED if path.suffix in ('.html', '.js') else zipfile.ZIP_STORED
+                    archive.write(path, arcname, compress_type=compression)
+    return output.getvalue()
+
+
+class ConversionServer(ThreadingHTTPServer):
+    """
+    שרת HTTP שמעביר כל המרה למאגר תהליכים. תהליכוני הבקשות רק ממתינים לתוצאה,
+    ומספר ההמרות שבעבודה או בתור מוגבל ל-workers + queue_size.
+    """
+    daemon_threads = True
+
+    def __init__(self, address, workers=None, queue_size=16, timeout=60.0,
+                 max_bytes=100 * 1024 * 1024, options=None):
+        """
+        Args:
+            address (tuple): (כתובת, פורט)
+            workers (int, optional): מספר תהליכי ההמרה (ברירת מחדל: מספר המעבדים)
+            queue_size (int): מספר ההמרות שיכולות להמתין מעבר לאלה שבעבודה
+            timeout (float): זמן מקסימלי לבקשה בשניות, כולל ההמתנה בתור
+            max_bytes (int): גודל מקסימלי של קובץ מועלה
+            options (dict, optional): פרמטרים ל-PowerPointConverter
+        """
+        super().__init__(address, ConversionHandler)
+        self.workers = workers or os.cpu_count() or 1
+        self.capacity = self.workers + queue_size
+        self.request_timeout = timeout
+        self.max_bytes = max_bytes
+        self._slots = threading.BoundedSemaphore(self.capacity)
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._options = options or {}
+        self.restarts = 0
+        self.pool = self._create_pool()
+
+    def _create_pool(self):
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self._options,),
+        )
+
+    def _pool_broken(self):
+        # תכונה פרטית של ProcessPoolExecutor - מסומנת כשתהליך עבודה מת
+        return bool(getattr(self.pool, '_broken', False))
+
+    def restart_pool(self):
+        """
+        בונה מאגר חדש במקום מאגר שתהליך עבודה שלו קרס. כמה תהליכונים יכולים לגלות
+        את אותה תקלה - רק הראשון מחליף את המאגר.
+        """
+        with self._lock:
+            if not self._pool_broken():
+                return
+            broken, self.pool = self.pool, self._create_pool()
+            self.restarts += 1
+        logger.warning("תהליך המרה קרס - מאגר התהליכים נבנה מחדש")
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def warm_up(self):
+        """מפעיל את כל תהליכי העבודה מראש, כך שהבקשה הראשונה אינה משלמת על האתחול"""
+        # כל ההגשות נשלחות לפני שמשימה כלשהי מסתיימת, ולכן לכל אחת נפתח תהליך משלה
+        futures = [self.pool.submit(_warm) for _ in range(self.workers)]
+        pids = {future.result() for future in futures}
+        logger.info(f"{len(pids)} תהליכי המרה מוכנים")
+
+    def reserve(self):
+        """
+        שומר מקום בתור להמרה - לפני קריאת גוף הבקשה, כך שבקשה שתידחה לא תועלה
+
+        Returns:
+            bool: False כשהתור מלא. אחרי True יש לקרוא ל-submit או ל-release
+        """
+        if not self._slots.acquire(blocking=False):
+            return False
+        with self._lock:
+            self._in_flight += 1
+        return True
+
+    def submit(self, data, bundle, name):
+        """
+        שולח המרה למאגר על המקום ששמר reserve
+
+        Returns:
+            Future: התוצאה - bytes של ה-HTML או של קובץ ה-zip
+        """
+        deadline = time.time() + self.request_timeout
+        try:
+            try:
+                future = self.pool.submit(_convert, data, bundle, name, deadline)
+            except BrokenProcessPool:
+                self.restart_pool()
+                future = self.pool.submit(_convert, data, bundle, name, deadline)
+        except Exception:
+            self.release()
+            raise
+        # המקום מתפנה רק כשתהליך העבודה סיים - גם אם הבקשה כבר קיבלה 504
+        future.add_done_callback(lambda _: self.release())
+        return future
+
+    def release(self):
+        """משחרר מקום ששמר reserve"""
+        with self._lock:
+            self._in_flight -= 1
+        self._slots.release()
+
+    def status(self):
+        """מצב השרת עבור /health"""
+        with self._lock:
+            in_flight = self._in_flight
+        return {
+            'status': 'degraded' if self._pool_broken() else 'ok',
+            'version': __version__,
+            'workers': self.workers,
+            'in_flight': in_flight,
+            'capacity': self.capacity,
+            'restarts': self.restarts,
+        }
+
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+class ConversionHandler(BaseHTTPRequestHandler):
+    server_version = f"pptx2html/{__version__}"
+
+    def do_GET(self):
+        if urlsplit(self.path).path == '/health':
+            status = self.server.status()
+            ok = status['status'] == 'ok'
+            self._send_json(HTTPStatus.OK if ok else HTTPStatus.SERVICE_UNAVAILABLE, status)
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {'error': 'not found'})
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path != '/convert':
+            self._send_json(HTTPStatus.NOT_FOUND, {'error': 'not found'})
+            return
+
+        query = parse_qs(url.query)
+        output_format = query.get('format', ['html'])[0]
+        if output_format not in ('html', 'zip'):
+            self._send_json(HTTPStatus.BAD_REQUEST, {'error': "format must be 'html' or 'zip'"})
+            return
+        name = re.sub(r'[^\w.-]', '_', query.get('name', ['presentation'])[0])[:100] or 'presentation'
+
+        length = self.headers.get('Content-Length')
+        if length is None:
+            self._send_json(HTTPStatus.LENGTH_REQUIRED, {'error': 'Content-Length required'})
+            return
+        try:
+            length = int(length)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.close_connection = True
+            self._send_json(HTTPStatus.BAD_REQUEST, {'error': 'invalid Content-Length'})
+            return
+        if length > self.server.max_bytes:
+            self.close_connection = True
+            self._send_json(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {'error': 'file too large'})
+            return
+
+        # הגוף לא נקרא כשהתור מלא - החיבור נסגר במקום להעלות קובץ שיידחה
+        if not self.server.reserve():
+            self.close_connection = True
+            self._send_json(HTTPStatus.TOO_MANY_REQUESTS, {'error': 'conversion queue is full'},
+                            {'Retry-After': '1'})
+            return
+        try:
+            data = self.rfile.read(length)
+        except BaseException:
+            self.server.release()
+            raise
+        future = self.server.submit(data, output_format == 'zip', name)
+
+        try:
+            body = future.result(timeout=self.server.request_timeout)
+        except (TimeoutError, ConversionCancelled):
+            self._send_json(HTTPStatus.GATEWAY_TIMEOUT, {'error': 'conversion timed out'})
+            return
+        except BrokenProcessPool:
+            self.server.restart_pool()
+            self._send_json(HTTPStatus.SERVICE_UNAVAILABLE, {'error': 'conversion worker crashed'},
+                            {'Retry-After': '1'})
+            return
+        except Exception as e:
+            logger.warning(f"המרה נכשלה: {str(e)}")
+            self._send_json(HTTPStatus.UNPROCESSABLE_ENTITY, {'error': str(e)})
+            return
+
+        if output_format == 'zip':
+            self._send(HTTPStatus.OK, body, 'application/zip',
+                       {'Content-Disposition': f'attachment; filename="{name}.zip"'})
+        else:
+            self._send(HTTPStatus.OK, body, 'text/html; charset=utf-8')
+
+    def _send(self, status, body, content_type, headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self._send(status, body, 'application/json; charset=utf-8', headers)
+
+    def log_message(self, format, *args):
+        logger.info(f"{self.address_string()} - {format % args}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m core.server',
+        description='שרת HTTP להמרת מצגות PowerPoint ל-HTML',
+    )
+    parser.add_argument('--host', default='127.0.0.1', help='כתובת האזנה')
+    parser.add_argument('--port', type=int, default=8000, help='פורט האזנה')
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help='מספר תהליכי המרה (ברירת מחדל: מספר המעבדים)')
+    parser.add_argument('--queue-size', type=int, default=16,
+                        help='מספר ההמרות שיכולות להמתין בתור (מעבר לכך מוחזר 429)')
+    parser.add_argument('--timeout', type=float, default=60.0,
+                        help='זמן מקסימלי לבקשה בשניות (מעבר לכך מוחזר 504)')
+    parser.add_argument('--max-mb', type=float, default=100.0, help='גודל מקסימלי לקובץ מועלה (MB)')
+    parser.add_argument('--optimize-images', action='store_true',
+                        help='הקטנת תמונות לגודל התצוגה והמרתן ל-WebP')
+    parser.add_argument('--minify', action='store_true', help='הקטנת ה-HTML, ה-CSS וה-JS בפלט')
+    parser.add_argument('-v', '--verbose', action='store_true', help='הדפסת לוג מפורט')
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+    )
+
+    server = ConversionServer(
+        (args.host, args.port),
+        workers=args.workers,
+        queue_size=args.queue_size,
+        timeout=args.timeout,
+        max_bytes=int(args.max_mb * 1024 * 1024),
+        options={'optimize_images': args.optimize_images, 'minify': args.minify},
+    )
+    server.warm_up()
+    print(f"מאזין בכתובת http://{args.host}:{server.server_address[1]}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
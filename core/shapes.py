@@ -0,0 +1,517 @@
+"""
+המרת צורות (autoshapes) ל-SVG, בקריאה ישירה של ה-XML של הצורה (p:spPr / p:style).
+הגיאומטריה, המילוי והקו של כל צורה נרשמים כסמל בספרייט של הדף (SymbolTable),
+והצורה עצמה היא <use> שממקם את הסמל - כך שחץ שחוזר עשרות פעמים מוגדר פעם אחת.
+"""
+import colorsys
+import math
+
+from .text import qn
+
+_SP_PR = qn('p:spPr')
+_STYLE = qn('p:style')
+_XFRM = qn('a:xfrm')
+_PRST_GEOM = qn('a:prstGeom')
+_AV_LST = qn('a:avLst')
+_GD = qn('a:gd')
+_LN = qn('a:ln')
+_NO_FILL = qn('a:noFill')
+_SOLID_FILL = qn('a:solidFill')
+_GRAD_FILL = qn('a:gradFill')
+_PATT_FILL = qn('a:pattFill')
+_GS = qn('a:gs')
+_FG_CLR = qn('a:fgClr')
+_FILL_REF = qn('a:fillRef')
+_LN_REF = qn('a:lnRef')
+_SRGB_CLR = qn('a:srgbClr')
+_SCHEME_CLR = qn('a:schemeClr')
+_SYS_CLR = qn('a:sysClr')
+_PRST_CLR = qn('a:prstClr')
+_LUM_MOD = qn('a:lumMod')
+_LUM_OFF = qn('a:lumOff')
+_SHADE = qn('a:shade')
+_TINT = qn('a:tint')
+_ALPHA = qn('a:alpha')
+_CLR_SCHEME = qn('a:clrScheme')
+_LN_STYLE_LST = qn('a:lnStyleLst')
+_CLR_MAP = qn('p:clrMap')
+
+# צורת מילוי (a:solidFill וכו') ב-spPr - כל אחת מהן מבטלת את המילוי מ-p:style
+_FILLS = {_NO_FILL, _SOLID_FILL, _GRAD_FILL, _PATT_FILL, qn('a:blipFill'), qn('a:grpFill')}
+
+_EMU_PER_PX = 914400 / 96
+
+# עובי קו ב-EMU כשאין עובי בצורה ובערכת הנושא (0.75pt)
+_DEFAULT_LINE_WIDTH = 9525
+
+# מיפוי ברירת המחדל של צבעי הרקע והטקסט לצבעי ערכת הנושא (p:clrMap)
+_DEFAULT_COLOR_MAP = {'bg1': 'lt1', 'tx1': 'dk1', 'bg2': 'lt2', 'tx2': 'dk2'}
+_PRESET_COLORS = {'black': '000000', 'white': 'ffffff', 'red': 'ff0000', 'green': '008000',
+                  'blue': '0000ff', 'yellow': 'ffff00', 'gray': '808080'}
+
+
+def _polygon(*points):
+    return 'M' + ' L'.join(f"{_num(x)},{_num(y)}" for x, y in points) + ' Z'
+
+
+def _rect(w, h, adj):
+    return _polygon((0, 0), (w, 0), (w, h), (0, h))
+
+
+def _round_rect(w, h, adj):
+    r = min(w, h) * min(max(adj['adj'], 0), 50000) / 100000
+    if not r:
+        return _rect(w, h, adj)
+    r_ = _num(r)
+    arc = f"A{r_},{r_} 0 0 1"
+    return (f"M{r_},0 H{_num(w - r)} {arc} {_num(w)},{r_} V{_num(h - r)} {arc} {_num(w - r)},{_num(h)} "
+            f"H{r_} {arc} 0,{_num(h - r)} V{r_} {arc} {r_},0 Z")
+
+
+def _ellipse(w, h, adj):
+    rx, ry = _num(w / 2), _num(h / 2)
+    return f"M0,{ry} A{rx},{ry} 0 1 0 {_num(w)},{ry} A{rx},{ry} 0 1 0 0,{ry} Z"
+
+
+def _triangle(w, h, adj):
+    return _polygon((w * min(max(adj['adj'], 0), 100000) / 100000, 0), (w, h), (0, h))
+
+
+def _right_triangle(w, h, adj):
+    return _polygon((0, 0), (w, h), (0, h))
+
+
+def _diamond(w, h, adj):
+    return _polygon((w / 2, 0), (w, h / 2), (w / 2, h), (0, h / 2))
+
+
+def _parallelogram(w, h, adj):
+    x = min(min(w, h) * adj['adj'] / 100000, w)
+    return _polygon((x, 0), (w, 0), (w - x, h), (0, h))
+
+
+def _trapezoid(w, h, adj):
+    x = min(min(w, h) * adj['adj'] / 100000, w / 2)
+    return _polygon((0, h), (x, 0), (w - x, 0), (w, h))
+
+
+def _pentagon(w, h, adj):
+    return _polygon((w / 2, 0), (w, h * 0.3819), (w * 0.809, h), (w * 0.191, h), (0, h * 0.3819))
+
+
+def _hexagon(w, h, adj):
+    x = min(min(w, h) * adj['adj'] / 100000, w / 2)
+    return _polygon((x, 0), (w - x, 0), (w, h / 2), (w - x, h), (x, h), (0, h / 2))
+
+
+def _octagon(w, h, adj):
+    x = min(min(w, h) * adj['adj'] / 100000, w / 2, h / 2)
+    return _polygon((x, 0), (w - x, 0), (w, x), (w, h - x), (w - x, h), (x, h), (0, h - x), (0, x))
+
+
+def _plus(w, h, adj):
+    x = min(min(w, h) * adj['adj'] / 100000, w / 2, h / 2)
+    return _polygon((x, 0), (w - x, 0), (w - x, x), (w, x), (w, h - x), (w - x, h - x), (w - x, h),
+                    (x, h), (x, h - x), (0, h - x), (0, x), (x, x))
+
+
+def _star5(w, h, adj):
+    # קודקודים חיצוניים על האליפסה החוסמת, ופנימיים ביחס adj/50000 ממנה
+    ratio = adj['adj'] / 50000
+    points = []
+    for i in range(10):
+        angle = math.radians(-90 + 36 * i)
+        scale = 1 if i % 2 == 0 else ratio
+        points.append((w / 2 + w / 2 * scale * math.cos(angle), h / 2 + h / 2 * scale * math.sin(angle)))
+    return _polygon(*points)
+
+
+def _right_arrow(w, h, adj):
+    return _horizontal_arrow(w, h, adj, right=True)
+
+
+def _left_arrow(w, h, adj):
+    return _horizontal_arrow(w, h, adj, right=False)
+
+
+def _down_arrow(w, h, adj):
+    return _vertical_arrow(w, h, adj, down=True)
+
+
+def _up_arrow(w, h, adj):
+    return _vertical_arrow(w, h, adj, down=False)
+
+
+def _horizontal_arrow(w, h, adj, right):
+    """חץ אופקי: adj1 - עובי הגוף ביחס לגובה, adj2 - אורך הראש ביחס לצלע הקצרה"""
+    y1 = h / 2 - h * adj['adj1'] / 200000
+    y2 = h - y1
+    head = min(min(w, h) * adj['adj2'] / 100000, w)
+    points = [(0, y1), (w - head, y1), (w - head, 0), (w, h / 2), (w - head, h), (w - head, y2), (0, y2)]
+    return _polygon(*(points if right else [(w - x, y) for x, y in points]))
+
+
+def _vertical_arrow(w, h, adj, down):
+    """חץ אנכי: adj1 - עובי הגוף ביחס לרוחב, adj2 - אורך הראש ביחס לצלע הקצרה"""
+    x1 = w / 2 - w * adj['adj1'] / 200000
+    x2 = w - x1
+    head = min(min(w, h) * adj['adj2'] / 100000, h)
+    points = [(x1, 0), (x2, 0), (x2, h - head), (w, h - head), (w / 2, h), (0, h - head), (x1, h - head)]
+    return _polygon(*(points if down else [(x, h - y) for x, y in points]))
+
+
+def _left_right_arrow(w, h, adj):
+    y1 = h / 2 - h * adj['adj1'] / 200000
+    y2 = h - y1
+    head = min(min(w, h) * adj['adj2'] / 100000, w / 2)
+    return _polygon((0, h / 2), (head, 0), (head, y1), (w - head, y1), (w - head, 0), (w, h / 2),
+                    (w - head, h), (w - head, y2), (head, y2), (head, h))
+
+
+def _chevron(w, h, adj):
+    x = min(min(w, h) * adj['adj'] / 100000, w)
+    return _polygon((0, 0), (w - x, 0), (w, h / 2), (w - x, h), (0, h), (x, h / 2))
+
+
+def _home_plate(w, h, adj):
+    x = min(min(w, h) * adj['adj'] / 100000, w)
+    return _polygon((0, 0), (w - x, 0), (w, h / 2), (w - x, h), (0, h))
+
+
+def _wedge_rect_callout(w, h, adj):
+    """מלבן עם זנב: הזנב יוצא מהצלע שבכיוון הנקודה (adj1, adj2 ביחס למרכז)"""
+    dx, dy = w * adj['adj1'] / 100000, h * adj['adj2'] / 100000
+    tip = (w / 2 + dx, h / 2 + dy)
+    # בסיס הזנב - שתי נקודות על הצלע, בשנים-עשר של אורכה
+    x1, x2 = (w * 7 / 12, w * 10 / 12) if dx > 0 else (w * 2 / 12, w * 5 / 12)
+    y1, y2 = (h * 7 / 12, h * 10 / 12) if dy > 0 else (h * 2 / 12, h * 5 / 12)
+    vertical = abs(dy) > abs(dx * h / w)
+
+    points = [(0, 0)]
+    if vertical and dy < 0:
+        points += [(x1, 0), tip, (x2, 0)]
+    points.append((w, 0))
+    if not vertical and dx > 0:
+        points += [(w, y1), tip, (w, y2)]
+    points.append((w, h))
+    if vertical and dy > 0:
+        points += [(x2, h), tip, (x1, h)]
+    points.append((0, h))
+    if not vertical and dx < 0:
+        points += [(0, y2), tip, (0, y1)]
+    return _polygon(*points)
+
+
+def _line(w, h, adj):
+    return f"M0,0 L{_num(w)},{_num(h)}"
+
+
+# ערכי ה-adj של כל צורה כשאינם מופיעים ב-avLst (מתוך presetShapeDefinitions)
+_ADJUST_DEFAULTS = {
+    'roundRect': {'adj': 16667},
+    'triangle': {'adj': 50000},
+    'parallelogram': {'adj': 25000},
+    'trapezoid': {'adj': 25000},
+    'hexagon': {'adj': 25000},
+    'octagon': {'adj': 29289},
+    'plus': {'adj': 25000},
+    'star5': {'adj': 19098},
+    'rightArrow': {'adj1': 50000, 'adj2': 50000},
+    'leftArrow': {'adj1': 50000, 'adj2': 50000},
+    'upArrow': {'adj1': 50000, 'adj2': 50000},
+    'downArrow': {'adj1': 50000, 'adj2': 50000},
+    'leftRightArrow': {'adj1': 50000, 'adj2': 50000},
+    'chevron': {'adj': 50000},
+    'homePlate': {'adj': 50000},
+    'wedgeRectCallout': {'adj1': -20833, 'adj2': 62500},
+}
+
+# prstGeom -> פונקציה שמחזירה את מסלול ה-SVG בתיבה w x h
+_GEOMETRIES = {
+    'rect': _rect,
+    'flowChartProcess': _rect,
+    'roundRect': _round_rect,
+    'ellipse': _ellipse,
+    'flowChartConnector': _ellipse,
+    'triangle': _triangle,
+    'rtTriangle': _right_triangle,
+    'diamond': _diamond,
+    'flowChartDecision': _diamond,
+    'parallelogram': _parallelogram,
+    'trapezoid': _trapezoid,
+    'pentagon': _pentagon,
+    'hexagon': _hexagon,
+    'octagon': _octagon,
+    'plus': _plus,
+    'star5': _star5,
+    'rightArrow': _right_arrow,
+    'leftArrow': _left_arrow,
+    'downArrow': _down_arrow,
+    'upArrow': _up_arrow,
+    'leftRightArrow': _left_right_arrow,
+    'chevron': _chevron,
+    'homePlate': _home_plate,
+    'wedgeRectCallout': _wedge_rect_callout,
+    'line': _line,
+    'straightConnector1': _line,
+}
+
+# צורות שהגיאומטריה שלהן פרופורציונלית לתיבה - מוגדרות בתיבה 100x100 ונמתחות,
+# כך שסמל אחד משמש אותן בכל גודל. בשאר הצורות (פינות, ראשי חצים) ה-adj יחסי
+# לצלע הקצרה, ולכן הסמל משותף לצורות באותו יחס רוחב-גובה
+_STRETCH = {'rect', 'flowChartProcess', 'ellipse', 'flowChartConnector', 'triangle', 'rtTriangle',
+            'diamond', 'flowChartDecision', 'pentagon', 'star5', 'wedgeRectCallout',
+            'line', 'straightConnector1'}
+
+# צורות של קו בלבד - ללא מילוי
+_LINES = {'line', 'straightConnector1'}
+
+
+class ShapeHandler:
+    """ממיר צורות לסמלים בספרייט SVG ולמופעי <use>"""
+
+    def __init__(self):
+        # צבעי ערכת הנושא ועובי הקווים שלה לכל תבנית-אב (לפי partname)
+        self._themes = {}
+
+    def convert_shape(self, shape, symbols, element_id="", animation_style=""):
+        """
+        ממיר צורה ל-<svg> עם <use> שמפנה לסמל שלה, ורושם את הסמל בטבלה.
+        צורה בלי מילוי ובלי קו (למשל תיבת טקסט) אינה מוצגת; צורה שהגיאומטריה
+        שלה אינה מוכרת מוצגת כמלבן (div) עם המילוי והקו שלה.
+
+        Args:
+            shape: צורת python-pptx (p:sp או p:cxnSp)
+            symbols (SymbolTable): הסמלים של השקופית
+            element_id (str): מזהה האלמנט
+            animation_style (str): סגנון האנימציה
+
+        Returns:
+            str: ה-HTML של הצורה, או '' אם אין מה להציג
+        """
+        sp_pr = shape.element.find(_SP_PR)
+        if sp_pr is None:
+            return ''
+        geometry = sp_pr.find(_PRST_GEOM)
+        preset = geometry.get('prst') if geometry is not None else None
+
+        theme = self._get_theme(shape)
+        style = shape.element.find(_STYLE)
+        fill = None if preset in _LINES else _get_fill(sp_pr, style, theme)
+        line = _get_line(sp_pr, style, theme)
+        if fill is None and line is None:
+            return ''
+
+        left, top = _px(shape.left or 0), _px(shape.top or 0)
+        # קו אופקי או אנכי הוא תיבה ברוחב או בגובה 0 - שאינה מוצגת ב-SVG
+        width, height = max(_px(shape.width or 0), 1), max(_px(shape.height or 0), 1)
+        position = f"position: absolute; left: {left}px; top: {top}px; width: {width}px; height: {height}px;"
+
+        if preset not in _GEOMETRIES:
+            return _fallback(element_id, position, animation_style, fill, line)
+
+        adjust = dict(_ADJUST_DEFAULTS.get(preset, ()))
+        av_lst = geometry.find(_AV_LST)
+        if av_lst is not None:
+            for gd in av_lst.iterfind(_GD):
+                formula = gd.get('fmla', '').split()
+                if len(formula) == 2 and formula[0] == 'val':
+                    adjust[gd.get('name')] = int(formula[1])
+
+        # תיבת הסמל: 100x100 לצורות שנמתחות, אחרת הצלע הקצרה היא 100
+        shortest = min(width, height)
+        if preset in _STRETCH:
+            box = (100, 100)
+        else:
+            box = (round(100 * width / shortest, 1), round(100 * height / shortest, 1))
+        path = _GEOMETRIES[preset](*box, adjust)
+
+        attributes = [f'd="{path}"', f'fill="{fill[0]}"' if fill else 'fill="none"']
+        if fill and fill[1] < 1:
+            attributes.append(f'fill-opacity="{_num(fill[1])}"')
+        if line:
+            color, opacity, line_width = line
+            # עובי הקו בפיקסלים של הדף, לא ביחידות התיבה הנמתחת
+            attributes.append(f'stroke="{color}" stroke-width="{line_width}" vector-effect="non-scaling-stroke"')
+            if opacity < 1:
+                attributes.append(f'stroke-opacity="{_num(opacity)}"')
+        name = symbols.intern(f'viewBox="0 0 {_num(box[0])} {_num(box[1])}"><path {" ".join(attributes)}/>')
+
+        # סיבוב והיפוך - על ה-<use>, כי ה-transform של ה-<svg> שמור לאנימציות
+        xfrm = sp_pr.find(_XFRM)
+        transform = []
+        if xfrm is not None:
+            rotation = int(xfrm.get('rot', 0)) / 60000
+            if rotation:
+                transform.append(f"rotate({_num(rotation)} {_num(width / 2)} {_num(height / 2)})")
+            if _bool(xfrm.get('flipH')):
+                transform.append(f"translate({width} 0) scale(-1 1)")
+            if _bool(xfrm.get('flipV')):
+                transform.append(f"translate(0 {height}) scale(1 -1)")
+        transform = f' transform="{" ".join(transform)}"' if transform else ''
+
+        return (f'<svg class="shape" id="{element_id}" aria-hidden="true" style="{position} {animation_style}">'
+                f'<use href="#{name}" width="100%" height="100%"{transform}/></svg>')
+
+    def _get_theme(self, shape):
+        """צבעי ערכת הנושא (אחרי מיפוי p:clrMap) ועובי הקווים שלה, לתבנית-האב של השקופית"""
+        try:
+            master = shape.part.slide_layout.slide_master
+        except AttributeError:
+            return {}, []
+        key = str(master.part.partname)
+        if key not in self._themes:
+            self._themes[key] = _read_theme(master)
+        return self._themes[key]
+
+
+def _read_theme(master):
+    """קורא את ערכת הנושא של תבנית-אב: (צבעים לפי שם, עובי הקווים ב-lnStyleLst)"""
+    from lxml import etree
+    from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+
+    try:
+        theme = etree.fromstring(master.part.part_related_by(RT.THEME).blob)
+    except (KeyError, etree.XMLSyntaxError):
+        return {}, []
+
+    colors = {}
+    scheme = next(theme.iter(_CLR_SCHEME), None)
+    if scheme is not None:
+        for entry in scheme:
+            for color in entry:
+                value = color.get('lastClr') if color.tag == _SYS_CLR else color.get('val')
+                if value:
+                    colors[etree.QName(entry).localname] = value.lower()
+
+    color_map = dict(_DEFAULT_COLOR_MAP)
+    clr_map = master.element.find(_CLR_MAP)
+    if clr_map is not None:
+        color_map.update(clr_map.attrib)
+    for name, target in color_map.items():
+        if target in colors:
+            colors[name] = colors[target]
+
+    ln_style_lst = next(theme.iter(_LN_STYLE_LST), None)
+    widths = [] if ln_style_lst is None else [int(ln.get('w', _DEFAULT_LINE_WIDTH)) for ln in ln_style_lst]
+    return colors, widths
+
+
+def _get_fill(sp_pr, style, theme):
+    """
+    המילוי של הצורה: מ-spPr, ואם אין בו מילוי - מ-fillRef של p:style
+
+    Returns:
+        tuple: (צבע '#rrggbb', שקיפות 0-1), או None כשאין מילוי
+    """
+    for child in sp_pr:
+        if child.tag not in _FILLS:
+            continue
+        if child.tag == _SOLID_FILL:
+            return _color(child, theme)
+        if child.tag == _GRAD_FILL:
+            # מעבר צבע - בקירוב, הצבע הראשון
+            stop = next(child.iter(_GS), None)
+            return None if stop is None else _color(stop, theme)
+        if child.tag == _PATT_FILL:
+            fg = child.find(_FG_CLR)
+            return None if fg is None else _color(fg, theme)
+        return None
+
+    fill_ref = style.find(_FILL_REF) if style is not None else None
+    if fill_ref is not None and int(fill_ref.get('idx', 0)) > 0:
+        return _color(fill_ref, theme)
+    return None
+
+
+def _get_line(sp_pr, style, theme):
+    """
+    הקו של הצורה: מ-a:ln של spPr, ומה שחסר בו - מ-lnRef של p:style
+
+    Returns:
+        tuple: (צבע '#rrggbb', שקיפות, עובי בפיקסלים), או None כשאין קו
+    """
+    ln = sp_pr.find(_LN)
+    ln_ref = style.find(_LN_REF) if style is not None else None
+    index = int(ln_ref.get('idx', 0)) if ln_ref is not None else 0
+    colors, widths = theme
+
+    color = None
+    fill = next((child for child in ln if child.tag in _FILLS), None) if ln is not None else None
+    if fill is not None:
+        if fill.tag == _SOLID_FILL:
+            color = _color(fill, theme)
+        elif fill.tag == _GRAD_FILL:
+            stop = next(fill.iter(_GS), None)
+            color = None if stop is None else _color(stop, theme)
+    elif index > 0:
+        color = _color(ln_ref, theme)
+    if color is None:
+        return None
+
+    width = ln.get('w') if ln is not None else None
+    if width is None:
+        width = widths[index - 1] if 0 < index <= len(widths) else _DEFAULT_LINE_WIDTH
+    return (*color, _px(width))
+
+
+def _color(parent, theme):
+    """
+    הצבע שבתוך אלמנט (a:solidFill, a:gs, a:fillRef וכו'), כולל lumMod / lumOff,
+    shade / tint ו-alpha
+
+    Returns:
+        tuple: (צבע '#rrggbb', שקיפות 0-1), או None לצבע שאינו מוכר
+    """
+    element = next((child for child in parent
+                    if child.tag in (_SRGB_CLR, _SCHEME_CLR, _SYS_CLR, _PRST_CLR)), None)
+    if element is None:
+        return None
+    if element.tag == _SRGB_CLR:
+        value = element.get('val')
+    elif element.tag == _SCHEME_CLR:
+        value = theme[0].get(element.get('val'))
+    elif element.tag == _SYS_CLR:
+        value = element.get('lastClr')
+    else:
+        value = _PRESET_COLORS.get(element.get('val'))
+    if not value or len(value) != 6:
+        return None
+
+    r, g, b = (int(value[i:i + 2], 16) / 255 for i in (0, 2, 4))
+    alpha = 1
+    for modifier in element:
+        amount = int(modifier.get('val', 100000)) / 100000
+        if modifier.tag == _LUM_MOD or modifier.tag == _LUM_OFF:
+            hue, lightness, saturation = colorsys.rgb_to_hls(r, g, b)
+            lightness = lightness * amount if modifier.tag == _LUM_MOD else lightness + amount
+            r, g, b = colorsys.hls_to_rgb(hue, min(max(lightness, 0), 1), saturation)
+        elif modifier.tag == _SHADE:
+            r, g, b = r * amount, g * amount, b * amount
+        elif modifier.tag == _TINT:
+            r, g, b = (c + (1 - c) * (1 - amount) for c in (r, g, b))
+        elif modifier.tag == _ALPHA:
+            alpha = amount
+    return '#' + ''.join(f"{round(min(max(c, 0), 1) * 255):02x}" for c in (r, g, b)), alpha
+
+
+def _fallback(element_id, position, animation_style, fill, line):
+    """גיאומטריה שאינה מוכרת (למשל custGeom) - מלבן עם המילוי והקו של הצורה"""
+    style = f"{position} background-color: {fill[0] if fill else 'transparent'};"
+    if line:
+        style += f" border: {line[2]}px solid {line[0]};"
+    return f'<div class="shape" id="{element_id}" style="{style} {animation_style}"></div>'
+
+
+def _bool(value):
+    return value in ('1', 'true')
+
+
+def _px(emu):
+    """EMU (מספר או מחרוזת מה-XML) -> פיקסלים, בדיוק של שתי ספרות"""
+    return round(int(emu) / _EMU_PER_PX, 2)
+
+
+def _num(value):
+    """מספר לקואורדינטה ב-SVG: עד שתי ספרות אחרי הנקודה, בלי אפסים מיותרים"""
+    return f"{round(value, 2):g}"
@@ -1,3 +1,56 @@
+import base64
+import hashlib
+
+
+class StyleTable:
+    """
+    טבלת סגנונות משותפים: כל מחרוזת סגנון ייחודית ממופה לשם מחלקת CSS קצר,
+    והטבלה כולה נכתבת פעם אחת לבלוק <style> בדף במקום style="..." על כל אלמנט.
+    שם המחלקה נגזר מגיבוב הסגנון, כך שהוא זהה בכל תהליך ובכל המרה.
+    """
+
+    # התו הראשון של השמות - שם מחלקה או מזהה אינו יכול להתחיל בספרה
+    prefix = 't'
+
+    def __init__(self):
+        self.classes = {}
+
+    @classmethod
+    def class_name(cls, style):
+        """שם מחלקה קצר ויציב לסגנון (8 תווי base32 של הגיבוב)"""
+        digest = hashlib.sha1(style.encode('utf-8')).digest()
+        return cls.prefix + base64.b32encode(digest)[:8].decode('ascii').lower()
+
+    def intern(self, style):
+        """מחזיר את שם המחלקה של הסגנון ומוסיף אותו לטבלה"""
+        name = self.class_name(style)
+        self.classes.setdefault(name, style)
+        return name
+
+    def update(self, classes):
+        """ממזג מחלקות מטבלה אחרת (למשל משקופית שהומרה בתהליך אחר)"""
+        for name, style in classes.items():
+            self.classes.setdefault(name, style)
+
+    def get_css(self):
+        """מחזיר את הגדרות ה-CSS של כל המחלקות בטבלה"""
+        return '\n'.join(f".{name} {{ {style} }}" for name, style in self.classes.items())
+
+
+class SymbolTable(StyleTable):
+    """
+    ספרייט SVG משותף: כל גיאומטריה ייחודית של צורה (מסלול, מילוי וקו) מוגדרת
+    פעם אחת כ-<symbol> בסוף הדף, וכל מופע שלה הוא <use> קצר שמפנה אליה.
+    הערך של כל סמל הוא התוכן שלו אחרי המזהה: 'viewBox="..."><path .../>'.
+    """
+    prefix = 's'
+
+    def get_sprite(self):
+        """מחזיר את הגדרות ה-<symbol> של כל הסמלים בטבלה"""
+        return '\n'.join(f'<symbol id="{name}" preserveAspectRatio="none" overflow="visible" {symbol}</symbol>'
+                         for name, symbol in self.classes.items())
+
+
 class StyleGenerator:
     @staticmethod
     def get_base_css():
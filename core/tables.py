@@ -1,141 +1,260 @@
-from pptx.enum.shapes import MSO_SHAPE_TYPE
-from pptx.table import _Cell
+"""המרת טבלאות ל-HTML, בקריאה ישירה של ה-XML של הטבלה (a:tbl / a:tr / a:tc)"""
+import json
+from html import escape
+
+from . import text
+from .text import qn
+
+_TBL_PATH = '/'.join(qn(tag) for tag in ('a:graphic', 'a:graphicData', 'a:tbl'))
+_TBL_GRID = qn('a:tblGrid')
+_GRID_COL = qn('a:gridCol')
+_TR = qn('a:tr')
+_TC = qn('a:tc')
+_TC_PR = qn('a:tcPr')
+_TX_BODY = qn('a:txBody')
+_P_PR = qn('a:pPr')
+_NO_FILL = qn('a:noFill')
+_SOLID_FILL = qn('a:solidFill')
+_SRGB_CLR = qn('a:srgbClr')
+_BORDERS = {qn('a:lnT'): 'top', qn('a:lnR'): 'right', qn('a:lnB'): 'bottom', qn('a:lnL'): 'left'}
+
+_EMU_PER_PX = 914400 / 96
+
+# ברירות המחדל של PowerPoint ב-EMU: שוליים (עליון, ימני, תחתון, שמאלי) ועובי קו
+_DEFAULT_MARGINS = (45720, 91440, 45720, 91440)
+_DEFAULT_LINE_WIDTH = 12700
+_NO_MARGINS = [None] * 4
+
+# ערכי algn ו-anchor ב-XML -> CSS
+_TEXT_ALIGN = {'l': 'left', 'ctr': 'center', 'r': 'right', 'just': 'justify', 'dist': 'justify'}
+_VERTICAL_ALIGN = {'t': 'top', 'ctr': 'middle', 'b': 'bottom'}
+
+# סגנון פסקה בתא לפי ערך algn - מחושב מראש, כי הוא תלוי רק ביישור
+_PARAGRAPH_STYLE = "margin: 0"
+_PARAGRAPH_STYLES = {algn: f"{_PARAGRAPH_STYLE}; text-align: {align}" for algn, align in _TEXT_ALIGN.items()}
+
+# ב-JSON של טבלה וירטואלית: קוד של תו אחד ליישור כל פסקה ('-' - ברירת מחדל),
+# וערכי ברירת המחדל של השדות שאחרי הטקסט (יישור, סגנון, colspan, rowspan)
+_ALIGN_CODES = {'l': 'l', 'ctr': 'c', 'r': 'r', 'just': 'j', 'dist': 'd'}
+_CELL_DEFAULTS = ('', 0, 1, 1)
+
+# גובה שורה ללא גובה מוגדר - כמו VIRTUAL_ROW_HEIGHT בסקריפט. שורה עם טקסט אינה
+# מוצגת נמוכה מזה, גם כשהגובה שלה במצגת קטן יותר
+_DEFAULT_ROW_HEIGHT = 24
+
 
 class TableHandler:
-    @staticmethod
-    def get_table_css():
-        """מחזיר את הגדרות ה-CSS לטבלאות"""
-        return """
-            .pptx-table {
-                border-collapse: collapse;
-                width: 100%;
-                height: 100%;
-                position: absolute;
-                background: white;
-            }
-            
-            .pptx-table td {
-                border: 1px solid #ccc;
-                padding: 8px;
-                position: relative;
-                vertical-align: middle;
-                box-sizing: border-box;
-            }
-            
-            .pptx-table tr:nth-child(even) {
-                background-color: #f9f9f9;
-            }
-            
-            .pptx-table tr:hover {
-                background-color: #f5f5f5;
-            }
-            
-            @media (max-width: 768px) {
-                .pptx-table {
-                    font-size: 14px;
-                }
-                
-                .pptx-table td {
-                    padding: 4px;
-                }
-            }
+    def __init__(self, virtualize_cells=None):
+        """
+        Args:
+            virtualize_cells (int, optional): טבלה עם לפחות מספר תאים זה נכתבת כנתוני
+                JSON, והדף מציג רק את השורות הנראות. None או 0 - תמיד טבלה מלאה
         """
+        self.virtualize_cells = virtualize_cells
 
     def convert_table(self, shape, element_id="", animation_style=""):
-        """ממיר טבלת PowerPoint ל-HTML"""
-        if not hasattr(shape, 'table'):
+        """
+        ממיר טבלת PowerPoint ל-HTML במעבר אחד על ה-XML (a:tbl), בלי אובייקטי
+        התאים של python-pptx ובלי לשנות את עץ המצגת. תאים ממוזגים (gridSpan /
+        rowSpan) הופכים ל-colspan / rowspan, ותאי ההמשך שלהם (hMerge / vMerge) מדולגים.
+        """
+        tbl = shape.element.find(_TBL_PATH)
+        if tbl is None:
             return ''
-            
-        table = shape.table
-        
-        # חישוב המיקום והגודל
-        left = shape.left if hasattr(shape, 'left') else 0
-        top = shape.top if hasattr(shape, 'top') else 0
-        width = shape.width if hasattr(shape, 'width') else 'auto'
-        height = shape.height if hasattr(shape, 'height') else 'auto'
-        
-        style = f"""
-            left: {left}px;
-            top: {top}px;
-            width: {width}px;
-            height: {height}px;
-            {animation_style}
+
+        grid = tbl.find(_TBL_GRID)
+        columns = [] if grid is None else [_px(col.get('w')) for col in grid.iterfind(_GRID_COL)]
+        rows = []
+        cell_count = 0
+        for tr in tbl.iterfind(_TR):
+            height = tr.get('h')
+            cells = []
+            for tc in tr.iterfind(_TC):
+                cell_count += 1
+                # תא שמכוסה על ידי מיזוג - התוכן שלו שייך לתא המקור
+                if _bool(tc.get('hMerge')) or _bool(tc.get('vMerge')):
+                    continue
+                cells.append(self._read_cell(tc))
+            rows.append((_px(height) if height else None, cells))
+
+        style = (f"position: absolute; left: {_px(shape.left)}px; top: {_px(shape.top)}px; "
+                 f"width: {_px(shape.width)}px; height: {_px(shape.height)}px; {animation_style}")
+        colgroup = ''.join(['<colgroup>', *(f'<col style="width: {width}px">' for width in columns), '</colgroup>'])
+
+        if self.virtualize_cells and cell_count >= self.virtualize_cells:
+            return self._render_virtual(element_id, style, colgroup, rows, len(columns), _px(shape.height))
+
+        parts = [f'<div class="table-container" id="{element_id}" style="{style}">',
+                 '<table class="pptx-table">', colgroup]
+        parts.extend(_render_rows(rows))
+        parts.append('</table></div>')
+        return ''.join(parts)
+
+    def _render_virtual(self, element_id, style, colgroup, rows, column_count, height):
         """
-        
-        # יצירת הטבלה
-        html = f'<div class="table-container" id="{element_id}" style="{style}">'
-        html += '<table class="pptx-table">'
-        
-        # מעבר על כל השורות והתאים
-        for row in table.rows:
-            html += '<tr>'
-            for cell in row.cells:
-                # עיצוב התא
-                cell_style = self._get_cell_style(cell)
-                html += f'<td style="{cell_style}">'
-                
-                # המרת תוכן התא
-                if cell.text_frame:
-                    for paragraph in cell.text_frame.paragraphs:
-                        para_style = self._get_paragraph_style(paragraph)
-                        html += f'<p style="{para_style}">{paragraph.text}</p>'
-                
-                html += '</td>'
-            html += '</tr>'
-            
-        html += '</table></div>'
-        return html
-        
-    def _get_cell_style(self, cell):
-        """מחזיר את הסגנון של תא בטבלה"""
+        טבלה וירטואלית: הנתונים נכתבים כ-JSON והסקריפט בדף בונה מהם רק את
+        השורות הנראות (ואת כולן בהדפסה). ב-noscript נכתבות רק השורות של המסך
+        הראשון, עבור דפדפנים ללא JavaScript.
+
+        מבנה הנתונים: {"styles": [סגנונות התאים], "rows": [[גובה, תאים], ...]}.
+        תא הוא הטקסט שלו (HTML מוסלש, פסקה אחת), או [טקסט, יישור, סגנון, colspan,
+        rowspan] בלי שדות ברירת המחדל שבסוף - הטקסט הוא רשימה כשיש כמה פסקאות
+        (null ללא txBody), היישור הוא קוד לכל פסקה והסגנון הוא אינדקס ב-styles.
+        """
+        styles = {'': 0}
+        data = {
+            'styles': styles,
+            'rows': [[row_height, [_compact_cell(cell, styles) for cell in cells]]
+                     for row_height, cells in rows],
+        }
+        data['styles'] = list(styles)
+        # '</' בתוך בלוק script היה סוגר אותו
+        data = json.dumps(data, ensure_ascii=False, separators=(',', ':')).replace('</', '<\\/')
+
+        parts = [f'<div class="table-container virtual-table" id="{element_id}" style="{style}">',
+                 f'<table class="pptx-table" role="grid" aria-rowcount="{len(rows)}" '
+                 f'aria-colcount="{column_count}">',
+                 colgroup, '<tbody></tbody></table>',
+                 f'<script type="application/json" class="table-data">{data}</script>',
+                 '<noscript><table class="pptx-table">', colgroup]
+        parts.extend(_render_rows(_first_screen(rows, height)))
+        parts.append('</table></noscript></div>')
+        return ''.join(parts)
+
+    def _read_cell(self, tc):
+        """
+        קורא תא (a:tc) במעבר אחד
+
+        Returns:
+            tuple: (פסקאות - זוגות של (algn, HTML של הטקסט), סגנון, colspan, rowspan)
+        """
+        tx_body = tc_pr = None
+        for child in tc:
+            if child.tag == _TX_BODY:
+                tx_body = child
+            elif child.tag == _TC_PR:
+                tc_pr = child
+
+        paragraphs = ()
+        if tx_body is not None:
+            paragraphs = tuple((_paragraph_align(p),
+                                escape(text.paragraph_text(p), quote=False).replace('\v', '<br>'))
+                               for p in text.paragraphs(tx_body))
+
+        return (paragraphs, self._get_cell_style(tc_pr),
+                int(tc.get('gridSpan', 1)), int(tc.get('rowSpan', 1)))
+
+    def _get_cell_style(self, tc_pr):
+        """
+        מחזיר את הסגנון של תא לפי a:tcPr, במעבר אחד על האלמנט
+
+        Args:
+            tc_pr: אלמנט a:tcPr של התא, או None
+        """
+        if tc_pr is None:
+            return ''
         style_parts = []
-        
-        # צבע רקע
-        if cell._tc.get_or_add_tcPr().fill:
-            fill = cell._tc.get_or_add_tcPr().fill
-            if hasattr(fill, 'fore_color') and fill.fore_color:
-                rgb = fill.fore_color.rgb
+
+        # צבע רקע וגבולות
+        for child in tc_pr:
+            tag = child.tag
+            if tag == _SOLID_FILL:
+                rgb = _rgb(child)
                 if rgb:
-                    style_parts.append(f"background-color: rgb({rgb[0]}, {rgb[1]}, {rgb[2]})")
-        
-        # גבולות
-        if cell._tc.get_or_add_tcPr().borders:
-            borders = cell._tc.get_or_add_tcPr().borders
-            for border in ['top', 'right', 'bottom', 'left']:
-                border_obj = getattr(borders, border)
-                if border_obj:
-                    width = border_obj.width
-                    if hasattr(border_obj, 'color') and border_obj.color:
-                        rgb = border_obj.color.rgb
-                        if rgb:
-                            style_parts.append(
-                                f"border-{border}: {width}pt solid rgb({rgb[0]}, {rgb[1]}, {rgb[2]})"
-                            )
-        
-        # יישור טקסט
-        if cell._tc.get_or_add_tcPr().vertical_anchor:
-            valign_map = {
-                'top': 'flex-start',
-                'middle': 'center',
-                'bottom': 'flex-end'
-            }
-            valign = valign_map.get(cell._tc.get_or_add_tcPr().vertical_anchor, 'center')
-            style_parts.append(f"vertical-align: {valign}")
-        
-        return "; ".join(style_parts)
-        
-    def _get_paragraph_style(self, paragraph):
-        """מחזיר את הסגנון של פסקה בתא"""
-        style_parts = ["margin: 0"]
-        
-        # יישור טקסט
-        if paragraph.alignment is not None:
-            alignment_map = {
-                0: 'right',  # PP_ALIGN.LEFT in RTL
-                1: 'center',
-                2: 'left',   # PP_ALIGN.RIGHT in RTL
-                3: 'justify'
-            }
-            style_parts.append(f"text-align: {alignment_map.get(paragraph.alignment, 'right')}")
-            
+                    style_parts.append(f"background-color: {rgb}")
+                continue
+            side = _BORDERS.get(tag)
+            if side is None:
+                continue
+            fill = child.find(_NO_FILL)
+            if fill is not None:
+                style_parts.append(f"border-{side}: none")
+                continue
+            fill = child.find(_SOLID_FILL)
+            rgb = None if fill is None else _rgb(fill)
+            if rgb:
+                width = _px(child.get('w', _DEFAULT_LINE_WIDTH))
+                style_parts.append(f"border-{side}: {width}px solid {rgb}")
+
+        # שוליים פנימיים - רק כשהוגדרו במפורש; אחרת ברירת המחדל של ה-CSS
+        margins = [tc_pr.get(name) for name in ('marT', 'marR', 'marB', 'marL')]
+        if margins != _NO_MARGINS:
+            padding = ' '.join(f"{_px(margin or default)}px"
+                               for margin, default in zip(margins, _DEFAULT_MARGINS))
+            style_parts.append(f"padding: {padding}")
+
+        # יישור אנכי
+        anchor = _VERTICAL_ALIGN.get(tc_pr.get('anchor'))
+        if anchor:
+            style_parts.append(f"vertical-align: {anchor}")
+
         return "; ".join(style_parts)
+
+
+def _paragraph_align(p):
+    """ערך ה-algn של פסקה בתא (מ-a:pPr), או None"""
+    p_pr = p.find(_P_PR)
+    return None if p_pr is None else p_pr.get('algn')
+
+
+def _render_rows(rows):
+    """ה-HTML של שורות הטבלה (tr / td), כפי שנקראו ב-convert_table"""
+    for height, cells in rows:
+        yield f'<tr style="height: {height}px">' if height else '<tr>'
+        for paragraphs, style, colspan, rowspan in cells:
+            attributes = (f' colspan="{colspan}"' if colspan > 1 else '') + \
+                         (f' rowspan="{rowspan}"' if rowspan > 1 else '') + \
+                         (f' style="{style}"' if style else '')
+            content = ''.join(f'<p style="{_PARAGRAPH_STYLES.get(algn, _PARAGRAPH_STYLE)}">{content}</p>'
+                              for algn, content in paragraphs)
+            yield f'<td{attributes}>{content}</td>'
+        yield '</tr>'
+
+
+def _compact_cell(cell, styles):
+    """
+    תא בנתוני ה-JSON של טבלה וירטואלית (ראו TableHandler._render_virtual)
+
+    Args:
+        cell (tuple): התא כפי שנקרא ב-_read_cell
+        styles (dict): סגנון -> אינדקס; סגנונות חדשים נוספים אליו
+    """
+    paragraphs, style, colspan, rowspan = cell
+    texts = [content for _, content in paragraphs]
+    cell_text = texts[0] if len(texts) == 1 else (texts or None)
+    align = ''.join(_ALIGN_CODES.get(algn, '-') for algn, _ in paragraphs)
+    fields = [align.strip('-') and align, styles.setdefault(style, len(styles)), colspan, rowspan]
+    while fields and fields[-1] == _CELL_DEFAULTS[len(fields) - 1]:
+        fields.pop()
+    if not fields and isinstance(cell_text, str):
+        return cell_text
+    return [cell_text, *fields]
+
+
+def _first_screen(rows, height):
+    """השורות הראשונות של הטבלה, עד שהן ממלאות גובה נתון (בפיקסלים)"""
+    top = 0
+    for count, (row_height, _) in enumerate(rows):
+        if top >= height:
+            return rows[:count]
+        top += max(row_height or 0, _DEFAULT_ROW_HEIGHT)
+    return rows
+
+
+def _px(emu):
+    """EMU (מספר או מחרוזת מה-XML) -> פיקסלים, בדיוק של שתי ספרות"""
+    return round(int(emu) / _EMU_PER_PX, 2)
+
+
+def _bool(value):
+    """ערך xsd:boolean"""
+    return value in ('1', 'true')
+
+
+def _rgb(solid_fill):
+    """צבע ה-srgbClr של a:solidFill כ-rgb(...) של CSS, או None (למשל צבע ערכת נושא)"""
+    color = solid_fill.find(_SRGB_CLR)
+    if color is None:
+        return None
+    value = color.get('val')
+    return f"rgb({int(value[0:2], 16)}, {int(value[2:4], 16)}, {int(value[4:6], 16)})"
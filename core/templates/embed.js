@@ -0,0 +1,25 @@
+        // גרסת ההטמעה: מדווחת לדף המארח (Wix) על גובה המסמך, כדי שה-iframe יתאים את גובהו
+        function updateParentHeight() {
+            const height = document.documentElement.scrollHeight;
+            window.parent.postMessage({
+                type: 'resize',
+                height: height
+            }, '*');
+        }
+
+        // עדכון בטעינה ובשינוי גודל
+        window.addEventListener('load', updateParentHeight);
+        window.addEventListener('resize', updateParentHeight);
+
+        // עדכון בשינוי שקופית
+        document.addEventListener('DOMContentLoaded', () => {
+            const slides = document.querySelectorAll('.slide');
+            const observer = new MutationObserver(updateParentHeight);
+
+            slides.forEach(slide => {
+                observer.observe(slide, {
+                    attributes: true,
+                    attributeFilter: ['style', 'class']
+                });
+            });
+        });
@@ -0,0 +1,335 @@
+        // מספר השקופיות נקרא מה-DOM, כך שאותו סקריפט משמש גם כקובץ משותף במצב split.
+        // במצב split בכל דף יש שקופית אחת (data-slide), ודף האינדקס אינו מציג שקופית
+        const slidesContainer = document.getElementById('slides-container');
+        const splitMode = 'slideBase' in slidesContainer.dataset;
+        const pageSlide = Number(slidesContainer.dataset.slide) || 0;
+        const totalSlides = Number(slidesContainer.dataset.totalSlides) || document.querySelectorAll('.slide').length;
+        let currentSlide = splitMode ? pageSlide : 1;
+        
+        // טעינת העדפות משתמש
+        document.addEventListener('DOMContentLoaded', () => {
+            loadUserPreferences();
+            initVirtualTables(document);
+            if (currentSlide) showSlide(currentSlide);
+            createThumbnails();
+        });
+
+        function slideUrl(n) {
+            return `${slidesContainer.dataset.slideBase}slide-${String(n).padStart(3, '0')}.html`;
+        }
+
+        function showSlide(n) {
+            if (n > totalSlides) n = 1;
+            if (n < 1) n = totalSlides;
+
+            // במצב split מעבר לשקופית אחרת הוא מעבר לדף שלה
+            if (splitMode && n !== pageSlide) {
+                window.location.href = slideUrl(n);
+                return;
+            }
+
+            const slides = document.querySelectorAll('.slide');
+            const thumbnails = document.querySelectorAll('.thumbnail');
+            
+            currentSlide = n;
+            
+            slides.forEach(slide => slide.classList.remove('active'));
+            thumbnails.forEach(thumb => thumb.classList.remove('active'));
+            
+            loadSlide(currentSlide);
+            const activeSlide = document.getElementById(`slide-${currentSlide}`);
+            activeSlide.classList.add('active');
+            // השקופית גלויה עכשיו - הטבלאות הווירטואליות שבה יודעות את גובהן
+            initVirtualTables(activeSlide);
+            if (thumbnails[currentSlide - 1]) {
+                thumbnails[currentSlide - 1].classList.add('active');
+                thumbnails[currentSlide - 1].scrollIntoView({ behavior: 'smooth', block: 'nearest' });
+            }
+
+            // טעינה מוקדמת של השקופיות השכנות (במצב lazy)
+            for (let offset = -1; offset <= 2; offset++) {
+                loadSlide((currentSlide + offset - 1 + totalSlides) % totalSlides + 1);
+            }
+        }
+
+        // טעינת שקופיות לפי דרישה - שקופית עם data-src נטענת מקובץ סקריפט נפרד
+        const loadingSlides = {};
+
+        function loadSlide(n) {
+            const slide = document.getElementById(`slide-${n}`);
+            if (!slide || !slide.dataset.src || loadingSlides[n]) return;
+
+            loadingSlides[n] = true;
+            const script = document.createElement('script');
+            script.src = slide.dataset.src;
+            script.onerror = () => { delete loadingSlides[n]; };
+            document.head.appendChild(script);
+        }
+
+        function pptx2htmlSlide(n, content) {
+            const slide = document.getElementById(`slide-${n}`);
+            if (!slide || !slide.dataset.src) return;
+
+            slide.innerHTML = content;
+            slide.removeAttribute('data-src');
+            delete loadingSlides[n];
+            initVirtualTables(slide);
+        }
+
+        // טבלאות וירטואליות: נתוני הטבלה נשמרים כ-JSON, ורק השורות הנראות (ועוד
+        // מעט מסביבן) נבנות ב-DOM. לפני הדפסה נבנות כל השורות
+        const VIRTUAL_ROW_HEIGHT = 24;
+        const VIRTUAL_OVERSCAN = 10;
+        // קודי היישור של הפסקאות בנתוני הטבלה ('-' - ללא יישור)
+        const VIRTUAL_ALIGN = { l: 'left', c: 'center', r: 'right', j: 'justify', d: 'justify' };
+        let printingTables = false;
+
+        function initVirtualTables(root) {
+            root.querySelectorAll('.virtual-table').forEach(container => {
+                if (!container.virtualTable) {
+                    const { styles, rows } = JSON.parse(container.querySelector('.table-data').textContent);
+                    // offsets[i] - המרחק של שורה i מראש הטבלה; anchors[i] - השורה הראשונה
+                    // שתא ממוזג (rowspan) ממנה מגיע עד שורה i
+                    const offsets = [0];
+                    const anchors = rows.map((row, i) => i);
+                    rows.forEach(([height, cells], i) => {
+                        offsets.push(offsets[i] + (height || VIRTUAL_ROW_HEIGHT));
+                        cells.forEach(cell => {
+                            const rowspan = Array.isArray(cell) ? cell[4] || 1 : 1;
+                            for (let r = i + 1; r < Math.min(i + rowspan, rows.length); r++) {
+                                anchors[r] = Math.min(anchors[r], i);
+                            }
+                        });
+                    });
+                    container.virtualTable = {
+                        styles, rows, offsets, anchors,
+                        tbody: container.querySelector('tbody'),
+                        start: -1,
+                        end: -1
+                    };
+
+                    let pending = false;
+                    container.addEventListener('scroll', () => {
+                        if (pending) return;
+                        pending = true;
+                        requestAnimationFrame(() => {
+                            pending = false;
+                            renderVirtualTable(container);
+                        });
+                    }, { passive: true });
+                }
+                renderVirtualTable(container);
+            });
+        }
+
+        function findRow(offsets, y) {
+            // חיפוש בינארי: השורה האחרונה שמתחילה לפני y
+            let low = 0;
+            let high = offsets.length - 2;
+            while (low < high) {
+                const middle = (low + high + 1) >> 1;
+                if (offsets[middle] <= y) low = middle;
+                else high = middle - 1;
+            }
+            return low;
+        }
+
+        function renderVirtualTable(container) {
+            const table = container.virtualTable;
+            const { styles, rows, offsets, anchors } = table;
+            let start = 0;
+            let end = rows.length;
+
+            if (!printingTables) {
+                const top = container.scrollTop;
+                const height = container.clientHeight || parseFloat(container.style.height) || 0;
+                start = Math.max(findRow(offsets, top) - VIRTUAL_OVERSCAN, 0);
+                end = Math.min(findRow(offsets, top + height) + VIRTUAL_OVERSCAN + 1, rows.length);
+                // תא ממוזג נבנה רק יחד עם השורה שבה הוא מתחיל
+                while (anchors[start] < start) start = anchors[start];
+                for (let i = start; i < end; i++) {
+                    rows[i][1].forEach(cell => {
+                        if (Array.isArray(cell)) end = Math.min(Math.max(end, i + (cell[4] || 1)), rows.length);
+                    });
+                }
+            }
+            if (start === table.start && end === table.end) return;
+            table.start = start;
+            table.end = end;
+
+            const html = [];
+            if (offsets[start] > 0) {
+                html.push(`<tr aria-hidden="true" style="height: ${offsets[start]}px"></tr>`);
+                // שורה ריקה נוספת שומרת על הזוגיות של השורות (tr:nth-child)
+                if (start % 2 === 0) html.push('<tr aria-hidden="true"></tr>');
+            }
+            for (let i = start; i < end; i++) {
+                const [height, cells] = rows[i];
+                const rowStyle = height ? ` style="height: ${height}px"` : '';
+                html.push(`<tr aria-rowindex="${i + 1}"${rowStyle}>`);
+                cells.forEach(cell => {
+                    const [text, align = '', style = 0, colspan = 1, rowspan = 1] = Array.isArray(cell) ? cell : [cell];
+                    let attributes = colspan > 1 ? ` colspan="${colspan}"` : '';
+                    if (rowspan > 1) attributes += ` rowspan="${rowspan}"`;
+                    if (styles[style]) attributes += ` style="${styles[style]}"`;
+                    html.push(`<td${attributes}>`);
+                    // הטקסט כבר מוסלש - רק עוטפים כל פסקה ב-<p>
+                    const paragraphs = text === null ? [] : Array.isArray(text) ? text : [text];
+                    paragraphs.forEach((paragraph, p) => {
+                        const textAlign = VIRTUAL_ALIGN[align[p]];
+                        const paragraphStyle = textAlign ? `margin: 0; text-align: ${textAlign}` : 'margin: 0';
+                        html.push(`<p style="${paragraphStyle}">${paragraph}</p>`);
+                    });
+                    html.push('</td>');
+                });
+                html.push('</tr>');
+            }
+            const rest = offsets[rows.length] - offsets[end];
+            if (rest > 0) {
+                html.push(`<tr aria-hidden="true" style="height: ${rest}px"></tr>`);
+            }
+            table.tbody.innerHTML = html.join('');
+        }
+
+        function renderAllVirtualTables(printing) {
+            printingTables = printing;
+            document.querySelectorAll('.virtual-table').forEach(container => {
+                if (container.virtualTable) renderVirtualTable(container);
+            });
+        }
+
+        window.addEventListener('beforeprint', () => renderAllVirtualTables(true));
+        window.addEventListener('afterprint', () => renderAllVirtualTables(false));
+
+        function nextSlide() {
+            showSlide(currentSlide + 1);
+        }
+
+        function previousSlide() {
+            showSlide(currentSlide - 1);
+        }
+
+        function createThumbnails() {
+            const thumbnailsPanel = document.getElementById('thumbnails-panel');
+            
+            for (let index = 0; index < totalSlides; index++) {
+                const thumbnail = document.createElement('div');
+                thumbnail.className = 'thumbnail';
+                thumbnail.onclick = () => showSlide(index + 1);
+                thumbnail.style.backgroundImage = `url('data:image/svg+xml,<svg xmlns="http://www.w3.org/2000/svg" width="100" height="75"><rect width="100%" height="100%" fill="%23f0f0f0"/><text x="50%" y="50%" dominant-baseline="middle" text-anchor="middle" font-family="system-ui" font-size="20" fill="%23666">${index + 1}</text></svg>')`;
+                thumbnailsPanel.appendChild(thumbnail);
+            }
+        }
+
+        function toggleThumbnails() {
+            const panel = document.getElementById('thumbnails-panel');
+            panel.style.display = panel.style.display === 'none' ? 'block' : 'none';
+        }
+
+        function toggleFullscreen() {
+            if (!document.fullscreenElement) {
+                document.documentElement.requestFullscreen();
+            } else {
+                document.exitFullscreen();
+            }
+        }
+
+        function toggleSettings() {
+            const panel = document.getElementById('settings-panel');
+            panel.style.display = panel.style.display === 'none' ? 'block' : 'none';
+        }
+
+        function toggleTheme() {
+            const isDark = document.getElementById('dark-mode').checked;
+            document.documentElement.setAttribute('data-theme', isDark ? 'dark' : 'light');
+            localStorage.setItem('theme', isDark ? 'dark' : 'light');
+        }
+
+        function changeFontSize() {
+            const size = document.getElementById('font-size').value;
+            const sizes = {
+                small: '14px',
+                medium: '16px',
+                large: '18px'
+            };
+            document.body.style.fontSize = sizes[size];
+            localStorage.setItem('fontSize', size);
+        }
+
+        function loadUserPreferences() {
+            // טעינת ערכת נושא
+            const theme = localStorage.getItem('theme') || 'light';
+            document.getElementById('dark-mode').checked = theme === 'dark';
+            document.documentElement.setAttribute('data-theme', theme);
+
+            // טעינת גודל טקסט
+            const fontSize = localStorage.getItem('fontSize') || 'medium';
+            document.getElementById('font-size').value = fontSize;
+            changeFontSize();
+        }
+
+        // תמיכה בניווט מקלדת
+        document.addEventListener('keydown', (e) => {
+            if (e.key === 'ArrowRight') previousSlide();
+            else if (e.key === 'ArrowLeft') nextSlide();
+            else if (e.key === 'f') toggleFullscreen();
+        });
+
+        // תמיכה במחוות מגע
+        let touchStartX = 0;
+        document.addEventListener('touchstart', e => {
+            touchStartX = e.touches[0].clientX;
+        });
+
+        document.addEventListener('touchend', e => {
+            const touchEndX = e.changedTouches[0].clientX;
+            const diff = touchStartX - touchEndX;
+            
+            if (Math.abs(diff) > 50) {
+                if (diff > 0) nextSlide();
+                else previousSlide();
+            }
+        });
+
+        function exportToWix() {
+            const panel = document.getElementById('export-panel');
+            const textarea = document.getElementById('embed-code');
+            const currentUrl = window.location.href;
+            
+            const embedCode = `
+<!-- קוד להטמעת המצגת -->
+<div class="presentation-container" style="position: relative; width: 100%;">
+    <iframe 
+        src="${currentUrl}"
+        style="width: 100%; height: 600px; border: none; overflow: hidden;"
+        allowfullscreen="true"
+        loading="lazy"
+    ></iframe>
+</div>
+
+<!-- סקריפט להתאמה אוטומטית של גובה -->
+<script>
+window.addEventListener('message', function(e) {
+    if (e.data && e.data.type === 'resize') {
+        const iframe = document.querySelector('.presentation-container iframe');
+        if (iframe) {
+            iframe.style.height = e.data.height + 'px';
+        }
+    }
+});
+<\/script>`;
+            
+            textarea.value = embedCode;
+            panel.style.display = 'block';
+        }
+
+        function closeExportPanel() {
+            document.getElementById('export-panel').style.display = 'none';
+        }
+
+        function copyEmbedCode() {
+            const textarea = document.getElementById('embed-code');
+            textarea.select();
+            document.execCommand('copy');
+            alert('הקוד הועתק ללוח!');
+        }
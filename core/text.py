@@ -0,0 +1,194 @@
+"""
+קריאת מסגרות טקסט ישירות מה-XML של הצורה (p:txBody / a:p / a:r / a:rPr),
+ללא אובייקטי הביניים של python-pptx. הערכים המוחזרים זהים לאלה של
+paragraph.alignment, run.font.size וכו', כך ששני המסלולים מפיקים אותו HTML.
+"""
+# מרחבי השמות של PresentationML ו-DrawingML, בצורת {uri} של lxml - בלי לייבא את
+# pptx.oxml, שרושם את כל מחלקות האלמנטים
+_NS = {
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+}
+
+
+def qn(tag):
+    """'a:p' -> '{http://...}p'"""
+    prefix, name = tag.split(':')
+    return f"{{{_NS[prefix]}}}{name}"
+
+_TX_BODY = qn('p:txBody')
+_P = qn('a:p')
+_R = qn('a:r')
+_BR = qn('a:br')
+_FLD = qn('a:fld')
+_T = qn('a:t')
+_P_PR = qn('a:pPr')
+_R_PR = qn('a:rPr')
+_LN_SPC = qn('a:lnSpc')
+_SPC_BEF = qn('a:spcBef')
+_SPC_AFT = qn('a:spcAft')
+_SPC_PCT = qn('a:spcPct')
+_SPC_PTS = qn('a:spcPts')
+_LATIN = qn('a:latin')
+_SOLID_FILL = qn('a:solidFill')
+_SRGB_CLR = qn('a:srgbClr')
+
+# ערכי algn ב-XML -> ערכי PP_ALIGN
+_ALIGNMENTS = {'l': 1, 'ctr': 2, 'r': 3, 'just': 4, 'dist': 5, 'thaiDist': 6, 'justLow': 7}
+
+# יישור טקסט לפי ערך PP_ALIGN
+_TEXT_ALIGN = {
+    0: 'right',  # RIGHT
+    1: 'left',   # LEFT
+    2: 'center', # CENTER
+    3: 'justify' # JUSTIFY
+}
+
+# EMU בנקודה אחת ובמאית נקודה
+_EMU_PER_PT = 12700
+_EMU_PER_CENTIPOINT = 127
+
+
+def paragraph_style(alignment, line_spacing, space_before, space_after):
+    """
+    מחזיר את הסגנון של פסקה
+
+    Args:
+        alignment (int): ערך PP_ALIGN, או None
+        line_spacing: מספר שורות (float) או מרווח קבוע ב-EMU (int), או None
+        space_before (float): מרווח לפני הפסקה בנקודות, או None
+        space_after (float): מרווח אחרי הפסקה בנקודות, או None
+    """
+    styles = [f"text-align: {_TEXT_ALIGN.get(alignment, 'right')}"]
+    if line_spacing:
+        styles.append(f"line-height: {line_spacing}")
+    if space_before:
+        styles.append(f"margin-top: {space_before}pt")
+    if space_after:
+        styles.append(f"margin-bottom: {space_after}pt")
+    return '; '.join(styles)
+
+
+def run_style(name, size, rgb, bold, italic, underline):
+    """
+    מחזיר את הסגנון של קטע טקסט
+
+    Args:
+        name (str): שם הגופן, או None
+        size (float): גודל בנקודות, או None
+        rgb (tuple): צבע (אדום, ירוק, כחול), או None
+        bold, italic, underline: ערכי אמת של העיצוב
+    """
+    styles = []
+    if name:
+        styles.append(f"font-family: '{name}'")
+    if size:
+        styles.append(f"font-size: {size}pt")
+    if rgb:
+        styles.append(f"color: rgb({rgb[0]}, {rgb[1]}, {rgb[2]})")
+    if bold:
+        styles.append("font-weight: bold")
+    if italic:
+        styles.append("font-style: italic")
+    if underline:
+        styles.append("text-decoration: underline")
+    return '; '.join(styles)
+
+
+def text_body(element):
+    """מחזיר את אלמנט p:txBody של הצורה, או None"""
+    return element.find(_TX_BODY)
+
+
+def paragraphs(tx_body):
+    """אלמנטי a:p של מסגרת הטקסט"""
+    return tx_body.iterfind(_P)
+
+
+def paragraph_text(p):
+    """הטקסט של פסקה - כמו paragraph.text (שבירת שורה כ-\\v)"""
+    parts = []
+    for child in p:
+        tag = child.tag
+        if tag == _R or tag == _FLD:
+            parts.append(child.findtext(_T) or '')
+        elif tag == _BR:
+            parts.append('\v')
+    return ''.join(parts)
+
+
+def runs(p):
+    """זוגות (טקסט, a:rPr) לכל a:r בפסקה"""
+    for r in p.iterfind(_R):
+        yield r.findtext(_T) or '', r.find(_R_PR)
+
+
+def _bool(value):
+    """ערך xsd:boolean"""
+    return value in ('1', 'true')
+
+
+def _spacing_pt(p_pr, tag):
+    """spcBef / spcAft בנקודות - רק מרווח קבוע (spcPts)"""
+    spacing = p_pr.find(tag)
+    if spacing is None:
+        return None
+    points = spacing.find(_SPC_PTS)
+    if points is None:
+        return None
+    return int(points.get('val')) * _EMU_PER_CENTIPOINT / float(_EMU_PER_PT)
+
+
+def _line_spacing(p_pr):
+    """lnSpc כמו paragraph.line_spacing: מספר שורות, או EMU למרווח קבוע"""
+    ln_spc = p_pr.find(_LN_SPC)
+    if ln_spc is None:
+        return None
+    points = ln_spc.find(_SPC_PTS)
+    if points is not None:
+        return int(points.get('val')) * _EMU_PER_CENTIPOINT
+    percent = ln_spc.find(_SPC_PCT)
+    if percent is None:
+        return None
+    value = percent.get('val')
+    if value.endswith('%'):
+        return float(value[:-1]) / 100.0
+    return int(value) / 100000.0
+
+
+def get_paragraph_style(p):
+    """הסגנון של פסקה לפי a:pPr"""
+    p_pr = p.find(_P_PR)
+    if p_pr is None:
+        return paragraph_style(None, None, None, None)
+    return paragraph_style(
+        _ALIGNMENTS.get(p_pr.get('algn')),
+        _line_spacing(p_pr),
+        _spacing_pt(p_pr, _SPC_BEF),
+        _spacing_pt(p_pr, _SPC_AFT),
+    )
+
+
+def get_run_style(r_pr):
+    """הסגנון של קטע טקסט לפי a:rPr"""
+    if r_pr is None:
+        return ''
+
+    latin = r_pr.find(_LATIN)
+    size = r_pr.get('sz')
+    rgb = None
+    fill = r_pr.find(_SOLID_FILL)
+    if fill is not None:
+        color = fill.find(_SRGB_CLR)
+        if color is not None:
+            value = color.get('val')
+            rgb = (int(value[0:2], 16), int(value[2:4], 16), int(value[4:6], 16))
+
+    return run_style(
+        None if latin is None else latin.get('typeface'),
+        None if size is None else int(size) * _EMU_PER_CENTIPOINT / float(_EMU_PER_PT),
+        rgb,
+        _bool(r_pr.get('b')),
+        _bool(r_pr.get('i')),
+        r_pr.get('u') not in (None, 'none'),
+    )
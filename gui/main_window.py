@@ -1,6 +1,9 @@
-from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, 
+import os
+
+from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                                QPushButton, QFileDialog, QProgressBar, QLabel, QTextEdit)
 from PyQt6.QtCore import Qt
+from core import events
 from core.converter import PowerPointConverter
 
 class MainWindow(QMainWindow):
@@ -12,8 +15,9 @@ class MainWindow(QMainWindow):
         # מרכיבי הממשק
         self.setup_ui()
         
-        # אתחול הממיר
+        # אתחול הממיר - דף עצמאי אחד; גרסת ההטמעה נכתבת רק בייצוא
         self.converter = PowerPointConverter()
+        self.output_path = None
         
     def setup_ui(self):
         # יצירת ווידג'ט מרכזי
@@ -73,12 +77,13 @@ class MainWindow(QMainWindow):
         if not self.file_label.text() or self.file_label.text() == "לא נבחר קובץ":
             return
             
+        self.progress_bar.setValue(0)
         self.progress_bar.setVisible(True)
         self.convert_btn.setEnabled(False)
         
-        # כאן נוסיף את הלוגיקה של ההמרה
         try:
-            output_path = self.converter.convert(self.file_label.text())
+            output_path = self.converter.convert(self.file_label.text(), observer=self.on_conversion_event)
+            self.output_path = output_path
             self.show_success_message(output_path)
             self.embed_btn.setEnabled(True)
         except Exception as e:
@@ -87,27 +92,45 @@ class MainWindow(QMainWindow):
             self.progress_bar.setVisible(False)
             self.convert_btn.setEnabled(True)
             
+    def on_conversion_event(self, event):
+        """מעדכן את סרגל ההתקדמות לפי אירועי ההמרה"""
+        if event['event'] == events.DECK_OPENED:
+            self.progress_bar.setMaximum(max(event['slide_count'], 1))
+        elif event['event'] == events.SLIDE_FINISHED:
+            self.progress_bar.setValue(event['index'] + 1)
+        else:
+            return
+        # ההמרה רצה בתהליכון הממשק - מאפשרים לחלון להתעדכן בין השקופיות
+        QApplication.processEvents()
+            
     def generate_embed_code(self):
-        if not self.file_label.text() or self.file_label.text() == "לא נבחר קובץ":
+        if not self.output_path:
             return
             
         try:
-            # יצירת קוד ההטמעה
-            embed_code_path, embed_path = self.converter.generate_embed_code(
-                self.file_label.text(),
+            # המרה מחדש במצב embed - הדף וגרסת ההטמעה נכתבים יחד, עם נכסים ושקופיות
+            # משותפים בקבצים שלצדם
+            embed_converter = PowerPointConverter(embed=True)
+            embed_converter.convert(self.file_label.text(), self.output_path,
+                                    observer=self.on_conversion_event)
+            embed_code_path, embed_path = embed_converter.generate_embed_code(
+                self.output_path,
                 width="100%",
                 height="600px",
                 responsive=True
             )
             
+            slides_dir = os.path.splitext(os.path.basename(self.output_path))[0] + "_slides"
+
             # הצגת קוד ההטמעה
-            with open(embed_code_path, 'r') as file:
+            with open(embed_code_path, 'r', encoding='utf-8') as file:
                 embed_code = file.read()
                 self.embed_code_area.setText(embed_code)
                 
             # הצגת הודעת הצלחה עם הוראות
             self.show_success_message("קוד ההטמעה נוצר בהצלחה!\n"
-                                      "1. העלה את הקובץ " + os.path.basename(embed_path) + " לשרת\n"
+                                      "1. העלה את הקובץ " + os.path.basename(embed_path) + " לשרת, יחד עם "
+                                      "התיקיות שלצדו (assets ו-" + slides_dir + ")\n"
                                       "2. העתק את קוד ההטמעה מהקובץ " + os.path.basename(embed_code_path) + "\n"
                                       "3. הדבק את הקוד באתר Wix שלך")
             
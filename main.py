@@ -1,21 +1,30 @@
-import flet as ft
+from __future__ import annotations
+
 from pathlib import Path
-from core.converter import PowerPointConverter
+from concurrent.futures import ThreadPoolExecutor
+from core import events
+from core.converter import ConversionCancelled, PowerPointConverter
 import os
+import threading
 import webbrowser
 import logging
 
-# הגדרת הלוגר
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),  # הדפסה לטרמינל
-        logging.FileHandler('app.log')  # שמירה לקובץ
-    ]
-)
+# flet והגדרת הלוגר נטענים רק ב-main(): תהליכי עבודה שמייבאים את המודול הזה
+# מחדש (למשל מאגר תהליכים ב-spawn) אינם טוענים את הממשק ואינם פותחים את app.log
 logger = logging.getLogger(__name__)
 
+
+def setup_logging():
+    """הגדרת הלוגר של האפליקציה"""
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.StreamHandler(),  # הדפסה לטרמינל
+            logging.FileHandler('app.log')  # שמירה לקובץ
+        ]
+    )
+
 class PowerPointToHtmlApp:
     def __init__(self):
         logger.info("מאתחל את האפליקציה")
@@ -24,9 +33,16 @@ class PowerPointToHtmlApp:
         self.output_dir = None
         self.last_output_file = None
         self.page = None
+        # ההמרות רצות ברקע אחת אחרי השנייה - הממשק נשאר זמין ואפשר להוסיף המרות לתור
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='convert')
+        self.jobs_lock = threading.Lock()
+        self.queued_jobs = 0
+        self.current_cancel = None
 
     def main(self, page: ft.Page):
         """הפונקציה הראשית של האפליקציה"""
+        import flet as ft
+
         logger.info("מאתחל את הממשק הגרפי")
         try:
             # שמירת אובייקט הדף
@@ -97,6 +113,14 @@ class PowerPointToHtmlApp:
                 disabled=True
             )
             
+            # כפתור ביטול ההמרה הנוכחית
+            self.cancel_button = ft.ElevatedButton(
+                "בטל",
+                icon=ft.Icons.CANCEL,
+                on_click=self.cancel_conversion,
+                disabled=True
+            )
+            
             # כפתור תצוגה מקדימה
             self.preview_button = ft.ElevatedButton(
                 "תצוגה מקדימה",
@@ -160,6 +184,13 @@ class PowerPointToHtmlApp:
                 italic=True
             )
             
+            # סרגל התקדמות ההמרה
+            self.progress_bar = ft.ProgressBar(
+                width=400,
+                value=0,
+                visible=False
+            )
+            
             logger.debug("יוצר את המיכל הראשי")
             # מיכל ראשי
             container = ft.Container(
@@ -175,11 +206,13 @@ class PowerPointToHtmlApp:
                                 self.select_file_button,
                                 self.select_dir_button,
                                 self.convert_button,
+                                self.cancel_button,
                                 self.preview_button,
                                 self.export_log_button
                             ],
                             alignment=ft.MainAxisAlignment.CENTER
                         ),
+                        self.progress_bar,
                         self.status_text
                     ],
                     horizontal_alignment=ft.CrossAxisAlignment.CENTER
@@ -251,7 +284,7 @@ class PowerPointToHtmlApp:
             logger.error(f"שגיאה בעדכון כפתור המרה: {str(e)}", exc_info=True)
 
     def convert_file(self, e):
-        """ממיר את קובץ ה-PowerPoint ל-HTML"""
+        """מוסיף את קובץ ה-PowerPoint לתור ההמרות - ההמרה עצמה רצה ברקע"""
         try:
             if not self.current_file or not os.path.exists(self.current_file):
                 logger.error("לא נבחר קובץ PowerPoint להמרה")
@@ -268,25 +301,86 @@ class PowerPointToHtmlApp:
             output_filename = f"{input_filename}.html"
             output_path = os.path.join(self.output_dir, output_filename)
 
-            # המרת המצגת
-            logger.info(f"מתחיל המרה של {self.current_file} ל-{output_path}")
-            self.converter.convert(self.current_file, output_path)
-            
-            # עדכון הנתיב האחרון
-            self.last_output_file = output_path
-            
-            # הפעלת כפתור התצוגה המקדימה
-            if hasattr(self, 'preview_button'):
-                self.preview_button.disabled = False
+            with self.jobs_lock:
+                self.queued_jobs += 1
+                waiting = self.queued_jobs - 1
+            logger.info(f"מוסיף לתור המרה של {self.current_file} ל-{output_path}")
+            if waiting:
+                self.status_text.value = f"{Path(self.current_file).name} נוסף לתור ({waiting} ממתינות לפניו)"
                 self.page.update()
+            self.executor.submit(self.run_conversion, self.current_file, output_path, threading.Event())
+
+        except Exception as ex:
+            logger.error(f"שגיאה בהמרת הקובץ: {str(ex)}")
+            self.show_error_dialog("שגיאה", f"שגיאה בהמרת הקובץ: {str(ex)}")
+
+    def run_conversion(self, pptx_path, output_path, cancel):
+        """רץ בתהליכון הרקע: ממיר מצגת אחת ומעדכן את ההתקדמות בממשק"""
+        name = Path(pptx_path).name
+        self.current_cancel = cancel
+        self.cancel_button.disabled = False
+        self.update_progress(name, 0, None)
+
+        def observer(event):
+            if event['event'] == events.DECK_OPENED:
+                self.update_progress(name, 0, event['slide_count'])
+            elif event['event'] == events.SLIDE_FINISHED:
+                self.update_progress(name, event['index'] + 1, event['total'])
+
+        try:
+            logger.info(f"מתחיל המרה של {pptx_path} ל-{output_path}")
+            self.converter.convert(pptx_path, output_path, observer=observer, cancel=cancel)
+
+            # עדכון הנתיב האחרון והפעלת כפתור התצוגה המקדימה
+            self.last_output_file = output_path
+            self.preview_button.disabled = False
+            self.status_text.value = f"{name} הומר בהצלחה"
 
             logger.info("ההמרה הושלמה בהצלחה")
             self.show_success_dialog("הצלחה", "המצגת הומרה בהצלחה ל-HTML")
 
+        except ConversionCancelled:
+            logger.info(f"ההמרה של {pptx_path} בוטלה")
+            self.status_text.value = f"ההמרה של {name} בוטלה"
+
         except Exception as ex:
             logger.error(f"שגיאה בהמרת הקובץ: {str(ex)}")
+            self.status_text.value = ""
             self.show_error_dialog("שגיאה", f"שגיאה בהמרת הקובץ: {str(ex)}")
 
+        finally:
+            with self.jobs_lock:
+                self.queued_jobs -= 1
+                idle = self.queued_jobs == 0
+            self.current_cancel = None
+            self.cancel_button.disabled = True
+            self.progress_bar.visible = not idle
+            self.page.update()
+
+    def update_progress(self, name, done, total):
+        """מעדכן את סרגל ההתקדמות ואת טקסט הסטטוס (נקרא מתהליכון הרקע)"""
+        with self.jobs_lock:
+            waiting = self.queued_jobs - 1
+        # None = התקדמות לא ידועה (טעינת המצגת) - הסרגל מונפש
+        self.progress_bar.value = done / total if total else None
+        self.progress_bar.visible = True
+        status = f"ממיר את {name}"
+        if total:
+            status += f": שקופית {done} מתוך {total}"
+        if waiting:
+            status += f" ({waiting} ממתינות בתור)"
+        self.status_text.value = status
+        self.page.update()
+
+    def cancel_conversion(self, e):
+        """מבקש לעצור את ההמרה הנוכחית - היא נעצרת לפני השקופית הבאה"""
+        if self.current_cancel is not None:
+            logger.info("מבטל את ההמרה הנוכחית")
+            self.current_cancel.set()
+            self.cancel_button.disabled = True
+            self.status_text.value = "מבטל..."
+            self.page.update()
+
     def preview_html(self, e):
         """פותח את קובץ ה-HTML בדפדפן"""
         try:
@@ -307,6 +401,8 @@ class PowerPointToHtmlApp:
 
     def export_error_log(self, e):
         """ייצוא קובץ הלוג"""
+        import flet as ft
+
         try:
             save_path = ft.FilePicker(
                 dialog_title="שמור קובץ לוג",
@@ -336,6 +432,8 @@ class PowerPointToHtmlApp:
 
     def show_error_dialog(self, title, message):
         """מציג דיאלוג שגיאה"""
+        import flet as ft
+
         try:
             if not self.page:
                 logger.error("אין אובייקט page זמין")
@@ -362,6 +460,8 @@ class PowerPointToHtmlApp:
 
     def show_success_dialog(self, title, message):
         """מציג דיאלוג הצלחה"""
+        import flet as ft
+
         try:
             if not self.page:
                 logger.error("אין אובייקט page זמין")
@@ -388,6 +488,8 @@ class PowerPointToHtmlApp:
 
     def show_message(self, title, message):
         """מציג הודעה"""
+        import flet as ft
+
         try:
             if not self.page:
                 logger.error("אין אובייקט page זמין")
@@ -413,6 +515,9 @@ class PowerPointToHtmlApp:
             logger.error(f"שגיאה בהצגת הודעה: {str(ex)}")
 
 def main():
+    import flet as ft
+
+    setup_logging()
     logger.info("מתחיל את האפליקציה")
     try:
         app = PowerPointToHtmlApp()